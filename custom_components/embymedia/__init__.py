@@ -20,8 +20,9 @@ YAML Configuration Example:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
 import voluptuous as vol
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL
@@ -42,10 +43,12 @@ from .const import (
     CONF_IGNORED_DEVICES,
     CONF_MAX_AUDIO_BITRATE,
     CONF_MAX_VIDEO_BITRATE,
+    CONF_REQUEST_BUDGET,
     CONF_SCAN_INTERVAL,
     CONF_USER_ID,
     CONF_VERIFY_SSL,
     CONF_VIDEO_CONTAINER,
+    CONF_WATCH_TIME_RETENTION_DAYS,
     DEFAULT_DIRECT_PLAY,
     DEFAULT_DISCOVERY_SCAN_INTERVAL,
     DEFAULT_ENABLE_DISCOVERY_SENSORS,
@@ -53,15 +56,18 @@ from .const import (
     DEFAULT_IGNORE_WEB_PLAYERS,
     DEFAULT_LIBRARY_SCAN_INTERVAL,
     DEFAULT_PORT,
+    DEFAULT_REQUEST_BUDGET,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SERVER_SCAN_INTERVAL,
     DEFAULT_SSL,
     DEFAULT_VERIFY_SSL,
     DEFAULT_VIDEO_CONTAINER,
+    DEFAULT_WATCH_TIME_RETENTION_DAYS,
     DOMAIN,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
     PLATFORMS,
+    SNAPSHOT_REFRESH_SPACING,
     VIDEO_CONTAINERS,
     EmbyConfigEntry,
     EmbyRuntimeData,
@@ -69,6 +75,7 @@ from .const import (
 from .coordinator import EmbyDataUpdateCoordinator
 from .coordinator_discovery import EmbyDiscoveryCoordinator
 from .coordinator_sensors import EmbyLibraryCoordinator, EmbyServerCoordinator
+from .discovery_scheduler import DiscoveryScheduler
 from .exceptions import (
     EmbyAuthenticationError,
     EmbyConnectionError,
@@ -76,10 +83,16 @@ from .exceptions import (
     EmbyWebSocketError,
 )
 from .image_proxy import async_setup_image_proxy
+from .metrics import StartupTimeline
+from .refresh_planner import RefreshPlanner
 from .services import async_setup_services, async_unload_services
+from .snapshot import CoordinatorSnapshotStore
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -173,6 +186,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool
         ConfigEntryAuthFailed: If authentication fails.
         ConfigEntryNotReady: If server is temporarily unavailable.
     """
+    timeline = StartupTimeline()
     session = async_get_clientsession(hass)
 
     client = EmbyClient(
@@ -185,8 +199,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool
     )
 
     try:
-        await client.async_validate_connection()
-        server_info = await client.async_get_server_info()
+        with timeline.measure("connect"):
+            await client.async_validate_connection()
+            server_info = await client.async_get_server_info()
     except EmbyAuthenticationError as err:
         raise ConfigEntryAuthFailed(
             f"Invalid API key for Emby server at {entry.data[CONF_HOST]}"
@@ -210,6 +225,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool
         scan_interval=scan_interval,
     )
 
+    # Restore today's watch-time statistics before any playback is tracked
+    with timeline.measure("watch_time_load"):
+        await session_coordinator.watch_time.async_load(
+            retention_days=entry.options.get(
+                CONF_WATCH_TIME_RETENTION_DAYS, DEFAULT_WATCH_TIME_RETENTION_DAYS
+            )
+        )
+
     # Create server coordinator (for server status sensors)
     server_coordinator = EmbyServerCoordinator(
         hass=hass,
@@ -229,63 +252,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool
         scan_interval=DEFAULT_LIBRARY_SCAN_INTERVAL,
     )
 
-    # Create discovery coordinators if enabled
-    # When a specific user is selected: create coordinator for that user only
-    # When admin context (no user_id): create coordinators for ALL users
-    discovery_coordinators: dict[str, EmbyDiscoveryCoordinator] = {}
-    user_id = entry.data.get(CONF_USER_ID) or entry.options.get(CONF_USER_ID)
-    enable_discovery = entry.options.get(
-        CONF_ENABLE_DISCOVERY_SENSORS, DEFAULT_ENABLE_DISCOVERY_SENSORS
-    )
     discovery_scan_interval = entry.options.get(
         CONF_DISCOVERY_SCAN_INTERVAL, DEFAULT_DISCOVERY_SCAN_INTERVAL
     )
 
-    if enable_discovery:
-        if user_id:
-            # Single user mode - create coordinator for selected user only
-            discovery_coordinators[str(user_id)] = EmbyDiscoveryCoordinator(
-                hass=hass,
-                client=client,
-                server_id=server_id,
-                config_entry=entry,
-                user_id=str(user_id),
-                scan_interval=discovery_scan_interval,
+    # Coordinators restored from a snapshot are available at once and are
+    # refreshed in the background once setup is done
+    snapshots = CoordinatorSnapshotStore(hass, server_id)
+    with timeline.measure("snapshot_load"):
+        await snapshots.async_load()
+    sensor_coordinators: dict[str, DataUpdateCoordinator[Any]] = {
+        "server": server_coordinator,
+        "library": library_coordinator,
+    }
+    restored = [
+        name
+        for name, coordinator in sensor_coordinators.items()
+        if snapshots.restore(name, coordinator)
+    ]
+
+    # Fetch initial data from all other coordinators at once; setup takes as
+    # long as the slowest refresh instead of the sum of them
+    discovery_coordinators, *_ = await _async_run_concurrently(
+        timeline.async_measure(
+            "discovery_users",
+            _async_create_discovery_coordinators(
+                hass, client, entry, server_id, discovery_scan_interval
+            ),
+        ),
+        timeline.async_measure(
+            "session_refresh", session_coordinator.async_config_entry_first_refresh()
+        ),
+        *(
+            timeline.async_measure(
+                f"{name}_refresh", coordinator.async_config_entry_first_refresh()
             )
-        else:
-            # Admin context - create coordinators for ALL users
-            try:
-                users = await client.async_get_users()
-                for user in users:
-                    uid = str(user.get("Id", ""))
-                    uname = str(user.get("Name", "Unknown"))
-                    if uid:
-                        discovery_coordinators[uid] = EmbyDiscoveryCoordinator(
-                            hass=hass,
-                            client=client,
-                            server_id=server_id,
-                            config_entry=entry,
-                            user_id=uid,
-                            scan_interval=discovery_scan_interval,
-                            user_name=uname,
-                        )
-                _LOGGER.debug(
-                    "Created discovery coordinators for %d users",
-                    len(discovery_coordinators),
-                )
-            except EmbyError as err:
-                _LOGGER.warning(
-                    "Failed to fetch users for discovery sensors: %s. "
-                    "Discovery sensors will not be available.",
-                    err,
-                )
-
-    # Fetch initial data from all coordinators
-    await session_coordinator.async_config_entry_first_refresh()
-    await server_coordinator.async_config_entry_first_refresh()
-    await library_coordinator.async_config_entry_first_refresh()
-    for coordinator in discovery_coordinators.values():
-        await coordinator.async_config_entry_first_refresh()
+            for name, coordinator in sensor_coordinators.items()
+            if name not in restored
+        ),
+    )
+    for discovery_user_id, discovery_coordinator in discovery_coordinators.items():
+        snapshots.restore(f"discovery_{discovery_user_id}", discovery_coordinator)
+    # Discovery refreshes are staggered across the interval instead of each
+    # coordinator polling on its own timer, and only users whose entities are
+    # in use are refreshed (first when their entities subscribe, after the
+    # platforms are set up)
+    discovery_scheduler = DiscoveryScheduler(
+        hass, entry, discovery_coordinators, discovery_scan_interval
+    )
+
+    refresh_planner = RefreshPlanner(
+        hass,
+        entry,
+        client.metrics,
+        budget=int(entry.options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET)),
+    )
 
     # Store runtime data with all coordinators
     entry.runtime_data = EmbyRuntimeData(
@@ -293,7 +314,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool
         server_coordinator=server_coordinator,
         library_coordinator=library_coordinator,
         discovery_coordinators=discovery_coordinators if discovery_coordinators else None,
+        discovery_scheduler=discovery_scheduler,
+        startup_timeline=timeline,
+        snapshots=snapshots,
+        refresh_planner=refresh_planner,
     )
+    discovery_scheduler.async_start()
 
     # Register server device BEFORE forwarding to platforms
     # This prevents the via_device warning where entities reference
@@ -319,11 +345,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool
     await async_setup_services(hass)
 
     # Forward setup to platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    with timeline.measure("platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Start WebSocket for real-time updates
     try:
-        await session_coordinator.async_setup_websocket(session)
+        with timeline.measure("websocket"):
+            await session_coordinator.async_setup_websocket(session)
     except (EmbyWebSocketError, OSError) as err:
         _LOGGER.warning(
             "Failed to set up WebSocket connection to Emby server %s: %s. "
@@ -335,16 +363,132 @@ async def async_setup_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool
     # Register cleanup callbacks
     entry.async_on_unload(entry.add_update_listener(async_options_updated))
     entry.async_on_unload(session_coordinator.async_shutdown_websocket)
+    entry.async_on_unload(session_coordinator.watch_time.async_flush)
+
+    snapshots.async_start(entry)
+    entry.async_on_unload(snapshots.async_flush)
+    # From here on the server, library and discovery refreshes are accounted
+    # for and, with a request budget, paced by the planner
+    refresh_planner.async_start()
+    for index, name in enumerate(restored):
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_restored(sensor_coordinators[name], index * SNAPSHOT_REFRESH_SPACING),
+            f"{DOMAIN} {name} refresh",
+        )
 
+    timeline.finish()
     _LOGGER.info(
         "Connected to Emby server: %s (version %s)",
         server_name,
         server_info.get("Version", "Unknown"),
     )
+    _LOGGER.debug("Setup of %s took %.0f ms", server_name, timeline.total_ms)
 
     return True
 
 
+async def _async_refresh_restored(coordinator: DataUpdateCoordinator[Any], delay: float) -> None:
+    """Refresh a coordinator restored from a snapshot.
+
+    Args:
+        coordinator: The restored coordinator.
+        delay: Seconds to wait first, to spread out the refreshes.
+    """
+    await asyncio.sleep(delay)
+    await coordinator.async_refresh()
+
+
+async def _async_run_concurrently(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+    """Run coroutines concurrently, cancelling the rest as soon as one fails.
+
+    A failed first refresh (e.g. ConfigEntryNotReady) abandons setup, so the
+    other refreshes must not keep running against the discarded coordinators.
+
+    Args:
+        *coros: Coroutines to run.
+
+    Returns:
+        Their results, in argument order.
+
+    Raises:
+        Exception: The first exception raised by one of the coroutines.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coro) for coro in coros]
+    except BaseExceptionGroup as err:
+        raise err.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+async def _async_create_discovery_coordinators(
+    hass: HomeAssistant,
+    client: EmbyClient,
+    entry: EmbyConfigEntry,
+    server_id: str,
+    scan_interval: int,
+) -> dict[str, EmbyDiscoveryCoordinator]:
+    """Create the discovery coordinators of a config entry, if enabled.
+
+    When a specific user is selected, only that user gets a coordinator. In
+    admin context (no user_id) every user of the server gets one.
+
+    Args:
+        hass: Home Assistant instance.
+        client: Emby API client.
+        entry: Config entry being set up.
+        server_id: The server ID.
+        scan_interval: Discovery refresh interval in seconds.
+
+    Returns:
+        User ID -> discovery coordinator; empty if discovery is disabled or
+        the users could not be fetched.
+    """
+    discovery_coordinators: dict[str, EmbyDiscoveryCoordinator] = {}
+    if not entry.options.get(CONF_ENABLE_DISCOVERY_SENSORS, DEFAULT_ENABLE_DISCOVERY_SENSORS):
+        return discovery_coordinators
+
+    user_id = entry.data.get(CONF_USER_ID) or entry.options.get(CONF_USER_ID)
+    if user_id:
+        # Single user mode - create coordinator for selected user only
+        discovery_coordinators[str(user_id)] = EmbyDiscoveryCoordinator(
+            hass=hass,
+            client=client,
+            server_id=server_id,
+            config_entry=entry,
+            user_id=str(user_id),
+            scan_interval=scan_interval,
+        )
+        return discovery_coordinators
+
+    # Admin context - create coordinators for ALL users
+    try:
+        users = await client.async_get_users()
+    except EmbyError as err:
+        _LOGGER.warning(
+            "Failed to fetch users for discovery sensors: %s. "
+            "Discovery sensors will not be available.",
+            err,
+        )
+        return discovery_coordinators
+    for user in users:
+        uid = str(user.get("Id", ""))
+        uname = str(user.get("Name", "Unknown"))
+        if uid:
+            discovery_coordinators[uid] = EmbyDiscoveryCoordinator(
+                hass=hass,
+                client=client,
+                server_id=server_id,
+                config_entry=entry,
+                user_id=uid,
+                scan_interval=scan_interval,
+                user_name=uname,
+            )
+    _LOGGER.debug("Created discovery coordinators for %d users", len(discovery_coordinators))
+    return discovery_coordinators
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: EmbyConfigEntry) -> bool:
     """Unload a config entry.
 
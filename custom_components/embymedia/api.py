@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Self, cast
+from urllib.parse import urlencode
 
 import aiohttp
 
@@ -30,6 +32,7 @@ from .const import (
 from .exceptions import (
     EmbyAuthenticationError,
     EmbyConnectionError,
+    EmbyError,
     EmbyNotFoundError,
     EmbyServerError,
     EmbySSLError,
@@ -38,6 +41,8 @@ from .exceptions import (
 from .metrics import MetricsCollector
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .const import (
         EmbyActivityLogResponse,
         EmbyBrowseItem,
@@ -73,6 +78,35 @@ _LOGGER = logging.getLogger(__name__)
 # Version for User-Agent header
 __version__ = "0.5.1"
 
+# Maximum item IDs per Ids= lookup (keeps request URLs to a few KB)
+ITEM_IDS_BATCH_SIZE = 100
+
+
+@dataclass(frozen=True, slots=True)
+class SessionQuery:
+    """Server-side filters for the /Sessions endpoint.
+
+    Attributes:
+        controllable_by_user_id: Only sessions this user can remote control.
+        active_within_seconds: Only sessions active within this many seconds.
+    """
+
+    controllable_by_user_id: str | None = None
+    active_within_seconds: int | None = None
+
+    def to_query_string(self) -> str:
+        """Build the query string for the configured filters.
+
+        Returns:
+            URL-encoded query string, empty if no filter is set.
+        """
+        params: dict[str, str | int] = {}
+        if self.controllable_by_user_id:
+            params["ControllableByUserId"] = self.controllable_by_user_id
+        if self.active_within_seconds:
+            params["ActiveWithinSeconds"] = self.active_within_seconds
+        return urlencode(params)
+
 
 class EmbyClient:
     """Async client for Emby API.
@@ -135,6 +169,8 @@ class EmbyClient:
         self._metrics = MetricsCollector()
         # Request coalescer for concurrent identical requests (#290)
         self._coalescer = RequestCoalescer()
+        # Cleared if the server rejects a filtered /Sessions query
+        self._session_filters_supported = True
 
     async def __aenter__(self) -> Self:
         """Enter async context manager."""
@@ -536,12 +572,23 @@ class EmbyClient:
         response = await self._request(HTTP_GET, ENDPOINT_USERS)
         return response  # type: ignore[return-value]
 
-    async def async_get_sessions(self) -> list[EmbySessionResponse]:
+    async def async_get_sessions(
+        self,
+        query: SessionQuery | None = None,
+    ) -> list[EmbySessionResponse]:
         """Get list of active sessions.
 
         Uses request coalescing to prevent duplicate concurrent requests
         when multiple entities refresh simultaneously.
 
+        If the server rejects the filtered query (HTTP 400 or 404), the
+        unfiltered endpoint is used instead and filters are not sent again;
+        other errors are raised and the filters are tried again next time. Callers must still apply
+        their own filtering, as older servers may also ignore the filters.
+
+        Args:
+            query: Optional server-side filters.
+
         Returns:
             List of session objects representing connected clients.
 
@@ -549,9 +596,43 @@ class EmbyClient:
             EmbyConnectionError: Connection failed.
             EmbyAuthenticationError: API key is invalid.
         """
-        response = await self._coalesced_request(HTTP_GET, ENDPOINT_SESSIONS)
+        query_string = query.to_query_string() if query is not None else ""
+        if not query_string or not self._session_filters_supported:
+            response = await self._coalesced_request(HTTP_GET, ENDPOINT_SESSIONS)
+            return response  # type: ignore[return-value]
+
+        try:
+            response = await self._coalesced_request(
+                HTTP_GET, f"{ENDPOINT_SESSIONS}?{query_string}"
+            )
+        except EmbyError as err:
+            if not self._is_rejected_request(err):
+                raise
+            # Only stop filtering once the unfiltered request works
+            response = await self._coalesced_request(HTTP_GET, ENDPOINT_SESSIONS)
+            self._session_filters_supported = False
+            _LOGGER.info(
+                "Emby server rejected filtered session query (%s), using unfiltered /Sessions",
+                err,
+            )
         return response  # type: ignore[return-value]
 
+    @staticmethod
+    def _is_rejected_request(err: EmbyError) -> bool:
+        """Check whether an error means the server rejected the request itself.
+
+        Args:
+            err: Error raised by _request.
+
+        Returns:
+            True for 400 Bad Request and 404 Not Found responses; server
+            errors (5xx) may be transient and are not treated as rejections.
+        """
+        if isinstance(err, EmbyNotFoundError):
+            return True
+        cause = err.__cause__
+        return isinstance(cause, aiohttp.ClientResponseError) and cause.status == 400
+
     async def _request_post(
         self,
         endpoint: str,
@@ -1947,6 +2028,39 @@ class EmbyClient:
         total_count = response.get("TotalRecordCount", 0)
         return int(total_count) if isinstance(total_count, int | float | str) else 0
 
+    async def async_get_item_types(self, item_ids: Sequence[str]) -> dict[str, str]:
+        """Resolve the types of items by ID.
+
+        Looks the items up with batched ``Ids=`` queries (up to
+        ITEM_IDS_BATCH_SIZE per request) without images or user data.
+
+        Args:
+            item_ids: IDs of the items to resolve.
+
+        Returns:
+            Mapping of item ID to item type (e.g. "Movie", "Episode").
+            Items that no longer exist are missing from the result.
+
+        Raises:
+            EmbyConnectionError: Connection failed.
+            EmbyAuthenticationError: API key is invalid.
+        """
+        item_types: dict[str, str] = {}
+        for start in range(0, len(item_ids), ITEM_IDS_BATCH_SIZE):
+            batch = item_ids[start : start + ITEM_IDS_BATCH_SIZE]
+            endpoint = (
+                f"/Items?Ids={','.join(batch)}&Recursive=true"
+                "&EnableImages=false&EnableUserData=false"
+            )
+            response = await self._request(HTTP_GET, endpoint)
+            items: list[EmbyBrowseItem] = response.get("Items", [])  # type: ignore[assignment]
+            for item in items:
+                item_id = item.get("Id")
+                item_type = item.get("Type")
+                if item_id and item_type:
+                    item_types[item_id] = item_type
+        return item_types
+
     async def async_play_items(
         self,
         session_id: str,
@@ -32,13 +32,18 @@ from .const import (
     CONF_PREFIX_MEDIA_PLAYER,
     CONF_PREFIX_NOTIFY,
     CONF_PREFIX_REMOTE,
+    CONF_REQUEST_BUDGET,
     CONF_SCAN_INTERVAL,
     CONF_SERVER_SCAN_INTERVAL,
+    CONF_SESSION_ACTIVITY_WINDOW,
     CONF_TRANSCODING_PROFILE,
     CONF_USER_ID,
     CONF_VERIFY_SSL,
     CONF_VIDEO_CONTAINER,
+    CONF_WATCH_TIME_RETENTION_DAYS,
     CONF_WEBSOCKET_INTERVAL,
+    CONF_WEBSOCKET_LIVENESS_TIMEOUT,
+    CONF_WEBSOCKET_RECORD,
     DEFAULT_DIRECT_PLAY,
     DEFAULT_DISCOVERY_SCAN_INTERVAL,
     DEFAULT_ENABLE_DISCOVERY_SENSORS,
@@ -50,23 +55,34 @@ from .const import (
     DEFAULT_PREFIX_MEDIA_PLAYER,
     DEFAULT_PREFIX_NOTIFY,
     DEFAULT_PREFIX_REMOTE,
+    DEFAULT_REQUEST_BUDGET,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SERVER_SCAN_INTERVAL,
+    DEFAULT_SESSION_ACTIVITY_WINDOW,
     DEFAULT_SSL,
     DEFAULT_TRANSCODING_PROFILE,
     DEFAULT_VERIFY_SSL,
     DEFAULT_VIDEO_CONTAINER,
+    DEFAULT_WATCH_TIME_RETENTION_DAYS,
     DEFAULT_WEBSOCKET_INTERVAL,
+    DEFAULT_WEBSOCKET_LIVENESS_TIMEOUT,
+    DEFAULT_WEBSOCKET_RECORD,
     DOMAIN,
     EMBY_MIN_VERSION,
     MAX_LIBRARY_SCAN_INTERVAL,
+    MAX_REQUEST_BUDGET,
     MAX_SCAN_INTERVAL,
     MAX_SERVER_SCAN_INTERVAL,
+    MAX_SESSION_ACTIVITY_WINDOW,
+    MAX_WATCH_TIME_RETENTION_DAYS,
     MAX_WEBSOCKET_INTERVAL,
+    MAX_WEBSOCKET_LIVENESS_TIMEOUT,
     MIN_LIBRARY_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
     MIN_SERVER_SCAN_INTERVAL,
+    MIN_WATCH_TIME_RETENTION_DAYS,
     MIN_WEBSOCKET_INTERVAL,
+    MIN_WEBSOCKET_LIVENESS_TIMEOUT,
     TRANSCODING_PROFILES,
     VIDEO_CONTAINERS,
     EmbyConfigFlowUserInput,
@@ -769,6 +785,54 @@ class EmbyOptionsFlowHandler(OptionsFlow):
                         vol.Coerce(int),
                         vol.Range(min=MIN_WEBSOCKET_INTERVAL, max=MAX_WEBSOCKET_INTERVAL),
                     ),
+                    vol.Optional(
+                        CONF_WEBSOCKET_LIVENESS_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_WEBSOCKET_LIVENESS_TIMEOUT, DEFAULT_WEBSOCKET_LIVENESS_TIMEOUT
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_WEBSOCKET_LIVENESS_TIMEOUT,
+                            max=MAX_WEBSOCKET_LIVENESS_TIMEOUT,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_WEBSOCKET_RECORD,
+                        default=self.config_entry.options.get(
+                            CONF_WEBSOCKET_RECORD, DEFAULT_WEBSOCKET_RECORD
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SESSION_ACTIVITY_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_SESSION_ACTIVITY_WINDOW, DEFAULT_SESSION_ACTIVITY_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_SESSION_ACTIVITY_WINDOW),
+                    ),
+                    vol.Optional(
+                        CONF_REQUEST_BUDGET,
+                        default=self.config_entry.options.get(
+                            CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_REQUEST_BUDGET),
+                    ),
+                    vol.Optional(
+                        CONF_WATCH_TIME_RETENTION_DAYS,
+                        default=self.config_entry.options.get(
+                            CONF_WATCH_TIME_RETENTION_DAYS, DEFAULT_WATCH_TIME_RETENTION_DAYS
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_WATCH_TIME_RETENTION_DAYS,
+                            max=MAX_WATCH_TIME_RETENTION_DAYS,
+                        ),
+                    ),
                     vol.Optional(
                         CONF_IGNORED_DEVICES,
                         default=self.config_entry.options.get(CONF_IGNORED_DEVICES, ""),
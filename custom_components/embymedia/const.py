@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from .coordinator import EmbyDataUpdateCoordinator
     from .coordinator_discovery import EmbyDiscoveryCoordinator
     from .coordinator_sensors import EmbyLibraryCoordinator, EmbyServerCoordinator
+    from .discovery_scheduler import DiscoveryScheduler
+    from .metrics import StartupTimeline
+    from .refresh_planner import RefreshPlanner
+    from .snapshot import CoordinatorSnapshotStore
 
 # Integration domain
 DOMAIN: Final = "embymedia"
@@ -30,6 +34,10 @@ class EmbyRuntimeData:
         server_coordinator: EmbyServerCoordinator,
         library_coordinator: EmbyLibraryCoordinator,
         discovery_coordinators: dict[str, EmbyDiscoveryCoordinator] | None = None,
+        discovery_scheduler: DiscoveryScheduler | None = None,
+        startup_timeline: StartupTimeline | None = None,
+        snapshots: CoordinatorSnapshotStore | None = None,
+        refresh_planner: RefreshPlanner | None = None,
     ) -> None:
         """Initialize runtime data.
 
@@ -38,11 +46,19 @@ class EmbyRuntimeData:
             server_coordinator: Coordinator for server status data.
             library_coordinator: Coordinator for library counts data.
             discovery_coordinators: Optional dict of user_id -> coordinator for discovery data.
+            discovery_scheduler: Optional scheduler driving the discovery refreshes.
+            startup_timeline: Optional phase timings of the entry's setup.
+            snapshots: Optional store persisting the coordinators' data.
+            refresh_planner: Optional planner pacing the coordinators' refreshes.
         """
         self.session_coordinator = session_coordinator
         self.server_coordinator = server_coordinator
         self.library_coordinator = library_coordinator
         self.discovery_coordinators = discovery_coordinators or {}
+        self.discovery_scheduler = discovery_scheduler
+        self.startup_timeline = startup_timeline
+        self.snapshots = snapshots
+        self.refresh_planner = refresh_planner
 
     # Provide backward compatibility as the old coordinator
     @property
@@ -140,6 +156,60 @@ DEFAULT_WEBSOCKET_INTERVAL: Final = 1500  # Default 1500ms
 MIN_WEBSOCKET_INTERVAL: Final = 500  # Minimum 500ms
 MAX_WEBSOCKET_INTERVAL: Final = 10000  # Maximum 10000ms (10 seconds)
 
+# WebSocket liveness deadline: seconds without any message before the
+# connection is treated as dead and polling takes over
+CONF_WEBSOCKET_LIVENESS_TIMEOUT: Final = "websocket_liveness_timeout"
+DEFAULT_WEBSOCKET_LIVENESS_TIMEOUT: Final = 60
+MIN_WEBSOCKET_LIVENESS_TIMEOUT: Final = 15
+MAX_WEBSOCKET_LIVENESS_TIMEOUT: Final = 300
+
+# Record received WebSocket frames to a file in the config directory for
+# offline replay (opt-in, for diagnosing and benchmarking)
+CONF_WEBSOCKET_RECORD: Final = "websocket_record"
+DEFAULT_WEBSOCKET_RECORD: Final = False
+
+# Watch-time statistics are persisted per user per day; days older than the
+# retention period are dropped
+CONF_WATCH_TIME_RETENTION_DAYS: Final = "watch_time_retention_days"
+DEFAULT_WATCH_TIME_RETENTION_DAYS: Final = 30
+MIN_WATCH_TIME_RETENTION_DAYS: Final = 1
+MAX_WATCH_TIME_RETENTION_DAYS: Final = 365
+# Seconds watch-time updates are batched before being written to storage
+WATCH_TIME_SAVE_DELAY: Final = 60
+
+# Seconds between writes of the coordinator data snapshots
+SNAPSHOT_SAVE_INTERVAL: Final = 600
+# Snapshots older than this many seconds are not restored
+SNAPSHOT_MAX_AGE: Final = 7 * 24 * 3600
+# Seconds between the background refreshes of coordinators restored from a
+# snapshot, so they do not all hit the server at once after a restart
+SNAPSHOT_REFRESH_SPACING: Final = 10
+
+# Session polling only requests sessions active within this many seconds
+# (0 = all sessions, the default). Opt-in: idle but connected clients outside
+# the window are dropped. 960 matches the Emby dashboard's own session list.
+CONF_SESSION_ACTIVITY_WINDOW: Final = "session_activity_window"
+DEFAULT_SESSION_ACTIVITY_WINDOW: Final = 0
+MAX_SESSION_ACTIVITY_WINDOW: Final = 86400
+
+# Request budget (requests per minute) for planned refreshes (0 = unlimited)
+CONF_REQUEST_BUDGET: Final = "request_budget"
+DEFAULT_REQUEST_BUDGET: Final = 0
+MAX_REQUEST_BUDGET: Final = 6000
+# With a budget, at most this many planned refreshes run at the same time
+REFRESH_PLANNER_MAX_CONCURRENT: Final = 3
+
+# Reconnect resync: caches are only invalidated if the WebSocket was down
+# for longer than this many seconds (missed LibraryChanged/UserDataChanged)
+WEBSOCKET_RESYNC_GAP_THRESHOLD: Final = 60
+
+# Adaptive session subscription: slow interval used while all sessions are idle
+WEBSOCKET_IDLE_INTERVAL: Final = 20000  # 20 seconds
+# Seconds without playback/interaction before switching to the idle interval
+WEBSOCKET_IDLE_HYSTERESIS: Final = 120
+# Sessions with activity within this many seconds count as user interaction
+WEBSOCKET_ACTIVITY_WINDOW: Final = 30
+
 # Notification defaults
 DEFAULT_NOTIFICATION_TIMEOUT_MS: Final = 5000  # 5 seconds
 
@@ -346,6 +416,7 @@ class EmbyPlayState(TypedDict):
     MediaSourceId: NotRequired[str]
     PlayMethod: NotRequired[str]  # "DirectPlay", "Transcode", etc.
     RepeatMode: NotRequired[str]
+    PlaybackRate: NotRequired[float | None]  # 1.0 = normal speed, may be null
 
 
 class EmbyQueueItem(TypedDict):
@@ -377,6 +448,7 @@ class EmbySessionResponse(TypedDict):
     NowPlayingItem: NotRequired[EmbyNowPlayingItem]
     PlayState: NotRequired[EmbyPlayState]
     LastActivityDate: NotRequired[str]
+    LastPlaybackCheckIn: NotRequired[str]  # When the client last reported progress
     PlayableMediaTypes: NotRequired[list[str]]
     SupportedCommands: NotRequired[list[str]]
     NowPlayingQueue: NotRequired[list[EmbyQueueItem]]
@@ -1174,6 +1246,11 @@ CONF_DISCOVERY_SCAN_INTERVAL: Final = "discovery_scan_interval"
 DEFAULT_ENABLE_DISCOVERY_SENSORS: Final = True
 DEFAULT_DISCOVERY_SCAN_INTERVAL: Final = 900  # 15 minutes in seconds
 DISCOVERY_CACHE_TTL: Final = 1800  # 30 minutes in seconds - cache for discovery data
+# Per-user discovery refreshes are spread evenly across the scan interval,
+# each shifted by up to this fraction of a user's slot, and at most this many
+# users refresh at the same time
+DISCOVERY_SCHEDULE_JITTER: Final = 0.1
+DISCOVERY_MAX_CONCURRENT_REFRESHES: Final = 2
 
 
 # =============================================================================
@@ -5,44 +5,74 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from collections.abc import Mapping
-from datetime import date, datetime, timedelta
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 from homeassistant.const import CONF_ENTITY_ID, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .api import EmbyClient
+from .api import EmbyClient, SessionQuery
 from .const import (
     CONF_IGNORE_WEB_PLAYERS,
+    CONF_SESSION_ACTIVITY_WINDOW,
     CONF_WEBSOCKET_INTERVAL,
+    CONF_WEBSOCKET_LIVENESS_TIMEOUT,
+    CONF_WEBSOCKET_RECORD,
     DEFAULT_IGNORE_WEB_PLAYERS,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SESSION_ACTIVITY_WINDOW,
     DEFAULT_WEBSOCKET_INTERVAL,
+    DEFAULT_WEBSOCKET_LIVENESS_TIMEOUT,
+    DEFAULT_WEBSOCKET_RECORD,
     DOMAIN,
     WEB_PLAYER_CLIENTS_LOWER,
+    WEBSOCKET_ACTIVITY_WINDOW,
+    WEBSOCKET_IDLE_HYSTERESIS,
+    WEBSOCKET_IDLE_INTERVAL,
     WEBSOCKET_POLL_INTERVAL,
+    WEBSOCKET_RESYNC_GAP_THRESHOLD,
     EmbyConfigEntry,
     EmbyLibraryChangedData,
     EmbyNotificationData,
     EmbyUserChangedData,
     EmbyUserDataChangedData,
+    EmbyUserDataChangedItemData,
 )
+from .debounce import RefreshDebouncer
 from .exceptions import EmbyConnectionError, EmbyError
-from .models import EmbySession, parse_session
+from .models import EmbySession, PlaybackRecord, parse_session
+from .recorder import WebSocketRecorder
+from .watch_time import WatchTimeStore
 from .websocket import EmbyWebSocket
 
 if TYPE_CHECKING:
     from .const import EmbySessionResponse
-
-# Minimum time between WebSocket-triggered refreshes (debouncing)
-WEBSOCKET_REFRESH_DEBOUNCE = timedelta(seconds=2)
+    from .coordinator_discovery import EmbyDiscoveryCoordinator
+
+# Debouncing of WebSocket-triggered refreshes (seconds): a burst of events
+# refreshes on the first event and once more after COOLDOWN seconds of quiet,
+# but never waits longer than MAX_WAIT
+WEBSOCKET_REFRESH_COOLDOWN = 2.0
+WEBSOCKET_REFRESH_MAX_WAIT = 10.0
+# Library scans send many LibraryChanged messages: refresh once they settle
+LIBRARY_REFRESH_COOLDOWN = 5.0
+LIBRARY_REFRESH_MAX_WAIT = 60.0
+# UserDataChanged follows every stop/seek: refresh discovery once it settles
+USER_DATA_REFRESH_COOLDOWN = 10.0
+USER_DATA_REFRESH_MAX_WAIT = 60.0
+
+# Interval of ScheduledTasksInfo pushes (task state and scan progress)
+SCHEDULED_TASKS_PUSH_INTERVAL_MS = 2000
 
 # Emby uses ticks (100 nanoseconds) for time tracking
 EMBY_TICKS_PER_SECOND = 10_000_000
@@ -60,6 +90,10 @@ WEBSOCKET_STABLE_THRESHOLD = 5
 # Health check interval when polling is disabled (5 minutes)
 HEALTH_CHECK_INTERVAL = 300
 
+# Adaptive session subscription modes
+SUBSCRIPTION_MODE_ACTIVE = "active"
+SUBSCRIPTION_MODE_IDLE = "idle"
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -117,25 +151,84 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         self.config_entry = config_entry
         self._user_id = user_id
         self._previous_sessions: set[str] = set()
+        # device_id -> media_player entity_id (None = not registered), kept
+        # current from entity registry events so firing events needs no lookup
+        self._entity_ids: dict[str, str | None] = {}
+        self._unsub_entity_registry: Callable[[], None] | None = None
         self._websocket: EmbyWebSocket | None = None
         self._websocket_enabled: bool = False
         self._websocket_receive_task: asyncio.Task[None] | None = None
+        self._websocket_reconnect_task: asyncio.Task[None] | None = None
+        self._websocket_recorder: WebSocketRecorder | None = None
+        self._recorder_flush: asyncio.Future[None] | None = None
         self._configured_scan_interval = scan_interval
         # Resilience tracking
         self._consecutive_failures: int = 0
         self._max_consecutive_failures: int = 5
         # Debouncing for WebSocket-triggered refreshes
-        self._last_websocket_refresh: datetime | None = None
+        self._session_refresh = RefreshDebouncer(
+            hass,
+            "sessions",
+            self.async_refresh,
+            cooldown=WEBSOCKET_REFRESH_COOLDOWN,
+            max_wait=WEBSOCKET_REFRESH_MAX_WAIT,
+            stats=client.metrics.get_debounce_stats("sessions"),
+        )
+        self._library_refresh = RefreshDebouncer(
+            hass,
+            "library",
+            self._async_refresh_library,
+            cooldown=LIBRARY_REFRESH_COOLDOWN,
+            max_wait=LIBRARY_REFRESH_MAX_WAIT,
+            immediate=False,
+            stats=client.metrics.get_debounce_stats("library"),
+        )
+        self._user_data_refresh = RefreshDebouncer(
+            hass,
+            "user_data",
+            self._async_refresh_user_discovery,
+            cooldown=USER_DATA_REFRESH_COOLDOWN,
+            max_wait=USER_DATA_REFRESH_MAX_WAIT,
+            immediate=False,
+            stats=client.metrics.get_debounce_stats("user_data"),
+        )
+        # Users whose discovery data awaits the debounced user-data refresh
+        self._user_data_refresh_users: set[str] = set()
         # Playback tracking (Phase 18) - per user
-        # Key is "{user_id}:{session_id}" to track per-user sessions
-        self._playback_sessions: dict[str, dict[str, int | str]] = {}
-        # Per-user watch time: user_id -> seconds watched today
-        self._user_watch_times: dict[str, int] = {}
-        self._last_reset_date: date = date.today()
+        # Key is "{user_id}:{session_id}" to track per-user sessions. Entries
+        # are kept in last-update order so stale cleanup only looks at the front.
+        self._playback_sessions: OrderedDict[str, PlaybackRecord] = OrderedDict()
+        # Secondary indexes into _playback_sessions: device/user ID -> keys
+        self._playback_keys_by_device: dict[str, set[str]] = {}
+        self._playback_keys_by_user: dict[str, set[str]] = {}
+        # Per-user, per-day watch time (persisted once async_load() is called)
+        self._watch_time = WatchTimeStore(hass, server_id)
         # WebSocket stability tracking (Issue #287)
         self._ws_consecutive_success: int = 0
         self._polling_disabled: bool = False
         self._health_check_task: asyncio.Task[None] | None = None
+        # Reconnect resync: monotonic time the WebSocket was lost
+        self._websocket_disconnected_at: float | None = None
+        # Adaptive SessionsStart interval: fast while active, slow while idle
+        self._subscription_mode: str = SUBSCRIPTION_MODE_ACTIVE
+        self._last_session_activity: float = time.monotonic()
+        # WebSocket message dispatch table: MessageType -> handler
+        self._websocket_handlers: dict[str, Callable[[Any], None]] = {
+            "Sessions": self._on_ws_sessions,
+            "PlaybackProgress": self._on_ws_playback_progress,
+            "PlaybackStarted": self._on_ws_playback_started,
+            "PlaybackStopped": self._on_ws_playback_stopped,
+            "SessionEnded": self._on_ws_session_ended,
+            "ServerRestarting": self._on_ws_server_restarting,
+            "ServerShuttingDown": self._on_ws_server_shutting_down,
+            # Phase 21: Library and user data events
+            "LibraryChanged": self._on_ws_library_changed,
+            "UserDataChanged": self._on_ws_user_data_changed,
+            "NotificationAdded": self._on_ws_notification_added,
+            "UserUpdated": self._on_ws_user_updated,
+            "UserDeleted": self._on_ws_user_deleted,
+            "ScheduledTasksInfo": self._on_ws_scheduled_tasks_info,
+        }
 
     @property
     def user_id(self) -> str | None:
@@ -163,6 +256,32 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             self.config_entry.options.get(CONF_IGNORE_WEB_PLAYERS, DEFAULT_IGNORE_WEB_PLAYERS)
         )
 
+    @property
+    def session_activity_window(self) -> int:
+        """Return the session activity window in seconds (0 = unlimited)."""
+        return int(
+            self.config_entry.options.get(
+                CONF_SESSION_ACTIVITY_WINDOW, DEFAULT_SESSION_ACTIVITY_WINDOW
+            )
+        )
+
+    @property
+    def session_query(self) -> SessionQuery:
+        """Return the server-side filters for session polling.
+
+        Web player and remote-control filtering have no server-side
+        equivalent and are still applied to the response.
+        """
+        return SessionQuery(
+            controllable_by_user_id=self._user_id,
+            active_within_seconds=self.session_activity_window or None,
+        )
+
+    @property
+    def watch_time(self) -> WatchTimeStore:
+        """Return the persisted watch-time store."""
+        return self._watch_time
+
     @property
     def daily_watch_time(self) -> int:
         """Return total watch time today in seconds (all users combined).
@@ -170,7 +289,7 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         Returns:
             Total seconds of video watched today.
         """
-        return sum(self._user_watch_times.values())
+        return self._watch_time.daily_total
 
     @property
     def user_watch_times(self) -> dict[str, int]:
@@ -179,7 +298,7 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         Returns:
             Dictionary mapping user_id to seconds watched today.
         """
-        return self._user_watch_times
+        return self._watch_time.today
 
     def get_user_watch_time(self, user_id: str) -> int:
         """Return watch time for a specific user.
@@ -190,17 +309,124 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         Returns:
             Seconds watched today by the specified user.
         """
-        return self._user_watch_times.get(user_id, 0)
+        return self._watch_time.get_user_time(user_id)
 
     @property
-    def playback_sessions(self) -> dict[str, dict[str, int | str]]:
+    def playback_sessions(self) -> Mapping[str, PlaybackRecord]:
         """Return currently tracked playback sessions.
 
         Returns:
-            Dictionary mapping session IDs to session tracking data.
+            Mapping of tracking keys ("user_id:session_id") to playback records.
         """
         return self._playback_sessions
 
+    @property
+    def subscription_mode(self) -> str:
+        """Return the current session subscription mode ("active" or "idle")."""
+        return self._subscription_mode
+
+    def _interval_for_mode(self, mode: str) -> int:
+        """Return the SessionsStart interval for a subscription mode.
+
+        Args:
+            mode: The subscription mode.
+
+        Returns:
+            Interval in milliseconds. The idle interval is never faster than
+            the configured (active) interval.
+        """
+        active_interval = int(
+            self.config_entry.options.get(CONF_WEBSOCKET_INTERVAL, DEFAULT_WEBSOCKET_INTERVAL)
+        )
+        if mode == SUBSCRIPTION_MODE_IDLE:
+            return max(active_interval, WEBSOCKET_IDLE_INTERVAL)
+        return active_interval
+
+    def _session_has_activity(self, session: EmbySession, now: datetime) -> bool:
+        """Check if a session is playing or was recently interacted with.
+
+        Args:
+            session: The session to check.
+            now: Current UTC time.
+
+        Returns:
+            True if the session is playing (not paused) or had activity
+            within WEBSOCKET_ACTIVITY_WINDOW seconds.
+        """
+        if session.now_playing is not None and not (
+            session.play_state is not None and session.play_state.is_paused
+        ):
+            return True
+        if session.last_activity is None:
+            return False
+        last_activity = (
+            session.last_activity
+            if session.last_activity.tzinfo is not None
+            else session.last_activity.replace(tzinfo=UTC)
+        )
+        return (now - last_activity).total_seconds() < WEBSOCKET_ACTIVITY_WINDOW
+
+    def _update_subscription_mode(self, sessions: Mapping[str, EmbySession]) -> None:
+        """Re-evaluate the session subscription mode from current sessions.
+
+        Switches to the active interval as soon as any session shows activity,
+        and to the idle interval only after WEBSOCKET_IDLE_HYSTERESIS seconds
+        without activity.
+
+        Args:
+            sessions: Current sessions keyed by device_id.
+        """
+        now = datetime.now(UTC)
+        if any(self._session_has_activity(session, now) for session in sessions.values()):
+            self._note_session_activity()
+        elif (
+            self._subscription_mode == SUBSCRIPTION_MODE_ACTIVE
+            and time.monotonic() - self._last_session_activity >= WEBSOCKET_IDLE_HYSTERESIS
+        ):
+            self._set_subscription_mode(SUBSCRIPTION_MODE_IDLE)
+
+    def _note_session_activity(self) -> None:
+        """Record playback or user activity, switching to the active interval."""
+        self._last_session_activity = time.monotonic()
+        if self._subscription_mode != SUBSCRIPTION_MODE_ACTIVE:
+            self._set_subscription_mode(SUBSCRIPTION_MODE_ACTIVE)
+
+    def _set_subscription_mode(self, mode: str) -> None:
+        """Change the subscription mode and renegotiate the interval.
+
+        Args:
+            mode: The new subscription mode.
+        """
+        self._subscription_mode = mode
+        if self._websocket is None or not self._websocket_enabled:
+            return
+
+        interval_ms = self._interval_for_mode(mode)
+        _LOGGER.debug(
+            "Switching session subscription for %s to %s mode (%dms)",
+            self.server_name,
+            mode,
+            interval_ms,
+        )
+        self.client.metrics.record_sessions_subscription_mode(mode, interval_ms)
+        self.hass.async_create_task(self._async_apply_subscription_interval())
+
+    async def _async_apply_subscription_interval(self) -> None:
+        """Send the interval for the current subscription mode to the server."""
+        websocket = self._websocket
+        if websocket is None or not websocket.connected:
+            return
+        try:
+            await websocket.async_set_sessions_interval(
+                self._interval_for_mode(self._subscription_mode)
+            )
+        except (RuntimeError, aiohttp.ClientError) as err:
+            _LOGGER.debug(
+                "Failed to change session subscription interval for %s: %s",
+                self.server_name,
+                err,
+            )
+
     # Class constant for WebSocket stability threshold
     WEBSOCKET_STABLE_THRESHOLD: int = WEBSOCKET_STABLE_THRESHOLD
 
@@ -326,6 +552,24 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         client_name = session.client_name.lower()
         return client_name in WEB_PLAYER_CLIENTS_LOWER
 
+    @staticmethod
+    def _is_dormant(session: EmbySession, cutoff: datetime | None) -> bool:
+        """Check whether a session falls outside the activity window.
+
+        Args:
+            session: The session to check.
+            cutoff: Oldest activity time to keep, or None for no window.
+
+        Returns:
+            True if the session's last activity is older than the cutoff.
+        """
+        if cutoff is None or session.last_activity is None or session.now_playing is not None:
+            return False
+        last = session.last_activity
+        if last.tzinfo is None:
+            last = last.replace(tzinfo=UTC)
+        return last < cutoff
+
     def _track_playback_progress(self, data: Mapping[str, Any]) -> None:
         """Track playback progress for watch time statistics (per user).
 
@@ -335,12 +579,6 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         Args:
             data: PlaybackProgress WebSocket event data or session data with PlayState.
         """
-        # Reset daily counters if it's a new day
-        today = date.today()
-        if today != self._last_reset_date:
-            self._user_watch_times.clear()
-            self._last_reset_date = today
-
         # Extract user ID - required for per-user tracking
         user_id = str(data.get("UserId") or "")
         if not user_id:
@@ -371,67 +609,121 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         item_id = str(data.get("ItemId") or now_playing.get("Id", ""))
         item_name = str(data.get("ItemName") or now_playing.get("Name", ""))
         user_name = str(data.get("UserName") or "")
+        device_id = str(data.get("DeviceId") or "")
+
+        now = time.monotonic()
+        record = self._playback_sessions.get(tracking_key)
+        if record is None:
+            self._add_playback_record(
+                tracking_key,
+                PlaybackRecord(
+                    user_id=sys.intern(user_id),
+                    session_id=sys.intern(session_id),
+                    position_ticks=position_ticks,
+                    last_update=now,
+                    item_id=sys.intern(item_id),
+                    item_name=item_name,
+                    user_name=user_name,
+                    device_id=sys.intern(device_id),
+                ),
+            )
+            self._cleanup_stale_sessions(now=now)
+            return
 
-        # Skip if paused (from PlayState)
+        last_position = record.position_ticks
+        record.position_ticks = position_ticks
+        record.last_update = now
+        if record.item_id != item_id:
+            record.item_id = sys.intern(item_id)
+        record.item_name = item_name
+        record.user_name = user_name
+        if device_id and record.device_id != device_id:
+            self._remove_playback_record(tracking_key)
+            record.device_id = sys.intern(device_id)
+            self._add_playback_record(tracking_key, record)
+        # Keep the most recently updated record at the end
+        self._playback_sessions.move_to_end(tracking_key)
+        self._cleanup_stale_sessions(now=now)
+
+        # Skip if paused (from PlayState) - position updated, paused time not counted
         play_state = data.get("PlayState", {})
         if isinstance(play_state, dict) and play_state.get("IsPaused"):
-            # Update position but don't count paused time
-            self._playback_sessions[tracking_key] = {
-                "position_ticks": position_ticks,
-                "last_update": datetime.now().isoformat(),
-                "item_id": item_id,
-                "item_name": item_name,
-                "user_id": user_id,
-                "user_name": user_name,
-            }
             return
 
-        # Calculate watch time since last update (only for existing sessions)
-        if tracking_key in self._playback_sessions:
-            last_position = self._playback_sessions[tracking_key].get("position_ticks", 0)
-            if isinstance(last_position, int) and position_ticks > last_position:
-                # Only count forward progress
-                ticks_delta = position_ticks - last_position
-                seconds_delta = ticks_delta // EMBY_TICKS_PER_SECOND
-                # Sanity check: don't count huge jumps (likely seeks)
-                if seconds_delta <= MAX_PLAYBACK_DELTA_SECONDS:
-                    # Add to user's watch time
-                    current_user_time = self._user_watch_times.get(user_id, 0)
-                    self._user_watch_times[user_id] = current_user_time + seconds_delta
-                    _LOGGER.debug(
-                        "Watch time added for user %s: %d seconds (user total: %d)",
-                        user_name or user_id,
-                        seconds_delta,
-                        self._user_watch_times[user_id],
-                    )
+        # Only count forward progress
+        if position_ticks > last_position:
+            ticks_delta = position_ticks - last_position
+            seconds_delta = ticks_delta // EMBY_TICKS_PER_SECOND
+            # Sanity check: don't count huge jumps (likely seeks)
+            if seconds_delta <= MAX_PLAYBACK_DELTA_SECONDS:
+                # Add to user's watch time for today
+                user_total = self._watch_time.add(user_id, seconds_delta)
+                _LOGGER.debug(
+                    "Watch time added for user %s: %d seconds (user total: %d)",
+                    user_name or user_id,
+                    seconds_delta,
+                    user_total,
+                )
 
-        # Update session tracking
-        self._playback_sessions[tracking_key] = {
-            "position_ticks": position_ticks,
-            "last_update": datetime.now().isoformat(),
-            "item_id": item_id,
-            "item_name": item_name,
-            "user_id": user_id,
-            "user_name": user_name,
-        }
+    def _add_playback_record(self, tracking_key: str, record: PlaybackRecord) -> None:
+        """Add a playback record and index it by device and user.
+
+        Args:
+            tracking_key: The "{user_id}:{session_id}" key.
+            record: The record to track.
+        """
+        self._playback_sessions[tracking_key] = record
+        if record.device_id:
+            self._playback_keys_by_device.setdefault(record.device_id, set()).add(tracking_key)
+        self._playback_keys_by_user.setdefault(record.user_id, set()).add(tracking_key)
+
+    def _remove_playback_record(self, tracking_key: str) -> PlaybackRecord | None:
+        """Remove a playback record and its index entries.
+
+        Args:
+            tracking_key: The "{user_id}:{session_id}" key.
+
+        Returns:
+            The removed record, or None if the key was not tracked.
+        """
+        record = self._playback_sessions.pop(tracking_key, None)
+        if record is None:
+            return None
+        for index, index_key in (
+            (self._playback_keys_by_device, record.device_id),
+            (self._playback_keys_by_user, record.user_id),
+        ):
+            keys = index.get(index_key)
+            if keys is not None:
+                keys.discard(tracking_key)
+                if not keys:
+                    del index[index_key]
+        return record
 
     def _cleanup_playback_session(self, data: Mapping[str, Any]) -> None:
         """Remove playback session tracking when playback stops.
 
+        Removes the record keyed by PlaySessionId. When the event carries no
+        PlaySessionId, the user's records on the reported device are removed.
+
         Args:
             data: PlaybackStopped WebSocket event data.
         """
         user_id = str(data.get("UserId", ""))
         device_id = str(data.get("DeviceId", ""))
-        play_session_id = str(data.get("PlaySessionId", "")) or device_id
-        tracking_key = f"{user_id}:{play_session_id}"
-        removed = self._playback_sessions.pop(tracking_key, None)
-        if removed:
-            _LOGGER.debug("Cleaned up playback session: %s", tracking_key)
-
-        # Invalidate discovery cache for this user (playback affected their discovery data)
-        if user_id:
-            self._invalidate_discovery_cache_for_user(user_id)
+        play_session_id = str(data.get("PlaySessionId", ""))
+        tracking_keys = {f"{user_id}:{play_session_id or device_id}"}
+        if not play_session_id and device_id:
+            tracking_keys |= self._playback_keys_by_device.get(
+                device_id, set()
+            ) & self._playback_keys_by_user.get(user_id, set())
+        for tracking_key in tracking_keys:
+            if self._remove_playback_record(tracking_key) is not None:
+                _LOGGER.debug("Cleaned up playback session: %s", tracking_key)
+
+        # Invalidate the discovery sections playback can have changed for this user
+        if user_id and (coordinator := self._get_discovery_coordinator(user_id)) is not None:
+            coordinator.on_playback_stopped(user_id)
 
     def _cleanup_session_tracking(self, data: Mapping[str, Any]) -> None:
         """Remove all tracking for a session that ended.
@@ -443,61 +735,58 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         if not device_id:
             return
 
-        # Remove any entries containing this device_id
-        keys_to_remove = [k for k in self._playback_sessions if device_id in k]
-        for key in keys_to_remove:
-            self._playback_sessions.pop(key, None)
+        for key in list(self._playback_keys_by_device.get(device_id, ())):
+            self._remove_playback_record(key)
             _LOGGER.debug("Cleaned up session tracking for device: %s", key)
 
-    def _cleanup_stale_sessions(self, max_age_seconds: int = DEFAULT_STALE_SESSION_MAX_AGE) -> None:
+    def _cleanup_stale_sessions(
+        self,
+        max_age_seconds: int = DEFAULT_STALE_SESSION_MAX_AGE,
+        now: float | None = None,
+    ) -> None:
         """Remove playback sessions older than max_age_seconds.
 
         This prevents memory leaks from sessions that ended without proper cleanup
-        (e.g., client disconnected without sending PlaybackStopped).
+        (e.g., client disconnected without sending PlaybackStopped). Records are
+        ordered by last update, so the sweep stops at the first fresh record.
 
         Args:
             max_age_seconds: Maximum age in seconds before a session is considered stale.
+            now: Current monotonic time (defaults to time.monotonic()).
         """
-        now = datetime.now()
-        keys_to_remove: list[str] = []
-
-        for key, session_data in self._playback_sessions.items():
-            last_update_str = session_data.get("last_update")
-            if not last_update_str:
-                # No timestamp - treat as stale
-                keys_to_remove.append(key)
-                continue
-
-            try:
-                last_update = datetime.fromisoformat(str(last_update_str))
-                age = (now - last_update).total_seconds()
-                if age > max_age_seconds:
-                    keys_to_remove.append(key)
-            except (ValueError, TypeError):
-                # Invalid timestamp - treat as stale
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            self._playback_sessions.pop(key, None)
+        cutoff = (time.monotonic() if now is None else now) - max_age_seconds
+        sessions = self._playback_sessions
+        while sessions:
+            key, record = next(iter(sessions.items()))
+            if record.last_update >= cutoff:
+                break
+            self._remove_playback_record(key)
             _LOGGER.debug("Cleaned up stale playback session: %s", key)
 
-    def _invalidate_discovery_cache_for_user(self, user_id: str) -> None:
-        """Invalidate discovery cache for a specific user.
-
-        Called when user-specific events occur (PlaybackStopped, UserDataChanged).
+    def _get_discovery_coordinator(self, user_id: str) -> EmbyDiscoveryCoordinator | None:
+        """Get the discovery coordinator of a user.
 
         Args:
-            user_id: The user ID whose cache should be invalidated.
+            user_id: The user ID.
+
+        Returns:
+            The user's discovery coordinator, or None if there is none.
         """
         runtime_data = getattr(self.config_entry, "runtime_data", None)
-        if runtime_data is None:
-            return
+        discovery_coordinators = getattr(runtime_data, "discovery_coordinators", None) or {}
+        coordinator: EmbyDiscoveryCoordinator | None = discovery_coordinators.get(user_id)
+        return coordinator
 
-        discovery_coordinators = getattr(runtime_data, "discovery_coordinators", None)
-        if not discovery_coordinators:
-            return
+    def _invalidate_discovery_cache_for_user(self, user_id: str) -> None:
+        """Invalidate all discovery sections of a specific user.
 
-        coordinator = discovery_coordinators.get(user_id)
+        User events invalidate only the sections they affect (see
+        EmbyDiscoveryCoordinator.on_user_data_changed / on_playback_stopped).
+
+        Args:
+            user_id: The user ID whose cache should be invalidated.
+        """
+        coordinator = self._get_discovery_coordinator(user_id)
         if coordinator is not None:
             coordinator.invalidate_cache_for_user(user_id)
             _LOGGER.debug(
@@ -538,7 +827,9 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             UpdateFailed: If fetching data fails and no cached data available.
         """
         try:
-            sessions_data: list[EmbySessionResponse] = await self.client.async_get_sessions()
+            sessions_data: list[EmbySessionResponse] = await self.client.async_get_sessions(
+                self.session_query
+            )
             # Success - reset failure counter
             self._consecutive_failures = 0
         except EmbyConnectionError as err:
@@ -589,6 +880,7 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         # Fire events for session and playback changes (Issue #285)
         # This ensures events fire on both polling and WebSocket paths
         self._fire_session_change_events(sessions)
+        self._update_subscription_mode(sessions)
 
         return sessions
 
@@ -643,20 +935,30 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             ssl=self.client.ssl,
             device_id=f"ha-emby-{self.server_id}",
             session=session,
+            liveness_timeout=float(
+                self.config_entry.options.get(
+                    CONF_WEBSOCKET_LIVENESS_TIMEOUT, DEFAULT_WEBSOCKET_LIVENESS_TIMEOUT
+                )
+            ),
         )
 
         # Set up callbacks
         self._websocket.set_message_callback(self._handle_websocket_message)
         self._websocket.set_connection_callback(self._handle_websocket_connection)
+        self._websocket.set_rtt_callback(self.client.metrics.record_websocket_rtt)
+        self._websocket.set_reconnect_callback(
+            self.client.metrics.record_websocket_reconnect_latency
+        )
+        self._websocket.set_liveness_callback(self._handle_websocket_liveness_lost)
+        if self.config_entry.options.get(CONF_WEBSOCKET_RECORD, DEFAULT_WEBSOCKET_RECORD):
+            self._start_websocket_recording()
 
         # Connect to WebSocket
         try:
             await self._websocket.async_connect()
             # Subscribe to session updates (with error handling)
-            # Use configured interval or default
-            interval_ms = self.config_entry.options.get(
-                CONF_WEBSOCKET_INTERVAL, DEFAULT_WEBSOCKET_INTERVAL
-            )
+            # Use the interval for the current activity mode (configured interval when active)
+            interval_ms = self._interval_for_mode(self._subscription_mode)
             try:
                 await self._websocket.async_subscribe_sessions(interval_ms=interval_ms)
             except RuntimeError as err:
@@ -668,6 +970,10 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
                 self._websocket_enabled = False
                 return
             self._websocket_enabled = True
+            await self._async_subscribe_scheduled_tasks(self._websocket)
+            self.client.metrics.record_sessions_subscription_mode(
+                self._subscription_mode, interval_ms
+            )
             # Reduce polling interval since we have real-time updates
             self.update_interval = timedelta(seconds=WEBSOCKET_POLL_INTERVAL)  # type: ignore[misc]
             _LOGGER.info("WebSocket connected to Emby server %s", self.server_name)
@@ -685,14 +991,41 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             )
             self._websocket_enabled = False
 
+    def _start_websocket_recording(self) -> None:
+        """Record received WebSocket frames to the config directory."""
+        if self._websocket is None:
+            return
+        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        recorder = WebSocketRecorder(
+            self.hass.config.path(f"{DOMAIN}_websocket_{self.server_id}_{timestamp}.jsonl.gz")
+        )
+        recorder.set_flush_callback(self._schedule_recorder_flush)
+        self._websocket.set_recorder(recorder)
+        self._websocket_recorder = recorder
+        _LOGGER.info("Recording WebSocket traffic to %s", recorder.path)
+
+    def _schedule_recorder_flush(self) -> None:
+        """Write buffered WebSocket frames in an executor."""
+        recorder = self._websocket_recorder
+        # One write at a time keeps frames in order; the next frame retries
+        if recorder is None or (
+            self._recorder_flush is not None and not self._recorder_flush.done()
+        ):
+            return
+        self._recorder_flush = self.hass.async_add_executor_job(
+            recorder.write, recorder.take_pending()
+        )
+
     async def _async_websocket_receive_loop(self) -> None:
         """Run the WebSocket receive loop."""
         if self._websocket is None:
             return
+        cancelled = False
         try:
             await self._websocket.async_run_receive_loop()
         except asyncio.CancelledError:
             _LOGGER.debug("WebSocket receive loop cancelled")
+            cancelled = True
             raise
         except aiohttp.ClientError as err:
             _LOGGER.warning("WebSocket client error: %s", err)
@@ -702,22 +1035,75 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             # Connection lost, trigger reconnect or fallback
             if self._websocket_enabled:
                 self._handle_websocket_connection(False)
+                if not cancelled:
+                    self._schedule_websocket_reconnect()
+
+    def _schedule_websocket_reconnect(self) -> None:
+        """Start reconnecting the WebSocket in the background.
+
+        Polling covers the gap; the reconnect resync takes over once the
+        connection is back.
+        """
+        if self._websocket_reconnect_task is not None and not self._websocket_reconnect_task.done():
+            return
+        self._websocket_reconnect_task = self.hass.async_create_task(
+            self._async_reconnect_websocket()
+        )
+
+    async def _async_reconnect_websocket(self) -> None:
+        """Run the WebSocket reconnection loop."""
+        websocket = self._websocket
+        if websocket is None:
+            return
+        await websocket.async_start_reconnect_loop()
 
     async def async_shutdown_websocket(self) -> None:
         """Shut down WebSocket connection."""
-        # Cancel the receive loop task first
+        # Drop refreshes still pending from WebSocket events
+        self._session_refresh.async_cancel()
+        self._library_refresh.async_cancel()
+        self._user_data_refresh.async_cancel()
+
+        # Cancel any pending reconnect, then the receive loop task
+        if self._websocket_reconnect_task is not None:
+            self._websocket_reconnect_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._websocket_reconnect_task
+            self._websocket_reconnect_task = None
+
         if self._websocket_receive_task is not None:
             self._websocket_receive_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._websocket_receive_task
             self._websocket_receive_task = None
 
+        if self._websocket_recorder is not None:
+            recorder = self._websocket_recorder
+            self._websocket_recorder = None
+            if self._recorder_flush is not None:
+                await self._recorder_flush
+                self._recorder_flush = None
+            await self.hass.async_add_executor_job(recorder.write, recorder.take_pending())
+
         if self._websocket is not None:
             await self._websocket.async_stop_reconnect_loop()
             self._websocket = None
             self._websocket_enabled = False
             _LOGGER.info("WebSocket disconnected from Emby server %s", self.server_name)
 
+    def register_websocket_handler(
+        self,
+        message_type: str,
+        handler: Callable[[Any], None],
+    ) -> None:
+        """Register (or replace) the handler for a WebSocket message type.
+
+        Args:
+            message_type: The WebSocket MessageType to handle.
+            handler: Function called with the message payload.
+        """
+        self._websocket_handlers[message_type] = handler
+
     def _handle_websocket_message(
         self,
         message_type: str,
@@ -725,6 +1111,9 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
     ) -> None:
         """Handle incoming WebSocket messages.
 
+        Dispatches to the handler registered for the message type and records
+        per-type message counts and handler execution time.
+
         Args:
             message_type: The type of message received.
             data: The message payload.
@@ -732,50 +1121,127 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         # Track WebSocket stability for polling optimization (Issue #287)
         self._on_websocket_message_success()
 
-        if message_type == "Sessions":
-            # Direct session update from WebSocket
-            self._process_sessions_data(data)
-        elif message_type == "PlaybackProgress":
-            # Track playback progress for watch time statistics (Phase 18)
-            self._track_playback_progress(data)
-            # Also trigger a refresh to get latest session state
-            self._trigger_debounced_refresh()
-        elif message_type == "PlaybackStarted":
-            # Trigger a refresh to get latest session state (with debouncing)
-            self._trigger_debounced_refresh()
-        elif message_type == "PlaybackStopped":
-            # Clean up playback session tracking when playback stops
-            self._cleanup_playback_session(data)
-            self._trigger_debounced_refresh()
-        elif message_type == "SessionEnded":
-            # Clean up all tracking for a session that ended
-            self._cleanup_session_tracking(data)
-            self._trigger_debounced_refresh()
-        elif message_type == "ServerRestarting":
-            _LOGGER.info("Emby server %s is restarting", self.server_name)
-        elif message_type == "ServerShuttingDown":
-            _LOGGER.warning("Emby server %s is shutting down", self.server_name)
-        # Phase 21: Library and user data events
-        elif message_type == "LibraryChanged":
-            self._handle_library_changed(data)
-        elif message_type == "UserDataChanged":
-            self._handle_user_data_changed(data)
-        elif message_type == "NotificationAdded":
-            self._handle_notification_added(data)
-        elif message_type in ("UserUpdated", "UserDeleted"):
-            self._handle_user_changed(message_type, data)
-        else:
+        handler = self._websocket_handlers.get(message_type)
+        if handler is None:
             _LOGGER.debug("Unhandled WebSocket message type: %s", message_type)
+            self.client.metrics.record_websocket_message(message_type)
+            return
+
+        start_time = time.perf_counter()
+        try:
+            handler(data)
+        finally:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self.client.metrics.record_websocket_message(message_type, duration_ms)
+
+    def _on_ws_sessions(self, data: Any) -> None:
+        """Handle Sessions message (direct session update from WebSocket)."""
+        self._process_sessions_data(data)
+
+    def _on_ws_playback_progress(self, data: Any) -> None:
+        """Handle PlaybackProgress message."""
+        self._note_session_activity()
+        # Track playback progress for watch time statistics (Phase 18)
+        self._track_playback_progress(data)
+        # Also trigger a refresh to get latest session state
+        self._trigger_debounced_refresh()
+
+    def _on_ws_playback_started(self, data: Any) -> None:
+        """Handle PlaybackStarted message."""
+        self._note_session_activity()
+        # Trigger a refresh to get latest session state (with debouncing)
+        self._trigger_debounced_refresh()
+
+    def _on_ws_playback_stopped(self, data: Any) -> None:
+        """Handle PlaybackStopped message."""
+        self._note_session_activity()
+        # Clean up playback session tracking when playback stops
+        self._cleanup_playback_session(data)
+        self._trigger_debounced_refresh()
+
+    def _on_ws_session_ended(self, data: Any) -> None:
+        """Handle SessionEnded message."""
+        # Clean up all tracking for a session that ended
+        self._cleanup_session_tracking(data)
+        self._trigger_debounced_refresh()
+
+    def _on_ws_server_restarting(self, data: Any) -> None:
+        """Handle ServerRestarting message."""
+        _LOGGER.info("Emby server %s is restarting", self.server_name)
+
+    def _on_ws_server_shutting_down(self, data: Any) -> None:
+        """Handle ServerShuttingDown message."""
+        _LOGGER.warning("Emby server %s is shutting down", self.server_name)
+
+    def _on_ws_library_changed(self, data: Any) -> None:
+        """Handle LibraryChanged message."""
+        self._handle_library_changed(data)
+
+    def _on_ws_user_data_changed(self, data: Any) -> None:
+        """Handle UserDataChanged message."""
+        self._handle_user_data_changed(data)
+
+    def _on_ws_notification_added(self, data: Any) -> None:
+        """Handle NotificationAdded message."""
+        self._handle_notification_added(data)
+
+    def _on_ws_user_updated(self, data: Any) -> None:
+        """Handle UserUpdated message."""
+        self._handle_user_changed("UserUpdated", data)
+
+    def _on_ws_user_deleted(self, data: Any) -> None:
+        """Handle UserDeleted message."""
+        self._handle_user_changed("UserDeleted", data)
+
+    def _on_ws_scheduled_tasks_info(self, data: Any) -> None:
+        """Handle ScheduledTasksInfo message (pushed scheduled task state)."""
+        if not isinstance(data, list):
+            return
+        runtime_data = getattr(self.config_entry, "runtime_data", None)
+        server_coordinator = getattr(runtime_data, "server_coordinator", None)
+        if server_coordinator is not None:
+            server_coordinator.async_set_scheduled_tasks(data)
+
+    async def _async_subscribe_scheduled_tasks(self, websocket: EmbyWebSocket) -> None:
+        """Subscribe to scheduled task pushes; polling covers a failure.
+
+        Args:
+            websocket: The connected WebSocket.
+        """
+        try:
+            await websocket.async_subscribe_scheduled_tasks(
+                interval_ms=SCHEDULED_TASKS_PUSH_INTERVAL_MS
+            )
+        except (RuntimeError, TypeError, aiohttp.ClientError) as err:
+            _LOGGER.debug(
+                "Failed to subscribe to scheduled task updates for %s: %s",
+                self.server_name,
+                err,
+            )
 
     def _trigger_debounced_refresh(self) -> None:
         """Trigger a refresh with debouncing to prevent excessive API calls."""
-        now = datetime.now()
-        if (
-            self._last_websocket_refresh is None
-            or now - self._last_websocket_refresh > WEBSOCKET_REFRESH_DEBOUNCE
-        ):
-            self._last_websocket_refresh = now
-            self.hass.async_create_task(self.async_refresh())
+        self._session_refresh.async_trigger()
+
+    async def _async_refresh_library(self) -> None:
+        """Apply queued library changes to the library counts (debounced)."""
+        runtime_data = getattr(self.config_entry, "runtime_data", None)
+        library_coordinator = getattr(runtime_data, "library_coordinator", None)
+        if library_coordinator is not None:
+            await library_coordinator.async_apply_library_changes()
+
+    async def _async_refresh_user_discovery(self) -> None:
+        """Refresh discovery data of users with changed user data."""
+        user_ids = self._user_data_refresh_users
+        self._user_data_refresh_users = set()
+        runtime_data = getattr(self.config_entry, "runtime_data", None)
+        discovery_coordinators = getattr(runtime_data, "discovery_coordinators", None) or {}
+        for user_id in user_ids:
+            coordinator = discovery_coordinators.get(user_id)
+            # Inactive coordinators were marked stale by the invalidation and
+            # are refreshed once their entities are in use again
+            if coordinator is not None and coordinator.active:
+                await coordinator.async_request_refresh()
 
     def _handle_websocket_connection(self, connected: bool) -> None:
         """Handle WebSocket connection state changes.
@@ -789,8 +1255,15 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
                 WEBSOCKET_POLL_INTERVAL,
             )
             self.update_interval = timedelta(seconds=WEBSOCKET_POLL_INTERVAL)  # type: ignore[misc]
+            # A reconnect (rather than the initial connect) needs a resync
+            if self._websocket_disconnected_at is not None:
+                gap_seconds = time.monotonic() - self._websocket_disconnected_at
+                self._websocket_disconnected_at = None
+                self.hass.async_create_task(self._async_resync_after_reconnect(gap_seconds))
         else:
             _LOGGER.warning("WebSocket disconnected from Emby server. Using polling fallback")
+            if self._websocket_disconnected_at is None:
+                self._websocket_disconnected_at = time.monotonic()
             # Reset WebSocket stability tracking (Issue #287)
             self._ws_consecutive_success = 0
             # Always restore configured polling interval on disconnect
@@ -806,6 +1279,78 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         # so library polling can be extended from 1 hour to 6 hours
         self._update_library_coordinator_websocket_status(connected)
 
+    async def _async_resync_after_reconnect(self, gap_seconds: float) -> None:
+        """Bring state back in sync after the WebSocket reconnected.
+
+        A new connection has no subscriptions and events sent during the gap
+        are lost, so this resubscribes to sessions, restarts the receive loop
+        and requests one session refresh. Caches are only invalidated when
+        the gap was long enough that missed LibraryChanged or UserDataChanged
+        events are likely.
+
+        Args:
+            gap_seconds: How long the WebSocket was disconnected.
+        """
+        websocket = self._websocket
+        if websocket is None or not websocket.connected:
+            return
+
+        try:
+            await websocket.async_subscribe_sessions(
+                interval_ms=self._interval_for_mode(self._subscription_mode)
+            )
+        except (RuntimeError, aiohttp.ClientError) as err:
+            _LOGGER.warning(
+                "Failed to resubscribe to WebSocket sessions for %s: %s",
+                self.server_name,
+                err,
+            )
+            return
+        await self._async_subscribe_scheduled_tasks(websocket)
+
+        if self._websocket_receive_task is None or self._websocket_receive_task.done():
+            self._websocket_receive_task = self.hass.async_create_task(
+                self._async_websocket_receive_loop()
+            )
+
+        invalidate = gap_seconds > WEBSOCKET_RESYNC_GAP_THRESHOLD
+        _LOGGER.info(
+            "WebSocket to %s reconnected after %.1f seconds, resyncing%s",
+            self.server_name,
+            gap_seconds,
+            " and invalidating caches" if invalidate else "",
+        )
+        if invalidate:
+            self._invalidate_caches_after_gap()
+        self.client.metrics.record_websocket_resync(gap_seconds, invalidate)
+
+        # Debounced, so this coalesces with any refresh already requested
+        await self.async_request_refresh()
+
+    def _invalidate_caches_after_gap(self) -> None:
+        """Invalidate caches that WebSocket events would have kept fresh."""
+        self.client.clear_browse_cache()
+        self._invalidate_all_discovery_caches()
+
+        runtime_data = getattr(self.config_entry, "runtime_data", None)
+        library_coordinator = getattr(runtime_data, "library_coordinator", None)
+        if library_coordinator is not None:
+            self.hass.async_create_task(library_coordinator.async_request_refresh())
+
+    def _handle_websocket_liveness_lost(self) -> None:
+        """Handle a WebSocket that missed its liveness deadline.
+
+        The connection is closed right after this returns, which restores
+        polling. Session updates may have been lost while the connection was
+        dead, so refresh now instead of waiting for the next poll.
+        """
+        _LOGGER.warning(
+            "WebSocket to %s stopped responding, refreshing sessions via polling",
+            self.server_name,
+        )
+        self.client.metrics.record_websocket_liveness_timeout()
+        self.hass.async_create_task(self.async_refresh())
+
     def _update_library_coordinator_websocket_status(self, connected: bool) -> None:
         """Update library coordinator's WebSocket status.
 
@@ -832,11 +1377,14 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             sessions_data: List of session data dictionaries from the API.
         """
         sessions: dict[str, EmbySession] = {}
+        # Apply the polling activity window so both paths see the same sessions
+        window = self.session_activity_window
+        cutoff = datetime.now(UTC) - timedelta(seconds=window) if window else None
 
         for session_data in sessions_data:
             try:
                 session = parse_session(session_data)
-                if session.supports_remote_control:
+                if session.supports_remote_control and not self._is_dormant(session, cutoff):
                     sessions[session.device_id] = session
 
                 # Track playback progress for sessions with active playback (Phase 18)
@@ -852,6 +1400,7 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
 
         # Fire events for session and playback changes using shared logic
         self._fire_session_change_events(sessions)
+        self._update_subscription_mode(sessions)
 
         # Update coordinator data and notify listeners
         self.async_set_updated_data(sessions)
@@ -870,12 +1419,14 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
 
         Called from both polling (_async_update_data) and WebSocket
         (_process_sessions_data) paths to ensure events fire reliably.
-        Fixes Issue #285.
+        Fixes Issue #285. Events are collected during the diff and fired
+        together once the update cycle's changes are known.
 
         Args:
             sessions: Current sessions dictionary keyed by device_id.
         """
         old_sessions = self.data or {}
+        events: list[tuple[str, str, dict[str, str | None] | None]] = []
         current_devices = set(sessions.keys())
         added = current_devices - self._previous_sessions
         removed = self._previous_sessions - current_devices
@@ -888,12 +1439,12 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
                 session.device_name,
                 session.client_name,
             )
-            self._fire_event(device_id, "session_connected")
+            events.append((device_id, "session_connected", None))
 
         # Fire session disconnected events for removed sessions
         for device_id in removed:
             _LOGGER.debug("Session removed: %s", device_id)
-            self._fire_event(device_id, "session_disconnected")
+            events.append((device_id, "session_disconnected", None))
 
         # Check for playback state changes in existing sessions
         for device_id, session in sessions.items():
@@ -901,16 +1452,18 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             if old_session is None:
                 # New session - check if it came in already playing
                 if session.now_playing is not None:
-                    self._fire_event(
-                        device_id,
-                        "playback_started",
-                        {
-                            "media_content_id": session.now_playing.item_id,
-                            "media_content_type": session.now_playing.media_type.value
-                            if session.now_playing.media_type
-                            else None,
-                            "media_title": session.now_playing.name,
-                        },
+                    events.append(
+                        (
+                            device_id,
+                            "playback_started",
+                            {
+                                "media_content_id": session.now_playing.item_id,
+                                "media_content_type": session.now_playing.media_type.value
+                                if session.now_playing.media_type
+                                else None,
+                                "media_title": session.now_playing.name,
+                            },
+                        )
                     )
                 continue
 
@@ -920,26 +1473,10 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
 
             if old_playing is None and new_playing is not None:
                 # Playback started
-                self._fire_event(
-                    device_id,
-                    "playback_started",
-                    {
-                        "media_content_id": new_playing.item_id,
-                        "media_content_type": new_playing.media_type.value
-                        if new_playing.media_type
-                        else None,
-                        "media_title": new_playing.name,
-                    },
-                )
-            elif old_playing is not None and new_playing is None:
-                # Playback stopped
-                self._fire_event(device_id, "playback_stopped")
-            elif old_playing is not None and new_playing is not None:
-                # Check for media change
-                if old_playing.item_id != new_playing.item_id:
-                    self._fire_event(
+                events.append(
+                    (
                         device_id,
-                        "media_changed",
+                        "playback_started",
                         {
                             "media_content_id": new_playing.item_id,
                             "media_content_type": new_playing.media_type.value
@@ -948,18 +1485,51 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
                             "media_title": new_playing.name,
                         },
                     )
+                )
+            elif old_playing is not None and new_playing is None:
+                # Playback stopped
+                events.append((device_id, "playback_stopped", None))
+            elif old_playing is not None and new_playing is not None:
+                # Check for media change
+                if old_playing.item_id != new_playing.item_id:
+                    events.append(
+                        (
+                            device_id,
+                            "media_changed",
+                            {
+                                "media_content_id": new_playing.item_id,
+                                "media_content_type": new_playing.media_type.value
+                                if new_playing.media_type
+                                else None,
+                                "media_title": new_playing.name,
+                            },
+                        )
+                    )
 
                 # Check pause state
                 old_paused = old_session.play_state.is_paused if old_session.play_state else False
                 new_paused = session.play_state.is_paused if session.play_state else False
                 if old_paused != new_paused:
                     if new_paused:
-                        self._fire_event(device_id, "playback_paused")
+                        events.append((device_id, "playback_paused", None))
                     else:
-                        self._fire_event(device_id, "playback_resumed")
+                        events.append((device_id, "playback_resumed", None))
 
         # Update previous sessions tracking
         self._previous_sessions = current_devices
+        self._fire_events(events)
+
+    def _fire_events(
+        self,
+        events: list[tuple[str, str, dict[str, str | None] | None]],
+    ) -> None:
+        """Fire a batch of Emby events collected during one update cycle.
+
+        Args:
+            events: (device_id, event_type, extra_data) tuples in firing order.
+        """
+        for device_id, event_type, extra_data in events:
+            self._fire_event(device_id, event_type, extra_data)
 
     def _fire_event(
         self,
@@ -996,12 +1566,20 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
     def _get_entity_id_for_device(self, device_id: str) -> str | None:
         """Get entity ID for a device ID.
 
+        Results are cached per device; the cache is filled when media player
+        entities are added and kept current from entity registry events, so
+        the registry is only consulted on the first lookup for a device.
+
         Args:
             device_id: The device ID to look up.
 
         Returns:
             Entity ID if found, None otherwise.
         """
+        if device_id in self._entity_ids:
+            return self._entity_ids[device_id]
+
+        self._async_track_entity_registry()
         entity_registry = er.async_get(self.hass)
 
         # The unique_id of our media_player entities is {server_id}_{device_id}
@@ -1009,8 +1587,70 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
         entity_id: str | None = entity_registry.async_get_entity_id(
             "media_player", DOMAIN, unique_id
         )
+        self._entity_ids[device_id] = entity_id
         return entity_id
 
+    @callback
+    def async_register_media_player(self, device_id: str, entity_id: str) -> None:
+        """Record the media player entity for a device.
+
+        Called when the entity is added to Home Assistant.
+
+        Args:
+            device_id: The device ID the entity represents.
+            entity_id: The entity's ID.
+        """
+        self._async_track_entity_registry()
+        self._entity_ids[device_id] = entity_id
+
+    @callback
+    def async_unregister_media_player(self, device_id: str) -> None:
+        """Forget the cached media player entity for a device.
+
+        Args:
+            device_id: The device ID whose entity was removed.
+        """
+        self._entity_ids.pop(device_id, None)
+
+    @callback
+    def _async_track_entity_registry(self) -> None:
+        """Subscribe to entity registry updates once."""
+        if self._unsub_entity_registry is not None:
+            return
+        self._unsub_entity_registry = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_entity_registry_updated,
+        )
+        self.config_entry.async_on_unload(self._unsub_entity_registry)
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Keep the device to entity ID cache current.
+
+        Args:
+            event: Entity registry updated event.
+        """
+        data = event.data
+        entity_id = data["entity_id"]
+        if not entity_id.startswith("media_player."):
+            return
+
+        action = data["action"]
+        if action == "create":
+            # A device looked up before its entity existed can now resolve
+            for device_id in [d for d, e in self._entity_ids.items() if e is None]:
+                del self._entity_ids[device_id]
+            return
+
+        old_entity_id = data.get("old_entity_id") if action == "update" else None
+        for device_id, cached in list(self._entity_ids.items()):
+            if action == "remove" and cached == entity_id:
+                del self._entity_ids[device_id]
+            elif old_entity_id is not None and cached == old_entity_id:
+                self._entity_ids[device_id] = entity_id
+
     # =========================================================================
     # Phase 21: WebSocket Event Handlers
     # =========================================================================
@@ -1054,18 +1694,14 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             len(library_data.get("ItemsRemoved", [])),
         )
 
-        # Trigger library coordinator refresh (in background, non-blocking)
-        # Use debounced delay to prevent excessive refreshes during bulk operations
+        # Update the library counts once the burst of changes settles
         runtime_data = getattr(self.config_entry, "runtime_data", None)
-        if runtime_data is not None and hasattr(runtime_data, "library_coordinator"):
-            library_coordinator = runtime_data.library_coordinator
-
-            async def _delayed_refresh() -> None:
-                """Refresh library coordinator after debounce delay."""
-                await asyncio.sleep(5)
-                await library_coordinator.async_request_refresh()
-
-            self.hass.async_create_task(_delayed_refresh())
+        library_coordinator = getattr(runtime_data, "library_coordinator", None)
+        if library_coordinator is not None:
+            library_coordinator.queue_library_changes(
+                library_data.get("ItemsAdded", []), library_data.get("ItemsRemoved", [])
+            )
+            self._library_refresh.async_trigger()
 
         # Invalidate discovery cache for all users (library content affects discovery)
         self._invalidate_all_discovery_caches()
@@ -1114,11 +1750,19 @@ class EmbyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EmbySession]]):
             len(user_data_list),
         )
 
-        # Invalidate discovery cache for affected users
-        affected_users = {item_data.get("UserId") for item_data in user_data_list}
-        for user_id in affected_users:
-            if user_id:
-                self._invalidate_discovery_cache_for_user(str(user_id))
+        # Invalidate the affected discovery sections of each user and refresh
+        # their discovery data once the burst of changes settles
+        items_by_user: dict[str, list[EmbyUserDataChangedItemData]] = {}
+        for item_data in user_data_list:
+            if user_id := item_data.get("UserId"):
+                items_by_user.setdefault(str(user_id), []).append(item_data)
+        for user_id, items in items_by_user.items():
+            coordinator = self._get_discovery_coordinator(user_id)
+            if coordinator is not None:
+                coordinator.on_user_data_changed(user_id, items)
+                self._user_data_refresh_users.add(user_id)
+        if self._user_data_refresh_users:
+            self._user_data_refresh.async_trigger()
 
     def _handle_notification_added(self, data: object) -> None:
         """Handle NotificationAdded WebSocket message.
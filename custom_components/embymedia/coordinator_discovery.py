@@ -1,16 +1,20 @@
 """Data update coordinator for discovery sensors (Phase 15).
 
-Includes caching to reduce redundant API calls (Issue #288).
+Includes caching to reduce redundant API calls (Issue #288). Discovery data
+is cached per section (next up, continue watching, ... and each user count)
+so that an event only refetches the sections it can have changed.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from datetime import timedelta
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any, Final, TypedDict, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -28,13 +32,42 @@ from .const import (
     UserCountsResult,
 )
 from .exceptions import EmbyConnectionError, EmbyError
+from .refresh_planner import planned_refresh
 
 if TYPE_CHECKING:
     from .api import EmbyClient
-    from .const import EmbyConfigEntry
+    from .const import EmbyConfigEntry, EmbyUserDataChangedItemData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Discovery sections, each cached and refetched independently
+LIST_SECTIONS: Final = ("next_up", "continue_watching", "recently_added", "suggestions")
+COUNT_SECTIONS: Final = ("favorites_count", "played_count", "resumable_count", "playlist_count")
+DISCOVERY_SECTIONS: Final = LIST_SECTIONS + COUNT_SECTIONS
+
+# Sections a user's PlaybackStopped event can change
+PLAYBACK_STOPPED_SECTIONS: Final = frozenset(
+    {"next_up", "continue_watching", "suggestions", "played_count", "resumable_count"}
+)
+
+# UserDataChanged field -> sections a change of that field can affect
+USER_DATA_FIELD_SECTIONS: Final[dict[str, frozenset[str]]] = {
+    "IsFavorite": frozenset({"favorites_count"}),
+    "Played": PLAYBACK_STOPPED_SECTIONS,
+    "PlaybackPositionTicks": frozenset({"continue_watching", "resumable_count"}),
+}
+_USER_DATA_FIELDS: Final = tuple(USER_DATA_FIELD_SECTIONS)
+
+# Items whose last known user data is kept for diffing UserDataChanged events
+USER_DATA_STATE_CACHE_SIZE: Final = 1000
+
+# Item-count filters for the count sections fetched one by one
+_COUNT_FILTERS: Final = {
+    "favorites_count": "IsFavorite",
+    "played_count": "IsPlayed",
+    "resumable_count": "IsResumable",
+}
+
 
 class EmbyUserCounts(TypedDict):
     """Type definition for user-specific item counts.
@@ -79,10 +112,18 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
     - Recently Added content
     - Personalized suggestions
 
-    Implements caching to reduce redundant API calls. Cache is invalidated on:
-    - UserDataChanged WebSocket event (user watched/favorited something)
-    - PlaybackStopped WebSocket event (user finished watching)
-    - LibraryChanged WebSocket event (new content added)
+    Implements caching to reduce redundant API calls. Each section is cached
+    separately and invalidated only by events that can change it:
+    - UserDataChanged WebSocket event: the sections of the changed fields,
+      e.g. only favorites_count for a favorite toggle
+    - PlaybackStopped WebSocket event: next up, continue watching,
+      suggestions and the played/resumable counts
+    - LibraryChanged WebSocket event: all sections
+
+    The coordinator is demand-driven: it is "active" only while at least one
+    enabled entity listens to it. Inactive coordinators are skipped by the
+    DiscoveryScheduler and only marked stale; activity listeners are told
+    when the first entity subscribes so stale data can be fetched on demand.
 
     This coordinator requires a user_id to fetch user-specific content.
 
@@ -99,8 +140,13 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
     config_entry: EmbyConfigEntry
     _user_id: str
     _user_name: str
+    _scan_interval: int
     _discovery_cache: BrowseCache
     _bypass_cache: bool
+    _stale: bool
+    _activity_listeners: list[Callable[[bool], None]]
+    _user_data_state: OrderedDict[str, tuple[object, ...]]
+    _sections_fetched: int
 
     def __init__(
         self,
@@ -135,9 +181,17 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
         self.config_entry = config_entry
         self._user_id = user_id
         self._user_name = user_name or user_id
+        self._scan_interval = scan_interval
         # Initialize discovery cache with configurable TTL (default 30 minutes)
         self._discovery_cache = BrowseCache(ttl_seconds=float(DISCOVERY_CACHE_TTL))
         self._bypass_cache = False
+        # True until fetched, and again after invalidation or a skipped refresh
+        self._stale = True
+        self._activity_listeners = []
+        # Item ID -> last known values of _USER_DATA_FIELDS, to tell which
+        # field a UserDataChanged event actually changed
+        self._user_data_state = OrderedDict()
+        self._sections_fetched = 0
 
     @property
     def user_id(self) -> str:
@@ -149,28 +203,172 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
         """Return the user name for display purposes."""
         return self._user_name
 
+    @property
+    def active(self) -> bool:
+        """Return True if any entity is listening to this coordinator."""
+        return bool(self._listeners)
+
+    @property
+    def stale(self) -> bool:
+        """Return True if the data is missing or known to be outdated."""
+        return self._stale
+
+    def mark_stale(self) -> None:
+        """Mark the data outdated, e.g. after skipping a refresh while inactive."""
+        self._stale = True
+
+    @callback
+    def async_add_activity_listener(self, listener: Callable[[bool], None]) -> CALLBACK_TYPE:
+        """Listen for the coordinator becoming active or inactive.
+
+        Args:
+            listener: Called with True when the first entity subscribes and
+                with False when the last one unsubscribes.
+
+        Returns:
+            Function removing the listener.
+        """
+        self._activity_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._activity_listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: object | None = None
+    ) -> CALLBACK_TYPE:
+        """Add an update listener, tracking activity changes.
+
+        Args:
+            update_callback: Callback invoked on data updates.
+            context: Optional listener context.
+
+        Returns:
+            Function removing the listener.
+        """
+        was_active = self.active
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not was_active:
+            self._notify_activity(True)
+
+        @callback
+        def _remove() -> None:
+            remove_listener()
+            if not self.active:
+                self._notify_activity(False)
+
+        return _remove
+
+    def _notify_activity(self, active: bool) -> None:
+        """Tell activity listeners the coordinator became (in)active.
+
+        Args:
+            active: Whether the coordinator is now active.
+        """
+        _LOGGER.debug(
+            "Discovery for user %s is now %s", self._user_id, "active" if active else "inactive"
+        )
+        for listener in list(self._activity_listeners):
+            listener(active)
+
     def get_cache_stats(self) -> dict[str, int]:
         """Get cache statistics for diagnostics.
 
         Returns:
-            Dictionary with hits, misses, and current entry count.
+            Dictionary with hits, misses, current entry count and the number
+            of sections fetched from the API.
         """
-        return self._discovery_cache.get_stats()
+        return {**self._discovery_cache.get_stats(), "sections_fetched": self._sections_fetched}
 
-    def invalidate_cache_for_user(self, user_id: str) -> None:
-        """Invalidate cache for a specific user.
+    def _section_key(self, section: str) -> str:
+        """Return the cache key of a discovery section.
+
+        Args:
+            section: Section name from DISCOVERY_SECTIONS.
+
+        Returns:
+            The cache key.
+        """
+        return f"discovery_{self._user_id}_{section}"
 
-        Called when UserDataChanged WebSocket event is received for this user.
+    def invalidate_sections(self, sections: Iterable[str]) -> None:
+        """Invalidate the given discovery sections.
+
+        Args:
+            sections: Section names from DISCOVERY_SECTIONS.
+        """
+        for section in sections:
+            self._discovery_cache.delete(self._section_key(section))
+        self._stale = True
+
+    def invalidate_cache_for_user(self, user_id: str) -> None:
+        """Invalidate all cached sections for a specific user.
 
         Args:
             user_id: The user ID whose cache should be invalidated.
         """
         if user_id == self._user_id:
+            _LOGGER.debug("Invalidating discovery cache for user %s", user_id)
+            self._discovery_cache.clear()
+            self._stale = True
+
+    def on_user_data_changed(
+        self, user_id: str, items: Sequence[EmbyUserDataChangedItemData]
+    ) -> None:
+        """Handle UserDataChanged event for cache invalidation.
+
+        Only the sections affected by the fields that changed are invalidated.
+        An item without known previous user data invalidates every section
+        a user data change can affect.
+
+        Args:
+            user_id: The user ID whose user data changed.
+            items: The user's changed items from the event.
+        """
+        if user_id != self._user_id:
+            return
+        sections: set[str] = set()
+        for item in items:
+            item_id = item.get("ItemId")
+            if not item_id:
+                continue
+            state = tuple(item.get(field) for field in _USER_DATA_FIELDS)
+            previous = self._remember_user_data(item_id, state)
+            if previous is None:
+                for affected in USER_DATA_FIELD_SECTIONS.values():
+                    sections |= affected
+                continue
+            for field, old, new in zip(_USER_DATA_FIELDS, previous, state, strict=True):
+                if old != new:
+                    sections |= USER_DATA_FIELD_SECTIONS[field]
+        if sections:
             _LOGGER.debug(
-                "Invalidating discovery cache for user %s (UserDataChanged)",
+                "Invalidating discovery sections %s for user %s (UserDataChanged)",
+                sorted(sections),
                 user_id,
             )
-            self._discovery_cache.clear()
+            self.invalidate_sections(sections)
+
+    def _remember_user_data(
+        self, item_id: str, state: tuple[object, ...]
+    ) -> tuple[object, ...] | None:
+        """Store an item's user data state.
+
+        Args:
+            item_id: The item ID.
+            state: Values of _USER_DATA_FIELDS.
+
+        Returns:
+            The previously stored state, or None if the item was unknown.
+        """
+        previous = self._user_data_state.pop(item_id, None)
+        self._user_data_state[item_id] = state
+        if len(self._user_data_state) > USER_DATA_STATE_CACHE_SIZE:
+            self._user_data_state.popitem(last=False)
+        return previous
 
     def on_playback_stopped(self, user_id: str) -> None:
         """Handle PlaybackStopped event for cache invalidation.
@@ -185,7 +383,7 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
                 "Invalidating discovery cache for user %s (PlaybackStopped)",
                 user_id,
             )
-            self._discovery_cache.clear()
+            self.invalidate_sections(PLAYBACK_STOPPED_SECTIONS)
 
     def on_library_changed(self) -> None:
         """Handle LibraryChanged event for cache invalidation.
@@ -197,6 +395,7 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
             self._user_id,
         )
         self._discovery_cache.clear()
+        self._stale = True
 
     async def async_force_refresh(self) -> EmbyDiscoveryData:
         """Force a refresh of discovery data, bypassing cache.
@@ -214,10 +413,9 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
     async def _async_update_data(self) -> EmbyDiscoveryData:
         """Fetch discovery data from Emby server.
 
-        Uses caching to avoid redundant API calls. Cache is checked first,
-        and only fetches from API on cache miss or when bypassing cache.
-
-        Uses asyncio.gather() to fetch all data in parallel for improved performance.
+        Uses caching to avoid redundant API calls. Each section is read from
+        the cache first, and only sections missing from it (or all of them
+        when bypassing the cache) are fetched, in parallel.
 
         Returns:
             Discovery data including next up, continue watching,
@@ -226,74 +424,144 @@ class EmbyDiscoveryCoordinator(DataUpdateCoordinator[EmbyDiscoveryData]):
         Raises:
             UpdateFailed: If fetching data fails.
         """
-        cache_key = f"discovery_{self._user_id}"
-
-        # Check cache first (unless bypassing)
-        if not self._bypass_cache:
-            cached_data = self._discovery_cache.get(cache_key)
-            if cached_data is not None:
-                _LOGGER.debug(
-                    "Discovery cache hit for user %s",
-                    self._user_id,
-                )
-                return cached_data  # type: ignore[return-value]
+        sections: dict[str, Any] = {}
+        missing: list[str] = []
+        for section in DISCOVERY_SECTIONS:
+            cached = (
+                None
+                if self._bypass_cache
+                else self._discovery_cache.get(self._section_key(section))
+            )
+            if cached is None:
+                missing.append(section)
+            else:
+                sections[section] = cached
 
-        _LOGGER.debug(
-            "Discovery cache miss for user %s - fetching from API",
-            self._user_id,
+        if missing:
+            _LOGGER.debug(
+                "Discovery cache miss for user %s - fetching %s from API",
+                self._user_id,
+                ", ".join(missing),
+            )
+            try:
+                async with planned_refresh(
+                    self.config_entry,
+                    f"discovery_{self._user_id}",
+                    interval=self._scan_interval,
+                    demand=self.active,
+                ):
+                    fetched = await self._async_fetch_sections(missing)
+            except EmbyConnectionError as err:
+                raise UpdateFailed(f"Failed to connect to Emby server: {err}") from err
+            except EmbyError as err:
+                raise UpdateFailed(f"Error fetching discovery data: {err}") from err
+
+            self._sections_fetched += len(fetched)
+            for section, value in fetched.items():
+                self._discovery_cache.set(self._section_key(section), value)
+                if section in LIST_SECTIONS:
+                    self._remember_list_user_data(value)
+            sections.update(fetched)
+        else:
+            _LOGGER.debug("Discovery cache hit for user %s", self._user_id)
+
+        self._stale = False
+        return EmbyDiscoveryData(
+            next_up=sections["next_up"],
+            continue_watching=sections["continue_watching"],
+            recently_added=sections["recently_added"],
+            suggestions=sections["suggestions"],
+            user_counts=EmbyUserCounts(
+                favorites_count=sections["favorites_count"],
+                played_count=sections["played_count"],
+                resumable_count=sections["resumable_count"],
+                playlist_count=sections["playlist_count"],
+            ),
         )
 
-        try:
-            # Fetch all discovery data in parallel using asyncio.gather()
-            # Uses async_get_all_user_counts batch method to consolidate
-            # 4 user count API calls into a single parallel operation (#291)
-            results: tuple[
-                list[NextUpItem],
-                list[ResumableItem],
-                list[LatestMediaItem],
-                list[SuggestionItem],
-                UserCountsResult,
-            ] = await asyncio.gather(
-                self.client.async_get_next_up(user_id=self._user_id),
-                self.client.async_get_resumable_items(user_id=self._user_id),
-                self.client.async_get_latest_media(user_id=self._user_id),
-                self.client.async_get_suggestions(user_id=self._user_id),
-                self.client.async_get_all_user_counts(user_id=self._user_id),
-            )
+    async def _async_fetch_sections(self, sections: Sequence[str]) -> dict[str, Any]:
+        """Fetch discovery sections from the API in parallel.
 
-            next_up = results[0]
-            continue_watching = results[1]
-            recently_added = results[2]
-            suggestions = results[3]
-            user_counts_result = results[4]
-
-            user_counts = EmbyUserCounts(
-                favorites_count=user_counts_result["favorites_count"],
-                played_count=user_counts_result["played_count"],
-                resumable_count=user_counts_result["resumable_count"],
-                playlist_count=user_counts_result["playlist_count"],
-            )
+        When every count is needed the batch async_get_all_user_counts (#291)
+        is used; otherwise only the needed counts are fetched.
 
-            data = EmbyDiscoveryData(
-                next_up=next_up,
-                continue_watching=continue_watching,
-                recently_added=recently_added,
-                suggestions=suggestions,
-                user_counts=user_counts,
-            )
+        Args:
+            sections: Section names to fetch.
 
-            # Store in cache
-            self._discovery_cache.set(cache_key, data)
+        Returns:
+            Section name -> fetched value.
+        """
+        user_id = self._user_id
+        batch_counts = all(section in sections for section in COUNT_SECTIONS)
+        names: list[str | None] = []
+        calls: list[Awaitable[Any]] = []
+        for section in sections:
+            if section in COUNT_SECTIONS and batch_counts:
+                continue
+            names.append(section)
+            if section == "next_up":
+                calls.append(self.client.async_get_next_up(user_id=user_id))
+            elif section == "continue_watching":
+                calls.append(self.client.async_get_resumable_items(user_id=user_id))
+            elif section == "recently_added":
+                calls.append(self.client.async_get_latest_media(user_id=user_id))
+            elif section == "suggestions":
+                calls.append(self.client.async_get_suggestions(user_id=user_id))
+            elif section == "playlist_count":
+                calls.append(self._async_get_playlist_count())
+            else:
+                calls.append(
+                    self.client.async_get_user_item_count(
+                        user_id=user_id, filters=_COUNT_FILTERS[section]
+                    )
+                )
+        if batch_counts:
+            names.append(None)
+            calls.append(self.client.async_get_all_user_counts(user_id=user_id))
 
-            return data
+        results = await asyncio.gather(*calls)
 
-        except EmbyConnectionError as err:
-            raise UpdateFailed(f"Failed to connect to Emby server: {err}") from err
-        except EmbyError as err:
-            raise UpdateFailed(f"Error fetching discovery data: {err}") from err
+        fetched: dict[str, Any] = {}
+        for name, result in zip(names, results, strict=True):
+            if name is None:
+                # UserCountsResult is keyed by the count section names
+                fetched.update(cast(UserCountsResult, result))
+            else:
+                fetched[name] = result
+        return fetched
+
+    async def _async_get_playlist_count(self) -> int:
+        """Get the number of the user's playlists.
+
+        Returns:
+            The playlist count.
+        """
+        return len(await self.client.async_get_playlists(user_id=self._user_id))
+
+    def _remember_list_user_data(self, items: Iterable[Any]) -> None:
+        """Record the user data of fetched items as their known state.
+
+        Lets a later UserDataChanged event for these items be narrowed down
+        to the fields that changed.
+
+        Args:
+            items: Items of a fetched list section.
+        """
+        for item in items:
+            item_id = item.get("Id")
+            user_data = item.get("UserData")
+            if item_id and user_data:
+                self._remember_user_data(
+                    item_id, tuple(user_data.get(field) for field in _USER_DATA_FIELDS)
+                )
 
 
 __all__ = [
+    "COUNT_SECTIONS",
+    "DISCOVERY_SECTIONS",
+    "LIST_SECTIONS",
+    "PLAYBACK_STOPPED_SECTIONS",
+    "USER_DATA_FIELD_SECTIONS",
     "EmbyDiscoveryCoordinator",
     "EmbyDiscoveryData",
     "EmbyUserCounts",
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict, deque
 from datetime import timedelta
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any, Final, TypedDict, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -28,8 +30,11 @@ from .const import (
     EmbyVirtualFolder,
 )
 from .exceptions import EmbyConnectionError, EmbyError
+from .refresh_planner import planned_refresh
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
     from .api import EmbyClient
     from .const import EmbyConfigEntry
 
@@ -40,6 +45,55 @@ _LOGGER = logging.getLogger(__name__)
 # 6 hours = 21600 seconds (WebSocket will trigger immediate refresh on changes)
 WEBSOCKET_LIBRARY_SCAN_INTERVAL = 21600
 
+# Item type -> library count adjusted incrementally from LibraryChanged deltas
+ITEM_TYPE_COUNT_KEYS: Final[dict[str, str]] = {
+    "Movie": "movie_count",
+    "Series": "series_count",
+    "Episode": "episode_count",
+    "MusicArtist": "artist_count",
+    "MusicAlbum": "album_count",
+    "Audio": "song_count",
+}
+# Item types whose changes need a full recount (libraries, collections)
+RECOUNT_ITEM_TYPES: Final = frozenset({"BoxSet", "CollectionFolder"})
+# Types of added items are remembered (LRU) so their removal can be applied
+# incrementally; removed items can no longer be looked up
+ITEM_TYPE_CACHE_SIZE = 10000
+
+# Server data parts that change rarely are refetched at most this often
+# (seconds); the others are fetched on every regular poll
+SERVER_PART_INTERVALS: Final[dict[str, int]] = {
+    "live_tv": 900,
+    "devices": 1800,
+    "plugins": 86400,
+}
+# Poll interval while a library scan runs. The extra polls only fetch the
+# scheduled tasks, keeping the scan progress fresh.
+LIBRARY_SCAN_POLL_INTERVAL: Final = 10
+# Tolerance (seconds) for a part fetched one poll interval ago to count as due
+# again, as polls are not scheduled to the exact second
+_SERVER_PART_AGE_SLACK: Final = 2.0
+# Parts pushed over the WebSocket (scheduled tasks) are only polled when no
+# push arrived for this many seconds
+SERVER_PUSH_TIMEOUT: Final = 30.0
+
+# Activity log entries kept in memory (newest first) as recent_activities
+ACTIVITY_LOG_BUFFER_SIZE: Final = 20
+# Entries per request, and requests at most per poll, when fetching the
+# entries added since the newest one seen
+ACTIVITY_LOG_PAGE_SIZE: Final = 50
+ACTIVITY_LOG_MAX_PAGES: Final = 5
+
+# Live TV data used when Live TV info cannot be fetched (e.g. not configured)
+_LIVE_TV_DISABLED: Final[dict[str, bool | int]] = {
+    "live_tv_enabled": False,
+    "live_tv_tuner_count": 0,
+    "live_tv_active_recordings": 0,
+    "recording_count": 0,
+    "scheduled_timer_count": 0,
+    "series_timer_count": 0,
+}
+
 
 class EmbyServerData(TypedDict, total=False):
     """Type definition for server coordinator data."""
@@ -112,6 +166,13 @@ class EmbyServerCoordinator(DataUpdateCoordinator[EmbyServerData]):
     - Update availability
     - Scheduled task status
 
+    Each part of the data is fetched on its own schedule and cached between
+    fetches: scheduled tasks on every poll (unless pushed over the
+    WebSocket), server info and the activity log on every regular poll, and
+    Live TV, devices and plugins at most every SERVER_PART_INTERVALS seconds.
+    While a library scan runs the coordinator polls every
+    LIBRARY_SCAN_POLL_INTERVAL seconds, fetching only the tasks.
+
     Attributes:
         client: The Emby API client instance.
         server_id: The Emby server ID.
@@ -123,6 +184,15 @@ class EmbyServerCoordinator(DataUpdateCoordinator[EmbyServerData]):
     server_id: str
     server_name: str
     config_entry: EmbyConfigEntry
+    data: EmbyServerData
+    _scan_interval: int
+    _part_intervals: dict[str, float]
+    _parts: dict[str, tuple[float, Any]]
+    _scan_active: bool
+    _pushed_at: dict[str, float]
+    _activities: deque[EmbyActivityLogEntry]
+    _activity_total: int
+    _activity_cursor: EmbyActivityLogEntry | None
 
     def __init__(
         self,
@@ -162,11 +232,42 @@ class EmbyServerCoordinator(DataUpdateCoordinator[EmbyServerData]):
         self.server_id = server_id
         self.server_name = server_name
         self.config_entry = config_entry
+        self._scan_interval = effective_interval
+        # Minimum seconds between fetches of each part (0 = every poll)
+        self._part_intervals = {
+            "server_info": effective_interval,
+            "scheduled_tasks": 0,
+            "activity_log": effective_interval,
+            **{
+                part: max(interval, effective_interval)
+                for part, interval in SERVER_PART_INTERVALS.items()
+            },
+        }
+        # Part -> (monotonic time of the last successful fetch, value)
+        self._parts = {}
+        self._scan_active = False
+        # Part -> monotonic time of the latest WebSocket push
+        self._pushed_at = {}
+        # Ring buffer of recent activity, newest first, and the newest entry
+        # seen (cursor of the incremental fetch)
+        self._activities = deque(maxlen=ACTIVITY_LOG_BUFFER_SIZE)
+        self._activity_total = 0
+        self._activity_cursor = None
 
     async def _async_update_data(self) -> EmbyServerData:
+        """Fetch server data within the refresh planner's request budget.
+
+        Returns:
+            Server data including version, restart status, and scheduled tasks.
+        """
+        async with planned_refresh(self.config_entry, "server", interval=self._scan_interval):
+            return await self._async_fetch_server_data()
+
+    async def _async_fetch_server_data(self) -> EmbyServerData:
         """Fetch server data from Emby server.
 
-        Uses asyncio.gather() to fetch independent data in parallel for improved performance.
+        Only parts that are due are fetched, in parallel using asyncio.gather();
+        the others are taken from the cache.
 
         Returns:
             Server data including version, restart status, and scheduled tasks.
@@ -175,8 +276,7 @@ class EmbyServerCoordinator(DataUpdateCoordinator[EmbyServerData]):
             UpdateFailed: If fetching data fails.
         """
         try:
-            # Fetch all data in parallel using asyncio.gather()
-            # Server info is fetched with others but processed first for error handling
+            now = time.monotonic()
             (
                 server_info,
                 tasks,
@@ -185,28 +285,29 @@ class EmbyServerCoordinator(DataUpdateCoordinator[EmbyServerData]):
                 devices_data,
                 plugins,
             ) = await asyncio.gather(
-                self.client.async_get_server_info(),
-                self._fetch_scheduled_tasks_safe(),
-                self._fetch_live_tv_info_safe(),
-                self._fetch_activity_log_safe(),
-                self._fetch_devices_safe(),
-                self._fetch_plugins_safe(),
+                self._async_fetch_part("server_info", self.client.async_get_server_info, now),
+                self._async_fetch_part(
+                    "scheduled_tasks", self.client.async_get_scheduled_tasks, now, list
+                ),
+                self._async_fetch_part(
+                    "live_tv", self._fetch_live_tv_info, now, lambda: dict(_LIVE_TV_DISABLED)
+                ),
+                self._async_fetch_part(
+                    "activity_log",
+                    self._fetch_activity_log,
+                    now,
+                    lambda: {"Items": [], "TotalRecordCount": 0},
+                ),
+                self._async_fetch_part("devices", self._fetch_devices, now, lambda: {"Items": []}),
+                self._async_fetch_part("plugins", self.client.async_get_plugins, now, list),
             )
 
-            # Calculate running tasks and library scan status
-            running_tasks = [t for t in tasks if t.get("State") == "Running"]
-            running_tasks_count = len(running_tasks)
-
-            # Check for library scan task
-            library_scan_active = False
-            library_scan_progress: float | None = None
-            for task in running_tasks:
-                task_key = task.get("Key", "")
-                task_name = task.get("Name", "").lower()
-                if "library" in task_key.lower() or "scan" in task_name or "refresh" in task_name:
-                    library_scan_active = True
-                    library_scan_progress = task.get("CurrentProgressPercentage")
-                    break
+            task_data = self._task_data(tasks)
+            # Pushed task updates keep the scan progress fresh on their own
+            self._set_poll_interval(
+                task_data["library_scan_active"]
+                and "scheduled_tasks" not in self._pushed_parts(now)
+            )
 
             # Extract Live TV data
             live_tv_enabled = live_tv_data.get("live_tv_enabled", False)
@@ -235,10 +336,10 @@ class EmbyServerCoordinator(DataUpdateCoordinator[EmbyServerData]):
                 server_version=str(server_info.get("Version", "Unknown")),
                 has_pending_restart=bool(server_info.get("HasPendingRestart", False)),
                 has_update_available=bool(server_info.get("HasUpdateAvailable", False)),
-                scheduled_tasks=tasks,
-                running_tasks_count=running_tasks_count,
-                library_scan_active=library_scan_active,
-                library_scan_progress=library_scan_progress,
+                scheduled_tasks=task_data["scheduled_tasks"],
+                running_tasks_count=task_data["running_tasks_count"],
+                library_scan_active=task_data["library_scan_active"],
+                library_scan_progress=task_data["library_scan_progress"],
                 live_tv_enabled=bool(live_tv_enabled),
                 live_tv_tuner_count=live_tv_tuner_count,
                 live_tv_active_recordings=live_tv_active_recordings,
@@ -258,120 +359,271 @@ class EmbyServerCoordinator(DataUpdateCoordinator[EmbyServerData]):
         except EmbyError as err:
             raise UpdateFailed(f"Error fetching server data: {err}") from err
 
-    async def _fetch_scheduled_tasks_safe(self) -> list[EmbyScheduledTask]:
-        """Fetch scheduled tasks with graceful error handling.
+    @callback
+    def async_set_scheduled_tasks(self, tasks: list[EmbyScheduledTask]) -> None:
+        """Apply scheduled task state pushed over the WebSocket.
+
+        While pushes keep arriving, polls reuse the pushed tasks instead of
+        fetching /ScheduledTasks. Listeners are only updated when the tasks
+        changed, without rescheduling the next poll.
+
+        Args:
+            tasks: Scheduled tasks from a ScheduledTasksInfo message.
+        """
+        now = time.monotonic()
+        self._pushed_at["scheduled_tasks"] = now
+        previous = self._parts.get("scheduled_tasks")
+        self._parts["scheduled_tasks"] = (now, tasks)
+        if self.data is None or (previous is not None and previous[1] == tasks):
+            return
+        data: dict[str, Any] = dict(self.data)
+        data.update(self._task_data(tasks))
+        self.data = cast(EmbyServerData, data)
+        self.async_update_listeners()
+
+    def _pushed_parts(self, now: float) -> set[str]:
+        """Return the parts kept fresh by WebSocket pushes.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Names of the parts pushed within SERVER_PUSH_TIMEOUT seconds.
+        """
+        return {
+            part
+            for part, pushed_at in self._pushed_at.items()
+            if now - pushed_at < SERVER_PUSH_TIMEOUT
+        }
+
+    @staticmethod
+    def _task_data(tasks: list[EmbyScheduledTask]) -> dict[str, Any]:
+        """Derive the task fields of the server data.
+
+        Args:
+            tasks: All scheduled tasks.
+
+        Returns:
+            The scheduled_tasks, running_tasks_count, library_scan_active and
+            library_scan_progress fields.
+        """
+        # Calculate running tasks and library scan status
+        running_tasks = [t for t in tasks if t.get("State") == "Running"]
+
+        # Check for library scan task
+        library_scan_active = False
+        library_scan_progress: float | None = None
+        for task in running_tasks:
+            task_key = task.get("Key", "")
+            task_name = task.get("Name", "").lower()
+            if "library" in task_key.lower() or "scan" in task_name or "refresh" in task_name:
+                library_scan_active = True
+                library_scan_progress = task.get("CurrentProgressPercentage")
+                break
+
+        return {
+            "scheduled_tasks": tasks,
+            "running_tasks_count": len(running_tasks),
+            "library_scan_active": library_scan_active,
+            "library_scan_progress": library_scan_progress,
+        }
+
+    async def _async_fetch_part(
+        self,
+        part: str,
+        fetch: Callable[[], Awaitable[Any]],
+        now: float,
+        default: Callable[[], Any] | None = None,
+    ) -> Any:
+        """Fetch one part of the server data if it is due.
+
+        Args:
+            part: Part name, a key of the part intervals.
+            fetch: Coroutine function fetching the part.
+            now: Monotonic time of the current refresh.
+            default: Factory of the value to use when an optional part cannot
+                be fetched and nothing is cached. Errors of parts without a
+                default are raised.
 
         Returns:
-            List of scheduled tasks, or empty list on failure.
+            The fetched value, or the cached one if the part is not due yet
+            or failed to fetch.
         """
+        cached = self._parts.get(part)
+        if cached is not None:
+            fetched_at, value = cached
+            if now - fetched_at < self._part_intervals[
+                part
+            ] - _SERVER_PART_AGE_SLACK or part in self._pushed_parts(now):
+                return value
         try:
-            return await self.client.async_get_scheduled_tasks()
+            value = await fetch()
         except (EmbyError, TypeError, AttributeError):
-            _LOGGER.debug("Could not fetch scheduled tasks")
-            return []
+            if default is None:
+                raise
+            # Not cached, so the part is retried on the next poll
+            _LOGGER.debug("Could not fetch %s", part.replace("_", " "))
+            return cached[1] if cached is not None else default()
+        self._parts[part] = (now, value)
+        return value
 
-    async def _fetch_live_tv_info_safe(self) -> dict[str, bool | int]:
-        """Fetch Live TV info with graceful error handling.
+    def _set_poll_interval(self, library_scan_active: bool) -> None:
+        """Poll faster while a library scan runs, at the regular interval otherwise.
+
+        Args:
+            library_scan_active: Whether a library scan task is running.
+        """
+        if library_scan_active == self._scan_active:
+            return
+        self._scan_active = library_scan_active
+        interval = self._scan_interval
+        if library_scan_active:
+            interval = min(interval, LIBRARY_SCAN_POLL_INTERVAL)
+        _LOGGER.debug(
+            "%s server poll interval set to %d seconds (library scan %s)",
+            self.server_name,
+            interval,
+            "running" if library_scan_active else "idle",
+        )
+        self.update_interval = timedelta(seconds=interval)  # type: ignore[misc]
+
+    async def _fetch_live_tv_info(self) -> dict[str, bool | int]:
+        """Fetch Live TV info, degrading timer and recording counts to 0 on errors.
 
         Returns:
-            Dictionary with Live TV data, or defaults on failure.
+            Dictionary with Live TV data.
         """
-        try:
-            live_tv_info = await self.client.async_get_live_tv_info()
-            live_tv_enabled = bool(live_tv_info.get("IsEnabled", False))
-            live_tv_tuner_count: int = live_tv_info.get("TunerCount", 0)
-            live_tv_active_recordings: int = live_tv_info.get("ActiveRecordingCount", 0)
-
-            recording_count = 0
-            scheduled_timer_count = 0
-            series_timer_count = 0
-
-            # Fetch recording and timer counts if Live TV is enabled
-            if live_tv_enabled:
-                # Fetch timers in parallel
+        live_tv_info = await self.client.async_get_live_tv_info()
+        live_tv_enabled = bool(live_tv_info.get("IsEnabled", False))
+        live_tv_tuner_count: int = live_tv_info.get("TunerCount", 0)
+        live_tv_active_recordings: int = live_tv_info.get("ActiveRecordingCount", 0)
+
+        recording_count = 0
+        scheduled_timer_count = 0
+        series_timer_count = 0
+
+        # Fetch recording and timer counts if Live TV is enabled
+        if live_tv_enabled:
+            # Fetch timers in parallel
+            try:
+                timers, series_timers = await asyncio.gather(
+                    self.client.async_get_timers(),
+                    self.client.async_get_series_timers(),
+                )
+                scheduled_timer_count = len(timers)
+                series_timer_count = len(series_timers)
+            except (EmbyError, TypeError, AttributeError):
+                pass
+
+            # Get recording count from recordings API
+            enabled_users: list[str] = live_tv_info.get("EnabledUsers", [])
+            if enabled_users:
                 try:
-                    timers, series_timers = await asyncio.gather(
-                        self.client.async_get_timers(),
-                        self.client.async_get_series_timers(),
-                    )
-                    scheduled_timer_count = len(timers)
-                    series_timer_count = len(series_timers)
+                    recordings = await self.client.async_get_recordings(user_id=enabled_users[0])
+                    recording_count = len(recordings)
                 except (EmbyError, TypeError, AttributeError):
                     pass
 
-                # Get recording count from recordings API
-                enabled_users: list[str] = live_tv_info.get("EnabledUsers", [])
-                if enabled_users:
-                    try:
-                        recordings = await self.client.async_get_recordings(
-                            user_id=enabled_users[0]
-                        )
-                        recording_count = len(recordings)
-                    except (EmbyError, TypeError, AttributeError):
-                        pass
-
-            return {
-                "live_tv_enabled": live_tv_enabled,
-                "live_tv_tuner_count": live_tv_tuner_count,
-                "live_tv_active_recordings": live_tv_active_recordings,
-                "recording_count": recording_count,
-                "scheduled_timer_count": scheduled_timer_count,
-                "series_timer_count": series_timer_count,
-            }
-        except (EmbyError, TypeError, AttributeError):
-            _LOGGER.debug("Could not fetch Live TV info, Live TV may not be configured")
-            return {
-                "live_tv_enabled": False,
-                "live_tv_tuner_count": 0,
-                "live_tv_active_recordings": 0,
-                "recording_count": 0,
-                "scheduled_timer_count": 0,
-                "series_timer_count": 0,
-            }
-
-    async def _fetch_activity_log_safe(self) -> dict[str, list[EmbyActivityLogEntry] | int]:
-        """Fetch activity log with graceful error handling.
+        return {
+            "live_tv_enabled": live_tv_enabled,
+            "live_tv_tuner_count": live_tv_tuner_count,
+            "live_tv_active_recordings": live_tv_active_recordings,
+            "recording_count": recording_count,
+            "scheduled_timer_count": scheduled_timer_count,
+            "series_timer_count": series_timer_count,
+        }
+
+    async def _fetch_activity_log(self) -> dict[str, list[EmbyActivityLogEntry] | int]:
+        """Fetch the activity log entries added since the last fetch.
+
+        The first fetch loads the latest ACTIVITY_LOG_BUFFER_SIZE entries.
+        Later fetches only ask for entries from the date of the newest entry
+        seen (MinDate), page until they reach it, add the new entries to the
+        ring buffer and fire an embymedia_activity event for each.
 
         Returns:
-            Dictionary with activity log data, or empty defaults on failure.
+            Dictionary with the buffered entries (newest first) and total count.
         """
-        try:
+        cursor = self._activity_cursor
+        if cursor is None:
             response = await self.client.async_get_activity_log(
                 start_index=0,
-                limit=20,
+                limit=ACTIVITY_LOG_BUFFER_SIZE,
             )
-            return {
-                "Items": response.get("Items", []),
-                "TotalRecordCount": response.get("TotalRecordCount", 0),
-            }
-        except (EmbyError, TypeError, AttributeError):
-            _LOGGER.debug("Could not fetch activity log")
-            return {"Items": [], "TotalRecordCount": 0}
+            items = response.get("Items", [])
+            self._activities.extend(items)
+            self._activity_total = response.get("TotalRecordCount", 0)
+            if items:
+                self._activity_cursor = items[0]
+            return self._activity_log_data()
+
+        last_id = cursor.get("Id", 0)
+        new_entries: dict[int, EmbyActivityLogEntry] = {}
+        for page in range(ACTIVITY_LOG_MAX_PAGES):
+            response = await self.client.async_get_activity_log(
+                start_index=page * ACTIVITY_LOG_PAGE_SIZE,
+                limit=ACTIVITY_LOG_PAGE_SIZE,
+                min_date=cursor.get("Date"),
+            )
+            items = response.get("Items", [])
+            fresh = [entry for entry in items if entry.get("Id", 0) > last_id]
+            new_entries.update((entry.get("Id", 0), entry) for entry in fresh)
+            # Entries are returned newest first: stop at the cursor or last page
+            if len(fresh) < len(items) or len(items) < ACTIVITY_LOG_PAGE_SIZE:
+                break
+        else:
+            _LOGGER.debug(
+                "More than %d new activity log entries, older ones skipped",
+                ACTIVITY_LOG_MAX_PAGES * ACTIVITY_LOG_PAGE_SIZE,
+            )
+
+        for entry_id in sorted(new_entries):
+            entry = new_entries[entry_id]
+            self._activities.appendleft(entry)
+            self._fire_activity_event(entry)
+        if new_entries:
+            self._activity_total += len(new_entries)
+            self._activity_cursor = self._activities[0]
+        return self._activity_log_data()
 
-    async def _fetch_devices_safe(self) -> dict[str, list[EmbyDeviceInfo]]:
-        """Fetch devices with graceful error handling.
+    def _activity_log_data(self) -> dict[str, list[EmbyActivityLogEntry] | int]:
+        """Return the buffered activity log.
 
         Returns:
-            Dictionary with devices data, or empty defaults on failure.
+            Dictionary with the buffered entries (newest first) and total count.
         """
-        try:
-            response = await self.client.async_get_devices()
-            return {"Items": response.get("Items", [])}
-        except (EmbyError, TypeError, AttributeError):
-            _LOGGER.debug("Could not fetch devices")
-            return {"Items": []}
+        return {"Items": list(self._activities), "TotalRecordCount": self._activity_total}
 
-    async def _fetch_plugins_safe(self) -> list[EmbyPlugin]:
-        """Fetch plugins with graceful error handling.
+    def _fire_activity_event(self, entry: EmbyActivityLogEntry) -> None:
+        """Fire a Home Assistant event for a new activity log entry.
+
+        Args:
+            entry: The new activity log entry.
+        """
+        self.hass.bus.async_fire(
+            f"{DOMAIN}_activity",
+            {
+                "server_id": self.server_id,
+                "server_name": self.server_name,
+                "activity_id": entry.get("Id"),
+                "name": entry.get("Name"),
+                "type": entry.get("Type"),
+                "severity": entry.get("Severity"),
+                "date": entry.get("Date"),
+                "user_id": entry.get("UserId"),
+                "item_id": entry.get("ItemId"),
+                "short_overview": entry.get("ShortOverview"),
+            },
+        )
+
+    async def _fetch_devices(self) -> dict[str, list[EmbyDeviceInfo]]:
+        """Fetch devices.
 
         Returns:
-            List of plugins, or empty list on failure.
+            Dictionary with devices data.
         """
-        try:
-            return await self.client.async_get_plugins()
-        except (EmbyError, TypeError, AttributeError):
-            _LOGGER.debug("Could not fetch plugins")
-            return []
+        response = await self.client.async_get_devices()
+        return {"Items": response.get("Items", [])}
 
 
 class EmbyLibraryCoordinator(DataUpdateCoordinator[EmbyLibraryData]):
@@ -392,6 +644,7 @@ class EmbyLibraryCoordinator(DataUpdateCoordinator[EmbyLibraryData]):
     client: EmbyClient
     server_id: str
     config_entry: EmbyConfigEntry
+    data: EmbyLibraryData
     _user_id: str | None
     _default_scan_interval: int
 
@@ -436,6 +689,10 @@ class EmbyLibraryCoordinator(DataUpdateCoordinator[EmbyLibraryData]):
         self._user_id = user_id
         self._default_scan_interval = effective_interval
         self._websocket_active = False
+        # Item IDs from LibraryChanged events not yet applied to the counts
+        self._pending_added: set[str] = set()
+        self._pending_removed: set[str] = set()
+        self._item_types: OrderedDict[str, str] = OrderedDict()
 
     @property
     def user_id(self) -> str | None:
@@ -480,7 +737,111 @@ class EmbyLibraryCoordinator(DataUpdateCoordinator[EmbyLibraryData]):
                 self._default_scan_interval,
             )
 
+    def queue_library_changes(self, added: Iterable[str], removed: Iterable[str]) -> None:
+        """Queue items from a LibraryChanged event for async_apply_library_changes().
+
+        Args:
+            added: IDs of added items.
+            removed: IDs of removed items.
+        """
+        self._pending_added.update(added)
+        self._pending_removed.update(removed)
+
+    async def async_apply_library_changes(self) -> None:
+        """Apply queued LibraryChanged items to the counts.
+
+        The types of added items are resolved with one batched lookup and the
+        matching counts adjusted in place. A full recount is requested
+        instead if there is no data yet, an item's type is unknown (a
+        removed item not seen being added), a library or collection changed,
+        or a count would become negative. The regular polling interval is
+        left running, so counts are still fully recounted periodically.
+        """
+        added = self._pending_added - self._pending_removed
+        removed = self._pending_removed - self._pending_added
+        self._pending_added = set()
+        self._pending_removed = set()
+        if not added and not removed:
+            return
+        if self.data is None or not self.last_update_success:
+            await self.async_request_refresh()
+            return
+
+        try:
+            added_types = await self.client.async_get_item_types(list(added)) if added else {}
+        except EmbyError as err:
+            _LOGGER.debug("Resolving added items failed, recounting library: %s", err)
+            await self.async_request_refresh()
+            return
+
+        deltas = self._count_deltas(added_types, removed)
+        if deltas is None:
+            await self.async_request_refresh()
+            return
+
+        data: dict[str, Any] = dict(self.data)
+        for key, delta in deltas.items():
+            count: int = data.get(key, 0) + delta
+            if count < 0:
+                _LOGGER.debug("Library count %s would become negative, recounting", key)
+                await self.async_request_refresh()
+                return
+            data[key] = count
+
+        _LOGGER.debug(
+            "Applied library changes incrementally (%d added, %d removed): %s",
+            len(added),
+            len(removed),
+            deltas,
+        )
+        if data != self.data:
+            # Not async_set_updated_data(): that would postpone the periodic recount
+            self.data = cast("EmbyLibraryData", data)
+            self.async_update_listeners()
+
+    def _count_deltas(
+        self, added_types: dict[str, str], removed: Iterable[str]
+    ) -> dict[str, int] | None:
+        """Compute count changes for added and removed items.
+
+        Args:
+            added_types: Types of the added items that still exist.
+            removed: IDs of removed items.
+
+        Returns:
+            Count key -> change, or None if a full recount is needed.
+        """
+        deltas: dict[str, int] = {}
+        for item_id, item_type in added_types.items():
+            if item_type in RECOUNT_ITEM_TYPES:
+                return None
+            self._item_types[item_id] = item_type
+            self._item_types.move_to_end(item_id)
+            if key := ITEM_TYPE_COUNT_KEYS.get(item_type):
+                deltas[key] = deltas.get(key, 0) + 1
+        while len(self._item_types) > ITEM_TYPE_CACHE_SIZE:
+            self._item_types.popitem(last=False)
+
+        for item_id in removed:
+            removed_type = self._item_types.pop(item_id, None)
+            if removed_type is None:
+                return None
+            if key := ITEM_TYPE_COUNT_KEYS.get(removed_type):
+                deltas[key] = deltas.get(key, 0) - 1
+        return {key: delta for key, delta in deltas.items() if delta}
+
     async def _async_update_data(self) -> EmbyLibraryData:
+        """Fetch library data within the refresh planner's request budget.
+
+        Returns:
+            Library data including item counts and virtual folders.
+        """
+        async with planned_refresh(
+            self.config_entry, "library", interval=self._default_scan_interval
+        ):
+            return await self._async_fetch_library_data()
+
+    async def _async_fetch_library_data(self) -> EmbyLibraryData:
         """Fetch library data from Emby server.
 
         Uses asyncio.gather() to fetch independent data in parallel for improved performance.
@@ -599,6 +960,9 @@ class EmbyLibraryCoordinator(DataUpdateCoordinator[EmbyLibraryData]):
 
 
 __all__ = [
+    "ITEM_TYPE_CACHE_SIZE",
+    "ITEM_TYPE_COUNT_KEYS",
+    "RECOUNT_ITEM_TYPES",
     "WEBSOCKET_LIBRARY_SCAN_INTERVAL",
     "EmbyLibraryCoordinator",
     "EmbyLibraryData",
@@ -0,0 +1,152 @@
+"""Leading- and trailing-edge debouncing for event-triggered refreshes.
+
+WebSocket events arrive in bursts (a playback start is followed by several
+progress events, a library scan by many LibraryChanged messages). Refreshing
+on every event wastes requests; refreshing only on the first event of a burst
+leaves the final state stale until the next poll. RefreshDebouncer runs the
+refresh on the first event (leading edge, optional), coalesces the rest of
+the burst and runs once more after it goes quiet (trailing edge). A burst
+that never goes quiet is refreshed at least every max_wait seconds.
+
+Example usage:
+    debouncer = RefreshDebouncer(
+        hass, "sessions", coordinator.async_refresh, cooldown=2.0, max_wait=10.0
+    )
+    debouncer.async_trigger()  # refreshes now
+    debouncer.async_trigger()  # coalesced into one refresh 2s after the burst
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import DOMAIN
+from .metrics import DebounceStats
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class RefreshDebouncer:
+    """Coalesces bursts of refresh requests.
+
+    Triggering is O(1) and never reschedules timers: a single background task
+    per burst sleeps until the computed deadline and re-checks it on waking.
+    Times come from time.monotonic(), the clock the event loop runs on.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        function: Callable[[], Coroutine[Any, Any, Any]],
+        *,
+        cooldown: float,
+        max_wait: float,
+        immediate: bool = True,
+        stats: DebounceStats | None = None,
+    ) -> None:
+        """Initialize the debouncer.
+
+        Args:
+            hass: Home Assistant instance.
+            name: Name used for the background task and statistics.
+            function: Coroutine function performing the refresh.
+            cooldown: Quiet period (seconds) that ends a burst.
+            max_wait: Longest time (seconds) a trigger waits for its refresh.
+            immediate: Whether the first trigger of a burst refreshes at once.
+            stats: Statistics to update, e.g. from MetricsCollector.
+        """
+        self._hass = hass
+        self._name = name
+        self._function = function
+        self._cooldown = cooldown
+        self._max_wait = max(max_wait, cooldown)
+        self._immediate = immediate
+        self.stats = stats if stats is not None else DebounceStats()
+        self._task: asyncio.Task[None] | None = None
+        # Monotonic time of the first trigger not yet covered by a refresh
+        self._pending_since: float | None = None
+        # Monotonic time of the latest trigger or refresh (start of quiet period)
+        self._quiet_since: float = 0.0
+
+    @property
+    def pending(self) -> bool:
+        """Return True if a trailing refresh is scheduled.
+
+        Returns:
+            Whether triggers are waiting for a refresh.
+        """
+        return self._pending_since is not None
+
+    @callback
+    def async_trigger(self) -> None:
+        """Request a refresh."""
+        self.stats.triggers += 1
+        now = time.monotonic()
+        self._quiet_since = now
+        if self._task is not None:
+            if self._pending_since is None:
+                self._pending_since = now
+            return
+
+        if self._immediate:
+            self.stats.leading += 1
+            self._run()
+        else:
+            self._pending_since = now
+        self._task = self._hass.async_create_background_task(
+            self._async_wait(), f"{DOMAIN} {self._name} debouncer"
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any pending refresh."""
+        self._pending_since = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _deadline(self) -> float:
+        """Return when the current burst ends.
+
+        Returns:
+            Monotonic time of the trailing refresh (or end of the cooldown).
+        """
+        deadline = self._quiet_since + self._cooldown
+        if self._pending_since is not None:
+            deadline = min(deadline, self._pending_since + self._max_wait)
+        return deadline
+
+    async def _async_wait(self) -> None:
+        """Sleep until the burst ends and run the trailing refresh."""
+        try:
+            while True:
+                delay = self._deadline() - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+                if self._pending_since is None:
+                    return
+                self._pending_since = None
+                self.stats.trailing += 1
+                self._run()
+                if not self._immediate:
+                    return
+                # Keep a cooldown after the trailing refresh as well
+                self._quiet_since = time.monotonic()
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    def _run(self) -> None:
+        """Start the refresh."""
+        self._hass.async_create_task(self._function())
+
+
+__all__ = ["RefreshDebouncer"]
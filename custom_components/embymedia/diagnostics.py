@@ -55,6 +55,14 @@ async def async_get_config_entry_diagnostics(
     # Get efficiency metrics (#293)
     efficiency_metrics: dict[str, object] = coordinator.client.metrics.to_diagnostics()
 
+    discovery_scheduler = getattr(entry.runtime_data, "discovery_scheduler", None)
+    discovery_schedule = (
+        discovery_scheduler.to_diagnostics() if discovery_scheduler is not None else None
+    )
+    startup_timeline = getattr(entry.runtime_data, "startup_timeline", None)
+    snapshots = getattr(entry.runtime_data, "snapshots", None)
+    refresh_planner = getattr(entry.runtime_data, "refresh_planner", None)
+
     return {
         "config_entry": {
             "entry_id": entry.entry_id,
@@ -76,6 +84,12 @@ async def async_get_config_entry_diagnostics(
         },
         "cache_stats": cache_stats,
         "efficiency_metrics": efficiency_metrics,
+        "discovery_schedule": discovery_schedule,
+        "startup_timeline": startup_timeline.to_dict() if startup_timeline is not None else None,
+        "snapshots": snapshots.to_diagnostics() if snapshots is not None else None,
+        "refresh_planner": (
+            refresh_planner.to_diagnostics() if refresh_planner is not None else None
+        ),
     }
 
 
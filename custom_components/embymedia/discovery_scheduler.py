@@ -0,0 +1,267 @@
+"""Staggered scheduling of per-user discovery refreshes.
+
+In admin mode there is one EmbyDiscoveryCoordinator per user. Left to their
+own timers they would all refresh at the same moment every scan interval,
+each firing several requests at once. DiscoveryScheduler takes over their
+timing instead: users are given evenly spaced slots across the interval
+(with a little jitter), at most DISCOVERY_MAX_CONCURRENT_REFRESHES users
+refresh at the same time, and per-user timings are kept for diagnostics.
+
+Refreshes are demand-driven: a user whose discovery entities are all
+disabled (no coordinator listeners) is skipped and marked stale, and is
+refreshed as soon as one of its entities subscribes again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import DISCOVERY_MAX_CONCURRENT_REFRESHES, DISCOVERY_SCHEDULE_JITTER, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .const import EmbyConfigEntry
+    from .coordinator_discovery import EmbyDiscoveryCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DiscoveryRefreshStats:
+    """Schedule and refresh timing for one user.
+
+    Attributes:
+        offset_seconds: Nominal position of the user's slot in each interval.
+        next_refresh: When the next scheduled refresh is due.
+        refresh_count: Number of completed refreshes.
+        failure_count: Number of refreshes that failed.
+        skipped_count: Slots skipped because the previous refresh was still running.
+        idle_skips: Slots skipped because no entity of the user was in use.
+        last_duration_ms: Duration of the latest refresh, including time
+            spent waiting for a free concurrency slot.
+        max_duration_ms: Longest refresh duration seen.
+    """
+
+    offset_seconds: float = 0.0
+    next_refresh: datetime | None = None
+    refresh_count: int = 0
+    failure_count: int = 0
+    skipped_count: int = 0
+    idle_skips: int = 0
+    last_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+
+    def record(self, duration_ms: float, success: bool) -> None:
+        """Record a completed refresh.
+
+        Args:
+            duration_ms: Refresh duration in milliseconds.
+            success: Whether the refresh succeeded.
+        """
+        self.refresh_count += 1
+        if not success:
+            self.failure_count += 1
+        self.last_duration_ms = duration_ms
+        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for diagnostics.
+
+        Returns:
+            Dictionary with the schedule and timing of the user's refreshes.
+        """
+        return {
+            "offset_seconds": round(self.offset_seconds, 1),
+            "next_refresh": self.next_refresh.isoformat() if self.next_refresh else None,
+            "refresh_count": self.refresh_count,
+            "failure_count": self.failure_count,
+            "skipped_count": self.skipped_count,
+            "idle_skips": self.idle_skips,
+            "last_duration_ms": round(self.last_duration_ms, 2),
+            "max_duration_ms": round(self.max_duration_ms, 2),
+        }
+
+
+class DiscoveryScheduler:
+    """Drives the refreshes of all discovery coordinators of a config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: EmbyConfigEntry,
+        coordinators: Mapping[str, EmbyDiscoveryCoordinator],
+        interval: float,
+        *,
+        max_concurrent: int = DISCOVERY_MAX_CONCURRENT_REFRESHES,
+        jitter: float = DISCOVERY_SCHEDULE_JITTER,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            hass: Home Assistant instance.
+            config_entry: Config entry owning the coordinators; the schedule
+                stops when it is unloaded.
+            coordinators: User ID -> discovery coordinator.
+            interval: Seconds between refreshes of each user.
+            max_concurrent: Maximum number of users refreshing at once.
+            jitter: Maximum shift of a refresh, as a fraction of a user's slot.
+        """
+        self._hass = hass
+        self._config_entry = config_entry
+        self._coordinators = coordinators
+        self._interval = interval
+        self._max_concurrent = max_concurrent
+        self._jitter = jitter
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._running: set[str] = set()
+        self._stats = {user_id: DiscoveryRefreshStats() for user_id in coordinators}
+
+    @property
+    def slot_seconds(self) -> float:
+        """Return the spacing between consecutive users' refreshes.
+
+        Returns:
+            Interval divided by the number of users.
+        """
+        return self._interval / max(len(self._coordinators), 1)
+
+    def get_stats(self, user_id: str) -> DiscoveryRefreshStats | None:
+        """Get the refresh statistics of a user.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            The user's statistics, or None if the user is not scheduled.
+        """
+        return self._stats.get(user_id)
+
+    @callback
+    def async_start(self) -> None:
+        """Take over the coordinators' polling and start the staggered schedule.
+
+        No refresh happens up front: each coordinator is first refreshed when
+        one of its entities subscribes.
+        """
+        if not self._coordinators:
+            return
+        for user_id, coordinator in self._coordinators.items():
+            coordinator.update_interval = None  # type: ignore[misc]
+            self._config_entry.async_on_unload(
+                coordinator.async_add_activity_listener(
+                    partial(self._async_activity_changed, user_id)
+                )
+            )
+            if coordinator.active:
+                self._async_activity_changed(user_id, True)
+        slot = self.slot_seconds
+        for index, stats in enumerate(self._stats.values()):
+            stats.offset_seconds = (index + 1) * slot
+        self._config_entry.async_create_background_task(
+            self._hass, self._async_run(), f"{DOMAIN} discovery scheduler"
+        )
+        _LOGGER.debug(
+            "Scheduled discovery refreshes for %d users every %.0f seconds (%.1f seconds apart)",
+            len(self._coordinators),
+            self._interval,
+            slot,
+        )
+
+    async def _async_run(self) -> None:
+        """Refresh each user in its slot, one interval after another."""
+        slot = self.slot_seconds
+        cycle_start = time.monotonic()
+        while True:
+            due: list[tuple[float, str]] = []
+            for user_id, stats in self._stats.items():
+                shift = random.uniform(-self._jitter, self._jitter) * slot
+                due_at = cycle_start + stats.offset_seconds + shift
+                stats.next_refresh = dt_util.utcnow() + timedelta(seconds=due_at - time.monotonic())
+                due.append((due_at, user_id))
+
+            for due_at, user_id in sorted(due):
+                delay = due_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._config_entry.async_create_background_task(
+                    self._hass,
+                    self._async_refresh(user_id),
+                    f"{DOMAIN} discovery refresh {user_id}",
+                )
+            # Anchor cycles to the schedule, not to when refreshes finished
+            cycle_start += self._interval
+
+    @callback
+    def _async_activity_changed(self, user_id: str, active: bool) -> None:
+        """Refresh a user on demand when its entities come into use.
+
+        Args:
+            user_id: The user whose coordinator changed.
+            active: Whether the coordinator is now active.
+        """
+        if active and self._coordinators[user_id].stale:
+            self._config_entry.async_create_background_task(
+                self._hass,
+                self._async_refresh(user_id, scheduled=False),
+                f"{DOMAIN} discovery refresh {user_id}",
+            )
+
+    async def _async_refresh(self, user_id: str, scheduled: bool = True) -> None:
+        """Refresh one user's coordinator within the concurrency limit.
+
+        Args:
+            user_id: The user to refresh.
+            scheduled: Whether this is a scheduled (rather than on-demand)
+                refresh; scheduled refreshes of inactive users are skipped.
+        """
+        stats = self._stats[user_id]
+        coordinator = self._coordinators[user_id]
+        if scheduled and not coordinator.active:
+            stats.idle_skips += 1
+            coordinator.mark_stale()
+            return
+        if user_id in self._running:
+            stats.skipped_count += 1
+            _LOGGER.debug("Discovery refresh for user %s still running, skipping", user_id)
+            return
+        self._running.add(user_id)
+        start = time.perf_counter()
+        try:
+            async with self._semaphore:
+                await coordinator.async_refresh()
+        finally:
+            self._running.discard(user_id)
+            stats.record(
+                (time.perf_counter() - start) * 1000, success=coordinator.last_update_success
+            )
+
+    def to_diagnostics(self) -> dict[str, object]:
+        """Convert the schedule to diagnostics format.
+
+        Returns:
+            Dictionary with the schedule settings and per-user timings.
+        """
+        return {
+            "interval_seconds": self._interval,
+            "slot_seconds": round(self.slot_seconds, 1),
+            "max_concurrent": self._max_concurrent,
+            "users": {
+                user_id: {**stats.to_dict(), "active": self._coordinators[user_id].active}
+                for user_id, stats in self._stats.items()
+            },
+        }
+
+
+__all__ = ["DiscoveryRefreshStats", "DiscoveryScheduler"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.components.media_player import (
@@ -36,6 +36,7 @@ from .browse import (
 from .entity import EmbyEntity
 from .exceptions import EmbyError
 from .models import MediaType as EmbyMediaType
+from .position import PlaybackPositionModel
 
 if TYPE_CHECKING:
     from .const import EmbyConfigEntry, EmbyLibraryItem, EmbyPerson
@@ -127,6 +128,22 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
         # Cache for similar items to avoid repeated API calls
         self._similar_items_cache: list[dict[str, str]] | None = None
         self._similar_items_item_id: str | None = None
+        # Extrapolates the playback position between session updates
+        self._position_model = PlaybackPositionModel()
+
+    async def async_added_to_hass(self) -> None:
+        """Register this entity with the coordinator for event firing."""
+        await super().async_added_to_hass()
+        self.coordinator.async_register_media_player(self._device_id, self.entity_id)
+        self.async_on_remove(
+            lambda: self.coordinator.async_unregister_media_player(self._device_id)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the position model before writing state."""
+        self._position_model.update(self.session, dt_util.utcnow())
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> MediaPlayerState:
@@ -382,7 +399,10 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
 
     @property
     def media_position(self) -> int | None:
-        """Return the current position in seconds.
+        """Return the position in seconds at media_position_updated_at.
+
+        Uses the extrapolation anchor when available so the value only
+        changes on seeks, pauses and rate changes.
 
         Returns:
             Position in seconds or None.
@@ -390,6 +410,9 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
         session = self.session
         if session is None or session.play_state is None:
             return None
+        anchor = self._position_model.anchor
+        if anchor is not None:
+            return int(anchor.position_seconds)
         return int(session.play_state.position_seconds)
 
     @property
@@ -402,6 +425,14 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
         session = self.session
         if session is None or session.play_state is None:
             return None
+        anchor = self._position_model.anchor
+        if anchor is not None:
+            if anchor.is_paused:
+                return anchor.updated_at
+            # media_position is truncated, so shift the timestamp back by the
+            # fractional second to keep the frontend's extrapolation exact
+            fraction = anchor.position_seconds - int(anchor.position_seconds)
+            return anchor.updated_at - timedelta(seconds=fraction)
         now: datetime = dt_util.utcnow()
         return now
 
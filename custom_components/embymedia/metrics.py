@@ -6,13 +6,34 @@ and coordinator updates to help diagnose performance issues.
 
 from __future__ import annotations
 
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
     pass
 
+T = TypeVar("T")
+
+# Upper bounds (in milliseconds) of the latency histogram buckets.
+# Values above the last bound fall into an open-ended overflow bucket.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    50.0,
+    100.0,
+    500.0,
+    1000.0,
+    5000.0,
+)
+
 
 @dataclass
 class ApiMetrics:
@@ -46,23 +67,141 @@ class ApiMetrics:
         return self.total_time_ms / self.call_count
 
 
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in milliseconds.
+
+    Buckets are not cumulative: each observation is counted in exactly one
+    bucket, the first whose upper bound is >= the observed value.
+
+    Attributes:
+        bucket_bounds: Ascending upper bounds of the buckets in milliseconds.
+        bucket_counts: Observation count per bucket (one extra overflow bucket).
+        count: Total number of observations.
+        total_ms: Sum of all observed durations.
+        max_ms: Largest observed duration.
+    """
+
+    bucket_bounds: tuple[float, ...] = LATENCY_BUCKETS_MS
+    bucket_counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Size the bucket counters to match the bucket bounds."""
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.bucket_bounds) + 1)
+
+    def observe(self, duration_ms: float) -> None:
+        """Record a single duration.
+
+        Args:
+            duration_ms: Observed duration in milliseconds.
+        """
+        self.bucket_counts[bisect_left(self.bucket_bounds, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    @property
+    def avg_ms(self) -> float:
+        """Calculate average duration in milliseconds.
+
+        Returns:
+            Average duration or 0 if nothing has been observed.
+        """
+        if self.count == 0:
+            return 0.0
+        return self.total_ms / self.count
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for diagnostics.
+
+        Returns:
+            Dictionary with count, average, maximum and per-bucket counts.
+        """
+        buckets: dict[str, int] = {
+            f"le_{bound:g}ms": bucket_count
+            for bound, bucket_count in zip(self.bucket_bounds, self.bucket_counts, strict=False)
+        }
+        buckets[f"gt_{self.bucket_bounds[-1]:g}ms"] = self.bucket_counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.avg_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class WebSocketMessageStats:
+    """Statistics for a single WebSocket message type.
+
+    Attributes:
+        message_type: The WebSocket MessageType (e.g. "Sessions").
+        count: Number of messages of this type received.
+        last_seen: Timestamp of the most recent message of this type.
+        handler_time: Histogram of handler execution time.
+    """
+
+    message_type: str
+    count: int = 0
+    last_seen: datetime | None = None
+    handler_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for diagnostics.
+
+        Returns:
+            Dictionary with count, last seen time and handler timings.
+        """
+        return {
+            "count": self.count,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "handler_time": self.handler_time.to_dict(),
+        }
+
+
 @dataclass
 class WebSocketStats:
     """Statistics for WebSocket connection.
 
-    Tracks messages received, connection uptime, and error counts.
+    Tracks messages received, connection uptime, error counts and
+    KeepAlive round-trip times.
 
     Attributes:
         messages_received: Total number of messages received.
         reconnection_count: Number of reconnection attempts.
         error_count: Number of WebSocket errors.
         connected_since: Timestamp when connection was established.
+        liveness_timeouts: Connections closed for missing the liveness deadline.
+        rtt: Histogram of KeepAlive round-trip times.
+        resync_count: Number of resyncs performed after a reconnect.
+        gap_invalidations: Resyncs whose gap was long enough to invalidate caches.
+        last_gap_seconds: Duration of the most recent disconnection gap.
+        max_gap_seconds: Longest disconnection gap observed.
+        reconnects: Number of successful reconnections.
+        reconnect_seconds_total: Total time spent reconnecting.
+        last_reconnect_seconds: Time the most recent reconnection took.
+        max_reconnect_seconds: Longest reconnection observed.
     """
 
     messages_received: int = 0
     reconnection_count: int = 0
     error_count: int = 0
     connected_since: float | None = None
+    liveness_timeouts: int = 0
+    rtt: LatencyHistogram = field(default_factory=LatencyHistogram)
+    resync_count: int = 0
+    gap_invalidations: int = 0
+    last_gap_seconds: float | None = None
+    max_gap_seconds: float = 0.0
+    reconnects: int = 0
+    reconnect_seconds_total: float = 0.0
+    last_reconnect_seconds: float | None = None
+    max_reconnect_seconds: float = 0.0
 
     @property
     def uptime_hours(self) -> float:
@@ -76,7 +215,7 @@ class WebSocketStats:
         elapsed_seconds = datetime.now().timestamp() - self.connected_since
         return elapsed_seconds / 3600.0
 
-    def to_dict(self) -> dict[str, int | float]:
+    def to_dict(self) -> dict[str, object]:
         """Convert to dictionary for diagnostics.
 
         Returns:
@@ -87,6 +226,136 @@ class WebSocketStats:
             "reconnection_count": self.reconnection_count,
             "error_count": self.error_count,
             "uptime_hours": round(self.uptime_hours, 2),
+            "liveness_timeouts": self.liveness_timeouts,
+            "rtt": self.rtt.to_dict(),
+            "resync_count": self.resync_count,
+            "gap_invalidations": self.gap_invalidations,
+            "last_gap_seconds": (
+                round(self.last_gap_seconds, 2) if self.last_gap_seconds is not None else None
+            ),
+            "max_gap_seconds": round(self.max_gap_seconds, 2),
+            "reconnect_latency": {
+                "count": self.reconnects,
+                "avg_seconds": round(
+                    self.reconnect_seconds_total / self.reconnects if self.reconnects else 0.0,
+                    2,
+                ),
+                "last_seconds": (
+                    round(self.last_reconnect_seconds, 2)
+                    if self.last_reconnect_seconds is not None
+                    else None
+                ),
+                "max_seconds": round(self.max_reconnect_seconds, 2),
+            },
+        }
+
+
+@dataclass
+class SubscriptionModeStats:
+    """Statistics for the adaptive session subscription.
+
+    Tracks the current subscription mode and the time spent in each mode,
+    using the monotonic clock.
+
+    Attributes:
+        mode: Current subscription mode (e.g. "active" or "idle").
+        interval_ms: Current subscription interval in milliseconds.
+        mode_since: Monotonic timestamp when the current mode was entered.
+        mode_changes: Number of mode transitions.
+        time_in_mode: Accumulated seconds spent in each completed mode period.
+    """
+
+    mode: str | None = None
+    interval_ms: int | None = None
+    mode_since: float | None = None
+    mode_changes: int = 0
+    time_in_mode: dict[str, float] = field(default_factory=dict)
+
+    def set_mode(self, mode: str, interval_ms: int) -> None:
+        """Enter a new subscription mode.
+
+        Args:
+            mode: The new subscription mode.
+            interval_ms: The subscription interval used in this mode.
+        """
+        now = time.monotonic()
+        if self.mode is not None and self.mode_since is not None:
+            self.time_in_mode[self.mode] = (
+                self.time_in_mode.get(self.mode, 0.0) + now - self.mode_since
+            )
+            if mode != self.mode:
+                self.mode_changes += 1
+        self.mode = mode
+        self.interval_ms = interval_ms
+        self.mode_since = now
+
+    def get_time_in_mode(self, mode: str) -> float:
+        """Return total seconds spent in a mode, including the current period.
+
+        Args:
+            mode: The subscription mode.
+
+        Returns:
+            Seconds spent in the mode.
+        """
+        total = self.time_in_mode.get(mode, 0.0)
+        if mode == self.mode and self.mode_since is not None:
+            total += time.monotonic() - self.mode_since
+        return total
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for diagnostics.
+
+        Returns:
+            Dictionary with current mode, interval and time spent per mode.
+        """
+        modes = set(self.time_in_mode)
+        if self.mode is not None:
+            modes.add(self.mode)
+        return {
+            "mode": self.mode,
+            "interval_ms": self.interval_ms,
+            "mode_changes": self.mode_changes,
+            "time_in_mode_seconds": {
+                mode: round(self.get_time_in_mode(mode), 1) for mode in sorted(modes)
+            },
+        }
+
+
+@dataclass
+class DebounceStats:
+    """Trigger counts for a refresh debouncer.
+
+    Attributes:
+        triggers: Number of refresh requests received.
+        leading: Refreshes run immediately on the first request of a burst.
+        trailing: Refreshes run once a burst went quiet (or hit its max wait).
+    """
+
+    triggers: int = 0
+    leading: int = 0
+    trailing: int = 0
+
+    @property
+    def suppressed(self) -> int:
+        """Return the number of requests that did not cause their own refresh.
+
+        Returns:
+            Requests coalesced into another refresh.
+        """
+        return self.triggers - self.leading - self.trailing
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for diagnostics.
+
+        Returns:
+            Dictionary with trigger, refresh and suppression counts.
+        """
+        return {
+            "triggers": self.triggers,
+            "leading": self.leading,
+            "trailing": self.trailing,
+            "suppressed": self.suppressed,
         }
 
 
@@ -120,6 +389,98 @@ class CoordinatorStats:
         return self.total_duration_ms / self.update_count
 
 
+@dataclass
+class StartupTimeline:
+    """Timings of the phases of a config entry setup.
+
+    Phases may overlap (the first refreshes run concurrently), so each phase
+    records when it started relative to the setup as well as its duration.
+
+    Example:
+        timeline = StartupTimeline()
+        with timeline.measure("connect"):
+            await client.async_validate_connection()
+        await asyncio.gather(
+            timeline.async_measure("server_refresh", server.async_refresh()),
+            timeline.async_measure("library_refresh", library.async_refresh()),
+        )
+        timeline.finish()
+
+    Attributes:
+        started: Monotonic time the setup started.
+        finished: Monotonic time the setup finished, or None while running.
+        phases: Phase name -> (start offset, duration), in milliseconds.
+    """
+
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+    phases: dict[str, tuple[float, float]] = field(default_factory=dict)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time a phase, whether it succeeds or fails.
+
+        Args:
+            name: Name of the phase.
+
+        Yields:
+            None; the phase runs inside the with block.
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases[name] = (
+                (start - self.started) * 1000,
+                (time.monotonic() - start) * 1000,
+            )
+
+    async def async_measure(self, name: str, awaitable: Awaitable[T]) -> T:
+        """Time a phase given as an awaitable, e.g. to run phases concurrently.
+
+        Args:
+            name: Name of the phase.
+            awaitable: The phase to await.
+
+        Returns:
+            The result of the awaitable.
+        """
+        with self.measure(name):
+            return await awaitable
+
+    def finish(self) -> None:
+        """Mark the setup as finished."""
+        self.finished = time.monotonic()
+
+    @property
+    def total_ms(self) -> float | None:
+        """Return the total setup duration in milliseconds.
+
+        Returns:
+            Duration of the setup, or None while it is still running.
+        """
+        if self.finished is None:
+            return None
+        return (self.finished - self.started) * 1000
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for diagnostics.
+
+        Returns:
+            Dictionary with the total duration and the phases in start order.
+        """
+        total_ms = self.total_ms
+        return {
+            "total_ms": round(total_ms, 1) if total_ms is not None else None,
+            "phases": {
+                name: {"start_ms": round(start_ms, 1), "duration_ms": round(duration_ms, 1)}
+                for name, (start_ms, duration_ms) in sorted(
+                    self.phases.items(), key=lambda phase: phase[1][0]
+                )
+            },
+        }
+
+
 @dataclass
 class MetricsCollector:
     """Collects metrics for API calls, WebSocket, and coordinators.
@@ -137,6 +498,9 @@ class MetricsCollector:
     _api_metrics: dict[str, ApiMetrics] = field(default_factory=dict)
     _websocket_stats: WebSocketStats = field(default_factory=WebSocketStats)
     _coordinator_stats: dict[str, CoordinatorStats] = field(default_factory=dict)
+    _websocket_message_stats: dict[str, WebSocketMessageStats] = field(default_factory=dict)
+    _subscription_stats: SubscriptionModeStats = field(default_factory=SubscriptionModeStats)
+    _debounce_stats: dict[str, DebounceStats] = field(default_factory=dict)
 
     def record_api_call(
         self,
@@ -161,6 +525,15 @@ class MetricsCollector:
         if error:
             metrics.error_count += 1
 
+    @property
+    def total_api_calls(self) -> int:
+        """Return the number of API calls made to any endpoint.
+
+        Returns:
+            Total API call count.
+        """
+        return sum(metrics.call_count for metrics in self._api_metrics.values())
+
     def get_api_metrics(self, endpoint: str) -> ApiMetrics | None:
         """Get metrics for a specific endpoint.
 
@@ -172,14 +545,41 @@ class MetricsCollector:
         """
         return self._api_metrics.get(endpoint)
 
-    def record_websocket_message(self, message_type: str) -> None:
+    def record_websocket_message(
+        self,
+        message_type: str,
+        handler_duration_ms: float | None = None,
+    ) -> None:
         """Record a received WebSocket message.
 
         Args:
             message_type: The type of message received.
+            handler_duration_ms: Time spent handling the message, if measured.
         """
         self._websocket_stats.messages_received += 1
 
+        if message_type not in self._websocket_message_stats:
+            self._websocket_message_stats[message_type] = WebSocketMessageStats(
+                message_type=message_type
+            )
+
+        stats = self._websocket_message_stats[message_type]
+        stats.count += 1
+        stats.last_seen = datetime.now()
+        if handler_duration_ms is not None:
+            stats.handler_time.observe(handler_duration_ms)
+
+    def get_websocket_message_stats(self, message_type: str) -> WebSocketMessageStats | None:
+        """Get statistics for a specific WebSocket message type.
+
+        Args:
+            message_type: The WebSocket message type.
+
+        Returns:
+            WebSocketMessageStats for the type or None if never received.
+        """
+        return self._websocket_message_stats.get(message_type)
+
     def record_websocket_connect(self) -> None:
         """Record WebSocket connection established."""
         self._websocket_stats.connected_since = datetime.now().timestamp()
@@ -192,10 +592,80 @@ class MetricsCollector:
         """Record WebSocket reconnection attempt."""
         self._websocket_stats.reconnection_count += 1
 
+    def record_websocket_reconnect_latency(self, latency_seconds: float, attempts: int) -> None:
+        """Record a completed WebSocket reconnection.
+
+        Args:
+            latency_seconds: Time from starting to reconnect until connected.
+            attempts: Number of connection attempts it took.
+        """
+        stats = self._websocket_stats
+        stats.reconnection_count += attempts
+        stats.reconnects += 1
+        stats.reconnect_seconds_total += latency_seconds
+        stats.last_reconnect_seconds = latency_seconds
+        stats.max_reconnect_seconds = max(stats.max_reconnect_seconds, latency_seconds)
+
     def record_websocket_error(self) -> None:
         """Record WebSocket error."""
         self._websocket_stats.error_count += 1
 
+    def record_websocket_rtt(self, rtt_ms: float) -> None:
+        """Record a WebSocket KeepAlive round-trip time.
+
+        Args:
+            rtt_ms: Round-trip time in milliseconds.
+        """
+        self._websocket_stats.rtt.observe(rtt_ms)
+
+    def record_websocket_liveness_timeout(self) -> None:
+        """Record a WebSocket connection closed for missing the liveness deadline."""
+        self._websocket_stats.liveness_timeouts += 1
+
+    def record_websocket_resync(self, gap_seconds: float, invalidated: bool) -> None:
+        """Record a resync after a WebSocket reconnect.
+
+        Args:
+            gap_seconds: How long the WebSocket was disconnected.
+            invalidated: Whether the gap was long enough to invalidate caches.
+        """
+        stats = self._websocket_stats
+        stats.resync_count += 1
+        stats.last_gap_seconds = gap_seconds
+        stats.max_gap_seconds = max(stats.max_gap_seconds, gap_seconds)
+        if invalidated:
+            stats.gap_invalidations += 1
+
+    def record_sessions_subscription_mode(self, mode: str, interval_ms: int) -> None:
+        """Record a change of the adaptive session subscription mode.
+
+        Args:
+            mode: The new subscription mode.
+            interval_ms: The subscription interval in milliseconds.
+        """
+        self._subscription_stats.set_mode(mode, interval_ms)
+
+    def get_sessions_subscription_stats(self) -> SubscriptionModeStats:
+        """Get session subscription statistics.
+
+        Returns:
+            Current session subscription statistics.
+        """
+        return self._subscription_stats
+
+    def get_debounce_stats(self, name: str) -> DebounceStats:
+        """Get (creating if needed) the statistics for a refresh debouncer.
+
+        Args:
+            name: Name of the debouncer.
+
+        Returns:
+            DebounceStats shared with the debouncer.
+        """
+        if name not in self._debounce_stats:
+            self._debounce_stats[name] = DebounceStats()
+        return self._debounce_stats[name]
+
     def get_websocket_stats(self) -> WebSocketStats:
         """Get WebSocket statistics.
 
@@ -257,6 +727,14 @@ class MetricsCollector:
                 for endpoint, metrics in self._api_metrics.items()
             },
             "websocket": self._websocket_stats.to_dict(),
+            "websocket_messages": {
+                message_type: stats.to_dict()
+                for message_type, stats in self._websocket_message_stats.items()
+            },
+            "sessions_subscription": self._subscription_stats.to_dict(),
+            "refresh_debouncers": {
+                name: stats.to_dict() for name, stats in self._debounce_stats.items()
+            },
             "coordinators": {
                 name: {
                     "updates": stats.update_count,
@@ -271,6 +749,11 @@ class MetricsCollector:
 __all__ = [
     "ApiMetrics",
     "CoordinatorStats",
+    "DebounceStats",
+    "LatencyHistogram",
     "MetricsCollector",
+    "StartupTimeline",
+    "SubscriptionModeStats",
+    "WebSocketMessageStats",
     "WebSocketStats",
 ]
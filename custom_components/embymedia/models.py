@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -10,8 +12,41 @@ from typing import TYPE_CHECKING
 from .api import ticks_to_seconds
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .const import EmbyNowPlayingItem, EmbyPlayState, EmbySessionResponse
 
+# NowPlayingItem fields parse_media_item reads. A cached item is reused only
+# if all of them are unchanged, so the memo never returns stale data.
+_MEDIA_ITEM_FIELDS = (
+    "Id",
+    "Name",
+    "Type",
+    "RunTimeTicks",
+    "SeriesName",
+    "SeasonName",
+    "IndexNumber",
+    "ParentIndexNumber",
+    "Album",
+    "AlbumArtist",
+    "Artists",
+    "ProductionYear",
+    "Overview",
+    "ImageTags",
+    "SeriesId",
+    "SeasonId",
+    "AlbumId",
+    "ParentBackdropImageTags",
+)
+# Bounds for the parse memos (LRU eviction)
+MEDIA_ITEM_CACHE_SIZE = 256
+STRING_TUPLE_CACHE_SIZE = 64
+
+# item_id -> (source field values, parsed item)
+_media_item_cache: OrderedDict[str, tuple[tuple[object, ...], EmbyMediaItem]] = OrderedDict()
+# Shared tuples for repeated lists such as SupportedCommands
+_string_tuple_cache: OrderedDict[tuple[str, ...], tuple[str, ...]] = OrderedDict()
+
 
 class MediaType(StrEnum):
     """Media type enumeration.
@@ -90,6 +125,7 @@ class EmbyPlaybackState:
         is_muted: Whether audio is muted.
         volume_level: Volume level 0.0-1.0, or None if unknown.
         play_method: How content is being played (DirectPlay, Transcode).
+        playback_rate: Playback speed multiplier (1.0 = normal speed).
     """
 
     position_seconds: float = 0.0
@@ -98,6 +134,7 @@ class EmbyPlaybackState:
     is_muted: bool = False
     volume_level: float | None = None
     play_method: str | None = None
+    playback_rate: float = 1.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -117,6 +154,7 @@ class EmbySession:
         now_playing: Currently playing media, or None if idle.
         play_state: Current playback state, or None if not playing.
         last_activity: Timestamp of last activity.
+        last_playback_check_in: When the client last reported playback progress.
         app_version: Client application version.
         playable_media_types: Tuple of media types this client can play.
         supported_commands: Tuple of commands this client supports.
@@ -134,6 +172,7 @@ class EmbySession:
     now_playing: EmbyMediaItem | None = None
     play_state: EmbyPlaybackState | None = None
     last_activity: datetime | None = None
+    last_playback_check_in: datetime | None = None
     app_version: str | None = None
     playable_media_types: tuple[str, ...] = field(default_factory=tuple)
     supported_commands: tuple[str, ...] = field(default_factory=tuple)
@@ -185,6 +224,34 @@ class EmbySession:
         return self.device_id
 
 
+@dataclass(slots=True)
+class PlaybackRecord:
+    """Watch-time tracking state for one user's playback session.
+
+    Unlike the other models this record is mutable: it is updated in place
+    on every PlaybackProgress event instead of being rebuilt.
+
+    Attributes:
+        user_id: Emby user ID.
+        session_id: PlaySessionId (or device/session ID fallback).
+        position_ticks: Last reported playback position in ticks.
+        last_update: Monotonic time of the last update.
+        item_id: ID of the item being played.
+        item_name: Name of the item being played.
+        user_name: Display name of the user.
+        device_id: ID of the device playing, if reported.
+    """
+
+    user_id: str
+    session_id: str
+    position_ticks: int
+    last_update: float
+    item_id: str = ""
+    item_name: str = ""
+    user_name: str = ""
+    device_id: str = ""
+
+
 # =============================================================================
 # Parser Functions
 # =============================================================================
@@ -232,6 +299,68 @@ def parse_media_item(data: EmbyNowPlayingItem) -> EmbyMediaItem:
     )
 
 
+def _parse_media_item_cached(data: EmbyNowPlayingItem) -> EmbyMediaItem:
+    """Parse a NowPlayingItem, reusing the previous result if it is unchanged.
+
+    The same item is reported on every session update for the whole time it
+    plays. Returning the cached instance avoids rebuilding it and lets
+    equality checks between old and new sessions short-circuit on identity.
+
+    Args:
+        data: Raw NowPlayingItem from API response.
+
+    Returns:
+        Parsed (possibly shared) EmbyMediaItem instance.
+    """
+    values = tuple(map(data.get, _MEDIA_ITEM_FIELDS))
+    item_id = data["Id"]
+    cached = _media_item_cache.get(item_id)
+    if cached is not None and cached[0] == values:
+        _media_item_cache.move_to_end(item_id)
+        return cached[1]
+
+    item = parse_media_item(data)
+    _media_item_cache[item_id] = (values, item)
+    _media_item_cache.move_to_end(item_id)
+    if len(_media_item_cache) > MEDIA_ITEM_CACHE_SIZE:
+        _media_item_cache.popitem(last=False)
+    return item
+
+
+def _shared_string_tuple(values: Iterable[str]) -> tuple[str, ...]:
+    """Return a shared tuple for a frequently repeated list of strings.
+
+    Args:
+        values: Strings to convert.
+
+    Returns:
+        Tuple equal to the input, shared with earlier identical inputs.
+    """
+    key = tuple(values)
+    if not key:
+        return ()
+    shared = _string_tuple_cache.get(key)
+    if shared is not None:
+        _string_tuple_cache.move_to_end(key)
+        return shared
+    _string_tuple_cache[key] = key
+    if len(_string_tuple_cache) > STRING_TUPLE_CACHE_SIZE:
+        _string_tuple_cache.popitem(last=False)
+    return key
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a repeated string, passing None through.
+
+    Args:
+        value: String to intern.
+
+    Returns:
+        The interned string, or None.
+    """
+    return sys.intern(value) if value else value
+
+
 def parse_play_state(data: EmbyPlayState) -> EmbyPlaybackState:
     """Parse API response into EmbyPlaybackState.
 
@@ -243,6 +372,7 @@ def parse_play_state(data: EmbyPlayState) -> EmbyPlaybackState:
     """
     position_ticks = data.get("PositionTicks", 0)
     volume = data.get("VolumeLevel")
+    rate = data.get("PlaybackRate")
 
     return EmbyPlaybackState(
         position_seconds=ticks_to_seconds(position_ticks),
@@ -251,6 +381,7 @@ def parse_play_state(data: EmbyPlayState) -> EmbyPlaybackState:
         is_muted=data.get("IsMuted", False),
         volume_level=volume / 100.0 if volume is not None else None,
         play_method=data.get("PlayMethod"),
+        playback_rate=float(rate) if rate is not None else 1.0,
     )
 
 
@@ -266,7 +397,7 @@ def parse_session(data: EmbySessionResponse) -> EmbySession:
     now_playing_data = data.get("NowPlayingItem")
     play_state_data = data.get("PlayState")
 
-    now_playing = parse_media_item(now_playing_data) if now_playing_data else None
+    now_playing = _parse_media_item_cached(now_playing_data) if now_playing_data else None
     play_state = parse_play_state(play_state_data) if play_state_data else None
 
     last_activity_str = data.get("LastActivityDate")
@@ -275,6 +406,11 @@ def parse_session(data: EmbySessionResponse) -> EmbySession:
         # Parse ISO format datetime, handle Z suffix
         last_activity = datetime.fromisoformat(last_activity_str.replace("Z", "+00:00"))
 
+    check_in_str = data.get("LastPlaybackCheckIn")
+    last_playback_check_in = None
+    if check_in_str:
+        last_playback_check_in = datetime.fromisoformat(check_in_str.replace("Z", "+00:00"))
+
     # Parse queue data
     queue_data = data.get("NowPlayingQueue", [])
     queue_item_ids: tuple[str, ...] = tuple(item["Id"] for item in queue_data if "Id" in item)
@@ -286,30 +422,36 @@ def parse_session(data: EmbySessionResponse) -> EmbySession:
         if current_item_id in queue_item_ids:
             queue_position = queue_item_ids.index(current_item_id)
 
+    # Identifiers and names repeat on every update, so intern them and share
+    # the capability tuples between sessions and updates
     return EmbySession(
         session_id=data["Id"],
-        device_id=data["DeviceId"],
-        device_name=data["DeviceName"],
-        client_name=data["Client"],
-        user_id=data.get("UserId"),
-        user_name=data.get("UserName"),
+        device_id=sys.intern(data["DeviceId"]),
+        device_name=sys.intern(data["DeviceName"]),
+        client_name=sys.intern(data["Client"]),
+        user_id=_intern(data.get("UserId")),
+        user_name=_intern(data.get("UserName")),
         supports_remote_control=data.get("SupportsRemoteControl", False),
         now_playing=now_playing,
         play_state=play_state,
         last_activity=last_activity,
-        app_version=data.get("ApplicationVersion"),
-        playable_media_types=tuple(data.get("PlayableMediaTypes", [])),
-        supported_commands=tuple(data.get("SupportedCommands", [])),
+        last_playback_check_in=last_playback_check_in,
+        app_version=_intern(data.get("ApplicationVersion")),
+        playable_media_types=_shared_string_tuple(data.get("PlayableMediaTypes", [])),
+        supported_commands=_shared_string_tuple(data.get("SupportedCommands", [])),
         queue_item_ids=queue_item_ids,
         queue_position=queue_position,
     )
 
 
 __all__ = [
+    "MEDIA_ITEM_CACHE_SIZE",
+    "STRING_TUPLE_CACHE_SIZE",
     "EmbyMediaItem",
     "EmbyPlaybackState",
     "EmbySession",
     "MediaType",
+    "PlaybackRecord",
     "parse_media_item",
     "parse_play_state",
     "parse_session",
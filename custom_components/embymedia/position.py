@@ -0,0 +1,184 @@
+"""Client-side playback position extrapolation.
+
+Emby only reports a session's position when it pushes a Sessions message or
+when the coordinator polls. Between those updates Home Assistant shows the
+last reported position. This module keeps a per-session anchor (position,
+timestamp, paused state and playback rate) so the position can be
+extrapolated between updates, and only moves the anchor when the reported
+position disagrees with the prediction (seek, pause, rate change, new item).
+
+Keeping the anchor stable across matching updates also means the entity's
+``media_position``/``media_position_updated_at`` attributes do not change on
+every push, avoiding needless state writes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import EmbySession
+
+# Reported positions within this many seconds of the prediction keep the anchor
+POSITION_DRIFT_TOLERANCE = 2.0
+
+# Without a check-in timestamp the reported position may lag by up to one
+# client report interval, so allow more backward drift before re-anchoring
+POSITION_LAG_TOLERANCE = 12.0
+
+
+@dataclass(frozen=True, slots=True)
+class PositionAnchor:
+    """Known playback position at a point in time.
+
+    Attributes:
+        item_id: ID of the item being played.
+        position_seconds: Position at updated_at in seconds.
+        updated_at: When the position was sampled (UTC).
+        is_paused: Whether playback was paused at updated_at.
+        playback_rate: Playback speed multiplier (1.0 = normal speed).
+        duration_seconds: Item duration used to clamp extrapolation.
+    """
+
+    item_id: str
+    position_seconds: float
+    updated_at: datetime
+    is_paused: bool = False
+    playback_rate: float = 1.0
+    duration_seconds: float | None = None
+
+    def position_at(self, now: datetime) -> float:
+        """Extrapolate the position at a given time.
+
+        Args:
+            now: Time to extrapolate to (UTC).
+
+        Returns:
+            Estimated position in seconds, clamped to the item duration.
+        """
+        if self.is_paused:
+            return self.position_seconds
+
+        elapsed = max((now - self.updated_at).total_seconds(), 0.0)
+        position = self.position_seconds + elapsed * self.playback_rate
+        if self.duration_seconds is not None:
+            position = min(position, self.duration_seconds)
+        return max(position, 0.0)
+
+
+class PlaybackPositionModel:
+    """Tracks the playback position of a single session between updates.
+
+    Call update() with every session snapshot received from the coordinator;
+    position_at() then returns the extrapolated position at any time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the position model."""
+        self._anchor: PositionAnchor | None = None
+
+    @property
+    def anchor(self) -> PositionAnchor | None:
+        """Return the current anchor, or None if nothing is playing."""
+        return self._anchor
+
+    def update(self, session: EmbySession | None, now: datetime) -> bool:
+        """Update the model from a session snapshot.
+
+        Args:
+            session: Latest session data, or None if the session is gone.
+            now: Time the snapshot was received (UTC).
+
+        Returns:
+            True if the anchor changed, False if the prediction still holds.
+        """
+        if session is None or session.now_playing is None or session.play_state is None:
+            changed = self._anchor is not None
+            self._anchor = None
+            return changed
+
+        play_state = session.play_state
+        check_in = session.last_playback_check_in
+        has_check_in = check_in is not None
+        sampled_at = now
+        if check_in is not None:
+            # Emby may omit the offset; its timestamps are UTC
+            if check_in.tzinfo is None:
+                check_in = check_in.replace(tzinfo=UTC)
+            # Prefer the client's own check-in time; never trust one from the future
+            sampled_at = min(check_in, now)
+
+        candidate = PositionAnchor(
+            item_id=session.now_playing.item_id,
+            position_seconds=play_state.position_seconds,
+            updated_at=sampled_at,
+            is_paused=play_state.is_paused,
+            playback_rate=play_state.playback_rate,
+            duration_seconds=session.now_playing.duration_seconds,
+        )
+
+        if self._anchor is not None and self._prediction_holds(
+            self._anchor,
+            candidate,
+            has_check_in=has_check_in,
+        ):
+            return False
+
+        self._anchor = candidate
+        return True
+
+    def position_at(self, now: datetime) -> float | None:
+        """Return the extrapolated position.
+
+        Args:
+            now: Time to extrapolate to (UTC).
+
+        Returns:
+            Estimated position in seconds, or None if nothing is playing.
+        """
+        if self._anchor is None:
+            return None
+        return self._anchor.position_at(now)
+
+    @staticmethod
+    def _prediction_holds(
+        anchor: PositionAnchor,
+        observed: PositionAnchor,
+        *,
+        has_check_in: bool,
+    ) -> bool:
+        """Check whether an observation matches the current anchor.
+
+        Args:
+            anchor: Current anchor.
+            observed: Anchor built from the latest observation.
+            has_check_in: Whether the observation carries its own timestamp.
+
+        Returns:
+            True if the anchor can be kept.
+        """
+        if (
+            anchor.item_id != observed.item_id
+            or anchor.is_paused != observed.is_paused
+            or anchor.playback_rate != observed.playback_rate
+            or anchor.duration_seconds != observed.duration_seconds
+        ):
+            return False
+
+        # Frontends extrapolate at normal speed, so other rates always re-anchor
+        if anchor.playback_rate != 1.0:
+            return False
+
+        drift = observed.position_seconds - anchor.position_at(observed.updated_at)
+        lag_tolerance = POSITION_DRIFT_TOLERANCE if has_check_in else POSITION_LAG_TOLERANCE
+        return -lag_tolerance <= drift <= POSITION_DRIFT_TOLERANCE
+
+
+__all__ = [
+    "POSITION_DRIFT_TOLERANCE",
+    "POSITION_LAG_TOLERANCE",
+    "PlaybackPositionModel",
+    "PositionAnchor",
+]
@@ -0,0 +1,311 @@
+"""WebSocket traffic recording and replay.
+
+The recorder captures every text frame received by EmbyWebSocket together
+with its arrival time, so the load a real server generates can be replayed
+offline. Recordings are gzip-compressed JSON Lines files: a header line
+followed by one ``[offset_seconds, raw_frame]`` array per frame.
+
+The replay driver feeds a recording into a message handler (normally
+``EmbyDataUpdateCoordinator._handle_websocket_message``) at real or
+accelerated speed and reports events per second, handler time and the
+number of state writes the frames caused.
+
+Recording is opt-in and file I/O never happens on the event loop: frames are
+buffered in memory and handed to an executor job in batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .metrics import LatencyHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDING_FORMAT_VERSION = 1
+# Buffered frames are handed off for writing once this many are pending
+DEFAULT_FLUSH_FRAMES = 200
+# Recording stops after this many frames to bound disk usage
+DEFAULT_MAX_FRAMES = 500_000
+
+# Frames consumed by EmbyWebSocket itself and never dispatched
+_INTERNAL_MESSAGE_TYPES = frozenset({"KeepAlive", "ForceKeepAlive"})
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedFrame:
+    """A single recorded WebSocket frame.
+
+    Attributes:
+        offset: Seconds since the recording started.
+        raw: Raw text frame as received from the server.
+    """
+
+    offset: float
+    raw: str
+
+
+class WebSocketRecorder:
+    """Buffers received WebSocket frames and writes them to a recording file.
+
+    record() is called from the event loop for every text frame. Once
+    DEFAULT_FLUSH_FRAMES frames are pending the flush callback is invoked;
+    the owner then calls take_pending() on the loop and write() in an
+    executor.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        flush_frames: int = DEFAULT_FLUSH_FRAMES,
+        max_frames: int = DEFAULT_MAX_FRAMES,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            path: Recording file to append to.
+            flush_frames: Pending frame count that triggers the flush callback.
+            max_frames: Total frames after which recording stops.
+        """
+        self._path = Path(path)
+        self._flush_frames = flush_frames
+        self._max_frames = max_frames
+        self._pending: list[RecordedFrame] = []
+        self._started_at: float | None = None
+        self._frames_recorded = 0
+        self._flush_callback: Callable[[], None] | None = None
+
+    @property
+    def path(self) -> Path:
+        """Return the recording file path."""
+        return self._path
+
+    @property
+    def frames_recorded(self) -> int:
+        """Return the number of frames recorded so far."""
+        return self._frames_recorded
+
+    @property
+    def pending(self) -> int:
+        """Return the number of frames not yet handed off for writing."""
+        return len(self._pending)
+
+    def set_flush_callback(self, callback: Callable[[], None]) -> None:
+        """Set the callback invoked when enough frames are pending.
+
+        Args:
+            callback: Function scheduling take_pending()/write().
+        """
+        self._flush_callback = callback
+
+    def record(self, raw: str, now: float) -> None:
+        """Record a received text frame.
+
+        Args:
+            raw: Raw text frame.
+            now: Monotonic time the frame was received.
+        """
+        if self._frames_recorded >= self._max_frames:
+            return
+        if self._started_at is None:
+            self._started_at = now
+
+        self._pending.append(RecordedFrame(round(now - self._started_at, 4), raw))
+        self._frames_recorded += 1
+        if self._frames_recorded == self._max_frames:
+            _LOGGER.warning(
+                "WebSocket recording reached %d frames, stopping: %s",
+                self._max_frames,
+                self._path,
+            )
+
+        if len(self._pending) >= self._flush_frames and self._flush_callback is not None:
+            self._flush_callback()
+
+    def take_pending(self) -> list[RecordedFrame]:
+        """Remove and return the buffered frames.
+
+        Must be called from the event loop, before handing the frames to
+        write() in an executor.
+
+        Returns:
+            Frames recorded since the last call.
+        """
+        frames = self._pending
+        self._pending = []
+        return frames
+
+    def write(self, frames: list[RecordedFrame]) -> None:
+        """Append frames to the recording file.
+
+        Blocking; run in an executor. Each call appends a gzip member, which
+        gzip readers concatenate transparently.
+
+        Args:
+            frames: Frames returned by take_pending().
+        """
+        if not frames:
+            return
+        lines: list[str] = []
+        if not self._path.exists():
+            lines.append(json.dumps({"version": RECORDING_FORMAT_VERSION}))
+        lines.extend(json.dumps([frame.offset, frame.raw]) for frame in frames)
+        try:
+            with gzip.open(self._path, "at", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        except OSError as err:
+            _LOGGER.warning("Failed to write WebSocket recording %s: %s", self._path, err)
+
+
+def load_recording(path: str | Path) -> list[RecordedFrame]:
+    """Load a recording file.
+
+    Blocking; run in an executor when called from the event loop.
+
+    Args:
+        path: Recording file written by WebSocketRecorder.
+
+    Returns:
+        Recorded frames in arrival order.
+
+    Raises:
+        ValueError: If the file is not a supported recording.
+    """
+    frames: list[RecordedFrame] = []
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline() or "{}")
+        if header.get("version") != RECORDING_FORMAT_VERSION:
+            raise ValueError(f"Unsupported WebSocket recording: {path}")
+        for line in file:
+            if line.strip():
+                offset, raw = json.loads(line)
+                frames.append(RecordedFrame(float(offset), str(raw)))
+    return frames
+
+
+@dataclass
+class ReplayStats:
+    """Results of replaying a recording.
+
+    Attributes:
+        frames: Frames read from the recording.
+        events: Messages dispatched to the handler.
+        skipped: Frames not dispatched (keepalives and malformed JSON).
+        state_writes: State writes caused by the dispatched messages.
+        wall_seconds: Wall-clock duration of the replay.
+        handler_time: Handler execution time per dispatched message.
+        per_type: Dispatched message count per message type.
+    """
+
+    frames: int = 0
+    events: int = 0
+    skipped: int = 0
+    state_writes: int = 0
+    wall_seconds: float = 0.0
+    handler_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    per_type: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def events_per_second(self) -> float:
+        """Calculate dispatched messages per wall-clock second.
+
+        Returns:
+            Event rate, or 0 if the replay took no measurable time.
+        """
+        if self.wall_seconds <= 0:
+            return 0.0
+        return self.events / self.wall_seconds
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for reporting.
+
+        Returns:
+            Dictionary with counts, event rate and handler time histogram.
+        """
+        return {
+            "frames": self.frames,
+            "events": self.events,
+            "skipped": self.skipped,
+            "state_writes": self.state_writes,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "events_per_second": round(self.events_per_second, 1),
+            "handler_time": self.handler_time.to_dict(),
+            "per_type": dict(sorted(self.per_type.items())),
+        }
+
+
+async def async_replay(
+    frames: Iterable[RecordedFrame],
+    handler: Callable[[str, Any], None],
+    speed: float = 0.0,
+    state_writes: Callable[[], int] | None = None,
+) -> ReplayStats:
+    """Replay recorded frames into a WebSocket message handler.
+
+    Frames are decoded and filtered like EmbyWebSocket._process_message
+    does before dispatching.
+
+    Args:
+        frames: Recorded frames in arrival order.
+        handler: Called with (message_type, data) for each dispatched frame.
+        speed: Playback speed relative to the recording (1.0 = real time,
+            10.0 = ten times faster). 0 replays as fast as possible.
+        state_writes: Optional function returning the running number of
+            state writes, sampled before and after the replay.
+
+    Returns:
+        Replay statistics.
+    """
+    stats = ReplayStats()
+    writes_before = state_writes() if state_writes is not None else 0
+    start = time.perf_counter()
+
+    for frame in frames:
+        stats.frames += 1
+        if speed > 0:
+            delay = start + frame.offset / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        try:
+            message = json.loads(frame.raw)
+        except json.JSONDecodeError:
+            stats.skipped += 1
+            continue
+        message_type = message.get("MessageType", "Unknown")
+        if message_type in _INTERNAL_MESSAGE_TYPES:
+            stats.skipped += 1
+            continue
+
+        handler_start = time.perf_counter()
+        handler(message_type, message.get("Data"))
+        stats.handler_time.observe((time.perf_counter() - handler_start) * 1000)
+        stats.events += 1
+        stats.per_type[message_type] = stats.per_type.get(message_type, 0) + 1
+        # Let callbacks and tasks scheduled by the handler run
+        await asyncio.sleep(0)
+
+    stats.wall_seconds = time.perf_counter() - start
+    if state_writes is not None:
+        stats.state_writes = state_writes() - writes_before
+    return stats
+
+
+__all__ = [
+    "DEFAULT_FLUSH_FRAMES",
+    "DEFAULT_MAX_FRAMES",
+    "RECORDING_FORMAT_VERSION",
+    "RecordedFrame",
+    "ReplayStats",
+    "WebSocketRecorder",
+    "async_replay",
+    "load_recording",
+]
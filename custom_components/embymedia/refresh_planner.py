@@ -0,0 +1,432 @@
+"""Budgeted refreshes of a server's coordinators.
+
+Each coordinator keeps its own schedule (timers, the discovery scheduler,
+WebSocket events), so refreshes of the server, library and discovery
+coordinators regularly line up into bursts, and nothing limits the overall
+request rate against a server. RefreshPlanner sits between those schedules
+and the server. Without a request budget it only records per-refresh
+statistics and never delays a refresh. With a budget a refresh starts as
+soon as enough of the budget is left for its expected number of requests
+(after subtracting what already running refreshes are still expected to
+make), up to REFRESH_PLANNER_MAX_CONCURRENT at once. Arriving refreshes are
+dispatched on the next loop iteration, so refreshes due together and those
+already waiting are ordered by entity demand first, then by staleness (time
+since their last refresh relative to their interval).
+
+The budget is a token bucket refilled at the configured requests/minute and
+drained by every request the client makes, including session polling and
+service calls, which are never delayed themselves. Before async_start() is
+called (i.e. during setup) refreshes are not planned at all.
+
+Example usage:
+    planner = RefreshPlanner(hass, entry, client.metrics, budget=60)
+    async with planned_refresh(entry, "library", interval=3600):
+        ...  # fetch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import REFRESH_PLANNER_MAX_CONCURRENT
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .const import EmbyConfigEntry
+    from .metrics import MetricsCollector
+
+_LOGGER = logging.getLogger(__name__)
+
+# Window (seconds) over which the actual request rate is measured
+RATE_WINDOW = 60.0
+
+# Weight of the latest refresh in a refresh's expected request count
+_COST_SMOOTHING = 0.3
+
+
+@dataclass(slots=True)
+class PlannedRefreshStats:
+    """Planning statistics for one refresh.
+
+    Attributes:
+        interval: Seconds between regular refreshes, 0 if unknown.
+        cost: Expected number of requests per refresh (moving average).
+        last_refresh: Monotonic time the latest refresh finished.
+        refresh_count: Number of refreshes run.
+        budget_waits: Refreshes that had to wait for the request budget.
+        total_wait_ms: Time spent waiting for a turn, over all refreshes.
+    """
+
+    interval: float = 0.0
+    cost: float = 1.0
+    last_refresh: float | None = None
+    refresh_count: int = 0
+    budget_waits: int = 0
+    total_wait_ms: float = 0.0
+
+    def staleness(self, now: float) -> float:
+        """Return how overdue the refresh is.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Time since the latest refresh in intervals (or seconds if the
+            interval is unknown); infinite if it never ran.
+        """
+        if self.last_refresh is None:
+            return float("inf")
+        return (now - self.last_refresh) / (self.interval or 1.0)
+
+    def record(self, requests: int, wait_ms: float) -> None:
+        """Record a finished refresh.
+
+        Args:
+            requests: Requests made while the refresh ran.
+            wait_ms: Time the refresh waited for its turn.
+        """
+        self.last_refresh = time.monotonic()
+        self.refresh_count += 1
+        self.total_wait_ms += wait_ms
+        if self.refresh_count == 1:
+            self.cost = float(requests)
+        else:
+            self.cost += _COST_SMOOTHING * (requests - self.cost)
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for diagnostics.
+
+        Returns:
+            Dictionary with the refresh's interval, cost and wait statistics.
+        """
+        return {
+            "interval_seconds": self.interval,
+            "requests_per_refresh": round(self.cost, 1),
+            "refresh_count": self.refresh_count,
+            "budget_waits": self.budget_waits,
+            "avg_wait_ms": round(self.total_wait_ms / self.refresh_count, 1)
+            if self.refresh_count
+            else 0.0,
+        }
+
+
+@dataclass(slots=True)
+class _Waiter:
+    """A refresh waiting for its turn."""
+
+    name: str
+    demand: bool
+    order: int
+    future: asyncio.Future[None]
+    since: float = field(default_factory=time.monotonic)
+    budget_wait: bool = False
+    # Budget reserved when the refresh started, and the request count then
+    cost: float = 0.0
+    calls_at_start: int = 0
+
+
+class RefreshPlanner:
+    """Orders and paces the planned refreshes of a config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: EmbyConfigEntry,
+        metrics: MetricsCollector,
+        budget: int = 0,
+        *,
+        max_concurrent: int = REFRESH_PLANNER_MAX_CONCURRENT,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            hass: Home Assistant instance.
+            config_entry: Config entry owning the coordinators; planning stops
+                when it is unloaded.
+            metrics: Metrics of the entry's client, counting its requests.
+            budget: Maximum requests per minute (0 = unlimited).
+            max_concurrent: Maximum number of refreshes running at once
+                while a budget is set.
+        """
+        self._hass = hass
+        self._config_entry = config_entry
+        self._metrics = metrics
+        self._budget = budget
+        self._max_concurrent = max_concurrent
+        self._started = False
+        self._waiters: list[_Waiter] = []
+        self._order = itertools.count()
+        self._running: list[_Waiter] = []
+        self._stats: dict[str, PlannedRefreshStats] = {}
+        self._tokens = float(budget)
+        self._synced_at = time.monotonic()
+        self._synced_calls = metrics.total_api_calls
+        # (monotonic time, total API calls) samples for the actual rate
+        self._samples: deque[tuple[float, int]] = deque()
+        self._cancel_retry: CALLBACK_TYPE | None = None
+        self._dispatch_scheduled = False
+
+    @property
+    def budget(self) -> int:
+        """Return the request budget.
+
+        Returns:
+            Maximum requests per minute, 0 if unlimited.
+        """
+        return self._budget
+
+    def get_stats(self, name: str) -> PlannedRefreshStats | None:
+        """Get the planning statistics of a refresh.
+
+        Args:
+            name: Name of the refresh.
+
+        Returns:
+            The statistics, or None if the refresh was never planned.
+        """
+        return self._stats.get(name)
+
+    @callback
+    def async_start(self) -> None:
+        """Start planning refreshes; requests made during setup are not charged."""
+        self._started = True
+        self._tokens = float(self._budget)
+        self._synced_at = time.monotonic()
+        self._synced_calls = self._metrics.total_api_calls
+        self._samples.append((self._synced_at, self._synced_calls))
+        self._config_entry.async_on_unload(self._async_stop)
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop planning and let waiting refreshes run."""
+        self._started = False
+        if self._cancel_retry is not None:
+            self._cancel_retry()
+            self._cancel_retry = None
+        for waiter in self._waiters:
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+        self._waiters.clear()
+
+    @asynccontextmanager
+    async def async_slot(
+        self, name: str, *, interval: float = 0.0, demand: bool = True
+    ) -> AsyncIterator[None]:
+        """Wait for a refresh's turn and account for its requests.
+
+        Without a budget the refresh starts right away and is only counted.
+
+        Args:
+            name: Name of the refresh.
+            interval: Seconds between its regular refreshes, for staleness.
+            demand: Whether entities currently use the refreshed data.
+
+        Yields:
+            None; the refresh runs inside the async with block.
+        """
+        if not self._started:
+            yield
+            return
+        stats = self._stats.setdefault(name, PlannedRefreshStats())
+        stats.interval = interval
+        waiter: _Waiter | None = None
+        wait_ms = 0.0
+        if self._budget:
+            waiter = _Waiter(name, demand, next(self._order), self._hass.loop.create_future())
+            self._waiters.append(waiter)
+            self._schedule_dispatch()
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                self._release(waiter)
+                raise
+            wait_ms = (time.monotonic() - waiter.since) * 1000
+            if waiter.budget_wait:
+                stats.budget_waits += 1
+        calls_before = self._metrics.total_api_calls
+        try:
+            yield
+        finally:
+            stats.record(max(self._metrics.total_api_calls - calls_before, 0), wait_ms)
+            if waiter is not None:
+                self._release(waiter)
+
+    @callback
+    def _release(self, waiter: _Waiter) -> None:
+        """Forget a finished or cancelled refresh and start waiting ones.
+
+        Args:
+            waiter: The refresh, waiting or running.
+        """
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+        elif waiter in self._running:
+            self._running.remove(waiter)
+            self._dispatch()
+
+    def _sync(self) -> None:
+        """Refill the budget and drain it by the requests made since."""
+        now = time.monotonic()
+        calls = self._metrics.total_api_calls
+        # A reset of the API metrics restarts the count
+        used = calls - self._synced_calls if calls >= self._synced_calls else calls
+        if self._budget:
+            refill = (now - self._synced_at) * self._budget / 60
+            self._tokens = min(self._tokens + refill, float(self._budget)) - used
+        self._synced_at = now
+        self._synced_calls = calls
+        self._samples.append((now, calls))
+        while len(self._samples) > 2 and self._samples[1][0] <= now - RATE_WINDOW:
+            self._samples.popleft()
+
+    @callback
+    def _schedule_dispatch(self) -> None:
+        """Dispatch on the next loop iteration.
+
+        Refreshes that become due together (e.g. from the same timer tick)
+        are all queued by then, so they start in demand order rather than in
+        order of arrival.
+        """
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            self._hass.loop.call_soon(self._async_scheduled_dispatch)
+
+    @callback
+    def _async_scheduled_dispatch(self) -> None:
+        """Run a dispatch scheduled by _schedule_dispatch()."""
+        self._dispatch_scheduled = False
+        self._dispatch()
+
+    def _available(self) -> float:
+        """Return the budget left after the requests running refreshes still expect.
+
+        Returns:
+            Available tokens; requests a running refresh already made have
+            been drained from the bucket, only the rest stays reserved.
+        """
+        calls = self._metrics.total_api_calls
+        reserved = sum(
+            max(waiter.cost - max(calls - waiter.calls_at_start, 0), 0.0)
+            for waiter in self._running
+        )
+        return self._tokens - reserved
+
+    @callback
+    def _dispatch(self) -> None:
+        """Start the most important waiting refreshes that fit the budget."""
+        if not self._waiters:
+            return
+        self._sync()
+        now = time.monotonic()
+        while self._waiters and len(self._running) < self._max_concurrent:
+            waiter = max(
+                self._waiters,
+                key=lambda w: (w.demand, self._stats[w.name].staleness(now), -w.order),
+            )
+            # A refresh costing more than the whole budget runs once it is full
+            cost = min(self._stats[waiter.name].cost, float(self._budget))
+            available = self._available()
+            if available < cost:
+                waiter.budget_wait = True
+                if self._cancel_retry is None:
+                    delay = (cost - available) * 60 / self._budget
+                    self._cancel_retry = async_call_later(self._hass, delay, self._async_retry)
+                return
+            self._waiters.remove(waiter)
+            waiter.cost = cost
+            waiter.calls_at_start = self._metrics.total_api_calls
+            self._running.append(waiter)
+            waiter.future.set_result(None)
+
+    @callback
+    def _async_retry(self, _now: datetime) -> None:
+        """Retry dispatching once enough budget has been refilled.
+
+        Args:
+            _now: Time of the retry.
+        """
+        self._cancel_retry = None
+        self._dispatch()
+
+    def actual_rate(self) -> float:
+        """Return the measured request rate.
+
+        Returns:
+            Requests per minute over the last RATE_WINDOW seconds.
+        """
+        self._sync()
+        (first_at, first_calls), (last_at, last_calls) = self._samples[0], self._samples[-1]
+        if last_at <= first_at or last_calls < first_calls:
+            return 0.0
+        return (last_calls - first_calls) * 60 / (last_at - first_at)
+
+    def planned_rate(self) -> float:
+        """Return the request rate the planned refreshes are expected to need.
+
+        Returns:
+            Requests per minute of all refreshes with a known interval.
+        """
+        return sum(
+            stats.cost * 60 / stats.interval for stats in self._stats.values() if stats.interval
+        )
+
+    def to_diagnostics(self) -> dict[str, object]:
+        """Convert the planner state to diagnostics format.
+
+        Returns:
+            Dictionary with the budget, planned and actual request rates,
+            running and waiting refreshes and per-refresh statistics.
+        """
+        actual = self.actual_rate()
+        return {
+            "budget_per_minute": self._budget or None,
+            "budget_remaining": round(self._tokens, 1) if self._budget else None,
+            "max_concurrent": self._max_concurrent,
+            "planned_per_minute": round(self.planned_rate(), 1),
+            "actual_per_minute": round(actual, 1),
+            "running": [waiter.name for waiter in self._running],
+            "waiting": [waiter.name for waiter in self._waiters],
+            "refreshes": {name: stats.to_dict() for name, stats in self._stats.items()},
+        }
+
+
+def planned_refresh(
+    config_entry: EmbyConfigEntry | None,
+    name: str,
+    *,
+    interval: float = 0.0,
+    demand: bool = True,
+) -> AbstractAsyncContextManager[None]:
+    """Return the planner slot for a coordinator refresh.
+
+    Args:
+        config_entry: Config entry of the coordinator.
+        name: Name of the refresh.
+        interval: Seconds between its regular refreshes.
+        demand: Whether entities currently use the refreshed data.
+
+    Returns:
+        The planner's slot, or a no-op context if the entry has no planner.
+    """
+    runtime_data = getattr(config_entry, "runtime_data", None)
+    planner = getattr(runtime_data, "refresh_planner", None)
+    if not isinstance(planner, RefreshPlanner):
+        return nullcontext()
+    return planner.async_slot(name, interval=interval, demand=demand)
+
+
+__all__ = ["PlannedRefreshStats", "RefreshPlanner", "planned_refresh"]
@@ -833,10 +833,10 @@ class EmbyWatchStatisticsSensor(EmbySessionSensorBase):
         session_list: list[dict[str, str | int]] = [
             {
                 "session_id": session_id,
-                "item_name": str(session_data.get("item_name", "Unknown")),
-                "item_id": str(session_data.get("item_id", "")),
+                "item_name": record.item_name,
+                "item_id": record.item_id,
             }
-            for session_id, session_data in sessions.items()
+            for session_id, record in sessions.items()
         ]
 
         return {
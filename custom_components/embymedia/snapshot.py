@@ -0,0 +1,227 @@
+"""Persisted snapshots of coordinator data.
+
+After a restart the server, library and discovery sensors would stay
+unavailable until their first fetch succeeds, and setup would have to wait
+for those fetches. CoordinatorSnapshotStore persists the last successful
+data of these coordinators with a Home Assistant Store and restores it as
+their initial data at setup; restored coordinators are then refreshed in
+the background. Snapshots carry a format version and are only restored if
+it matches SNAPSHOT_VERSION and they are younger than SNAPSHOT_MAX_AGE.
+Writes are batched: at most one save per SNAPSHOT_SAVE_INTERVAL seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SNAPSHOT_MAX_AGE, SNAPSHOT_SAVE_INTERVAL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    from .const import EmbyConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Version of the stored coordinator data; bump it whenever EmbyServerData,
+# EmbyLibraryData or EmbyDiscoveryData change shape so that snapshots in
+# the old shape are discarded instead of restored
+SNAPSHOT_VERSION = 1
+
+
+class CoordinatorSnapshot(TypedDict):
+    """Stored data of one coordinator.
+
+    Attributes:
+        saved_at: Unix time the data was saved.
+        data: The coordinator data.
+    """
+
+    saved_at: float
+    data: dict[str, Any]
+
+
+class SnapshotData(TypedDict):
+    """Stored snapshots of a config entry.
+
+    Attributes:
+        version: SNAPSHOT_VERSION the snapshots were written with.
+        snapshots: Snapshot name -> coordinator snapshot.
+    """
+
+    version: int
+    snapshots: dict[str, CoordinatorSnapshot]
+
+
+class CoordinatorSnapshotStore:
+    """Saves and restores the data of a config entry's coordinators.
+
+    Coordinators are registered under a name with restore(). Until
+    async_start() is called nothing is written.
+    """
+
+    def __init__(self, hass: HomeAssistant, server_id: str) -> None:
+        """Initialize the store.
+
+        Args:
+            hass: Home Assistant instance.
+            server_id: Emby server ID, used in the storage key.
+        """
+        self._hass = hass
+        self._key = f"{DOMAIN}.snapshot_{server_id}"
+        self._store: Store[SnapshotData] = Store(hass, STORAGE_VERSION, self._key)
+        self._snapshots: dict[str, CoordinatorSnapshot] = {}
+        self._coordinators: dict[str, DataUpdateCoordinator[Any]] = {}
+        # Name -> data object restored into the coordinator; the coordinator
+        # is stale for as long as its data is still that object
+        self._restored: dict[str, object] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored snapshots that are current enough to restore."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        if stored.get("version") != SNAPSHOT_VERSION:
+            _LOGGER.debug(
+                "Discarding snapshots in %s with version %s",
+                self._key,
+                stored.get("version"),
+            )
+            return
+        cutoff = time.time() - SNAPSHOT_MAX_AGE
+        self._snapshots = {
+            name: snapshot
+            for name, snapshot in stored.get("snapshots", {}).items()
+            if snapshot.get("saved_at", 0) >= cutoff
+        }
+        _LOGGER.debug("Loaded %d snapshots from %s", len(self._snapshots), self._key)
+
+    def restore(self, name: str, coordinator: DataUpdateCoordinator[Any]) -> bool:
+        """Register a coordinator and restore its snapshot as initial data.
+
+        Args:
+            name: Name of the coordinator's snapshot.
+            coordinator: The coordinator; its data is saved from now on.
+
+        Returns:
+            True if a snapshot was restored and the coordinator still needs
+            a refresh.
+        """
+        self._coordinators[name] = coordinator
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            return False
+        coordinator.data = snapshot["data"]
+        self._restored[name] = snapshot["data"]
+        return True
+
+    def is_restored(self, name: str) -> bool:
+        """Return True if a coordinator still holds its restored snapshot.
+
+        Args:
+            name: Name of the coordinator's snapshot.
+
+        Returns:
+            Whether the coordinator has not been refreshed since the restore.
+        """
+        coordinator = self._coordinators.get(name)
+        return (
+            coordinator is not None
+            and name in self._restored
+            and coordinator.data is self._restored[name]
+        )
+
+    @callback
+    def async_start(self, entry: EmbyConfigEntry) -> None:
+        """Start saving the registered coordinators' data periodically.
+
+        Args:
+            entry: Config entry owning the coordinators; saving stops when it
+                is unloaded.
+        """
+        entry.async_on_unload(
+            async_track_time_interval(
+                self._hass,
+                self._async_schedule_save,
+                timedelta(seconds=SNAPSHOT_SAVE_INTERVAL),
+            )
+        )
+        self._schedule_save()
+
+    async def async_flush(self) -> None:
+        """Write a pending save immediately."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_schedule_save(self, _now: datetime) -> None:
+        """Schedule a save on every save interval.
+
+        Args:
+            _now: Time of the interval tick.
+        """
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule a batched write unless one is already pending."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_INTERVAL)
+
+    def _data_to_save(self) -> SnapshotData:
+        """Return the snapshots to write.
+
+        Coordinators whose latest refresh failed, or that still hold their
+        restored data, keep their previous snapshot.
+
+        Returns:
+            Data to persist.
+        """
+        self._save_pending = False
+        now = time.time()
+        for name, coordinator in self._coordinators.items():
+            if (
+                not coordinator.last_update_success
+                or not isinstance(coordinator.data, dict)
+                or self.is_restored(name)
+            ):
+                continue
+            self._snapshots[name] = {"saved_at": now, "data": dict(coordinator.data)}
+        return {"version": SNAPSHOT_VERSION, "snapshots": dict(self._snapshots)}
+
+    def to_diagnostics(self) -> dict[str, object]:
+        """Convert the snapshots to diagnostics format.
+
+        Returns:
+            Dictionary with, per snapshot, when it was saved and whether its
+            coordinator still holds the restored data.
+        """
+        return {
+            name: {
+                "saved_at": dt_util.utc_from_timestamp(snapshot["saved_at"]).isoformat(),
+                "restored": self.is_restored(name),
+            }
+            for name, snapshot in self._snapshots.items()
+        }
+
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "STORAGE_VERSION",
+    "CoordinatorSnapshot",
+    "CoordinatorSnapshotStore",
+    "SnapshotData",
+]
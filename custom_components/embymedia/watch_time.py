@@ -0,0 +1,197 @@
+"""Persisted watch-time statistics.
+
+Watch time is accumulated per user in per-day buckets and persisted with a
+Home Assistant Store, so the watch statistics sensors keep today's totals
+across restarts. Updates from the WebSocket path are O(1): the current day's
+bucket is kept as a direct reference and the day boundary is a precomputed
+timestamp. Writes are batched: at most one save is scheduled per
+WATCH_TIME_SAVE_DELAY seconds regardless of how many updates arrive.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Mapping
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, TypedDict
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_WATCH_TIME_RETENTION_DAYS, DOMAIN, WATCH_TIME_SAVE_DELAY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class WatchTimeData(TypedDict):
+    """Stored watch-time data.
+
+    Attributes:
+        days: ISO date -> user ID -> seconds watched.
+    """
+
+    days: dict[str, dict[str, int]]
+
+
+class WatchTimeStore:
+    """Per-user, per-day watch-time accumulator backed by HA storage.
+
+    Until async_load() is called the store only accumulates in memory.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        server_id: str,
+        retention_days: int = DEFAULT_WATCH_TIME_RETENTION_DAYS,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            hass: Home Assistant instance.
+            server_id: Emby server ID, used in the storage key.
+            retention_days: Number of days (including today) to keep.
+        """
+        self._hass = hass
+        self._key = f"{DOMAIN}.watch_time_{server_id}"
+        self._retention_days = retention_days
+        self._store: Store[WatchTimeData] | None = None
+        self._days: dict[str, dict[str, int]] = {}
+        self._today: dict[str, int] = {}
+        self._day_ends_at = 0.0
+        self._save_pending = False
+
+    @property
+    def today(self) -> dict[str, int]:
+        """Return seconds watched today per user.
+
+        Returns:
+            Mapping of user ID to seconds watched today.
+        """
+        self._check_day()
+        return self._today
+
+    @property
+    def daily_total(self) -> int:
+        """Return seconds watched today by all users.
+
+        Returns:
+            Total seconds watched today.
+        """
+        return sum(self.today.values())
+
+    @property
+    def days(self) -> Mapping[str, Mapping[str, int]]:
+        """Return all retained daily buckets.
+
+        Returns:
+            Mapping of ISO date to per-user seconds watched.
+        """
+        self._check_day()
+        return self._days
+
+    def get_user_time(self, user_id: str) -> int:
+        """Return seconds watched today by a user.
+
+        Args:
+            user_id: The Emby user ID.
+
+        Returns:
+            Seconds watched today, 0 if none.
+        """
+        return self.today.get(user_id, 0)
+
+    def add(self, user_id: str, seconds: int) -> int:
+        """Add watched seconds to a user's bucket for today.
+
+        Args:
+            user_id: The Emby user ID.
+            seconds: Seconds watched since the last update.
+
+        Returns:
+            The user's new total for today.
+        """
+        if time.time() >= self._day_ends_at:
+            self._roll_over()
+        total = self._today.get(user_id, 0) + seconds
+        self._today[user_id] = total
+        self._schedule_save()
+        return total
+
+    async def async_load(self, retention_days: int | None = None) -> None:
+        """Load persisted watch time and start persisting updates.
+
+        Time accumulated before loading is merged into the stored buckets.
+
+        Args:
+            retention_days: Optional new retention period in days.
+        """
+        if retention_days is not None:
+            self._retention_days = retention_days
+        self._store = Store(self._hass, STORAGE_VERSION, self._key)
+        stored = await self._store.async_load()
+        if stored:
+            for day, users in stored.get("days", {}).items():
+                bucket = self._days.setdefault(day, {})
+                for user_id, seconds in users.items():
+                    bucket[user_id] = bucket.get(user_id, 0) + int(seconds)
+        self._roll_over()
+        _LOGGER.debug("Loaded watch time for %d days from %s", len(self._days), self._key)
+
+    async def async_flush(self) -> None:
+        """Write pending updates immediately."""
+        if self._store is not None and self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    def _check_day(self) -> None:
+        """Start a new bucket if the local day has changed."""
+        if time.time() >= self._day_ends_at:
+            self._roll_over()
+
+    def _roll_over(self) -> None:
+        """Point at today's bucket and drop days past the retention period."""
+        today = dt_util.now().date()
+        self._today = self._days.setdefault(today.isoformat(), {})
+        self._day_ends_at = dt_util.start_of_local_day(today + timedelta(days=1)).timestamp()
+        if self._prune(today):
+            self._schedule_save()
+
+    def _prune(self, today: date) -> bool:
+        """Drop buckets older than the retention period.
+
+        Args:
+            today: The current local date.
+
+        Returns:
+            True if any bucket was dropped.
+        """
+        cutoff = (today - timedelta(days=self._retention_days - 1)).isoformat()
+        expired = [day for day in self._days if day < cutoff]
+        for day in expired:
+            del self._days[day]
+        return bool(expired)
+
+    def _schedule_save(self) -> None:
+        """Schedule a batched write unless one is already pending."""
+        if self._store is None or self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, WATCH_TIME_SAVE_DELAY)
+
+    def _data_to_save(self) -> WatchTimeData:
+        """Return a snapshot of the buckets for writing.
+
+        Returns:
+            Data to persist.
+        """
+        self._save_pending = False
+        return {"days": {day: dict(users) for day, users in self._days.items()}}
+
+
+__all__ = ["STORAGE_VERSION", "WatchTimeData", "WatchTimeStore"]
@@ -3,21 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
+import random
+import time
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
 import aiohttp
 
+if TYPE_CHECKING:
+    from .recorder import WebSocketRecorder
+
 _LOGGER = logging.getLogger(__name__)
 
 # Default reconnection settings
 DEFAULT_RECONNECT_INTERVAL = 5.0  # seconds
 DEFAULT_MAX_RECONNECT_INTERVAL = 300.0  # 5 minutes
+# A connection that stayed up this long resets the reconnect backoff
+HEALTHY_UPTIME_RESET = 60.0  # seconds
 # Maximum consecutive JSON decode errors before disconnecting
 MAX_JSON_DECODE_ERRORS = 10
+# Seconds without any message before the connection is considered dead
+DEFAULT_LIVENESS_TIMEOUT = 60.0
+# KeepAlive messages are sent this many times per liveness timeout, so a
+# single lost reply does not trip the deadline
+KEEPALIVES_PER_LIVENESS_TIMEOUT = 3
 
 
 class EmbyWebSocket:
@@ -44,6 +57,7 @@ class EmbyWebSocket:
         session: aiohttp.ClientSession,
         reconnect_interval: float = DEFAULT_RECONNECT_INTERVAL,
         max_reconnect_interval: float = DEFAULT_MAX_RECONNECT_INTERVAL,
+        liveness_timeout: float = DEFAULT_LIVENESS_TIMEOUT,
     ) -> None:
         """Initialize WebSocket client.
 
@@ -56,6 +70,8 @@ class EmbyWebSocket:
             session: aiohttp ClientSession for connections.
             reconnect_interval: Initial reconnection interval in seconds.
             max_reconnect_interval: Maximum reconnection interval in seconds.
+            liveness_timeout: Seconds without any received message before
+                the connection is treated as dead and closed.
         """
         self.host = host
         self.port = port
@@ -68,21 +84,61 @@ class EmbyWebSocket:
         self._connection_callback: Callable[[bool], None] | None = None
         self._reconnect_interval = reconnect_interval
         self._max_reconnect_interval = max_reconnect_interval
+        # Decorrelated jitter state: the previous backoff delay
+        self._backoff = reconnect_interval
+        self._connected_at: float | None = None
+        self._last_connection_uptime: float | None = None
+        self._server_restarting = False
+        self._reconnect_callback: Callable[[float, int], None] | None = None
         self._reconnecting = False
         self._stop_reconnect = False
         self._reconnect_lock = asyncio.Lock()
         self._json_decode_errors = 0
+        self._sessions_interval_ms: int | None = None
+        self._scheduled_tasks_interval_ms: int | None = None
+        self._subscription_lock = asyncio.Lock()
+        # Application-level keepalive and liveness tracking
+        self._liveness_timeout = liveness_timeout
+        self._default_keepalive_interval = liveness_timeout / KEEPALIVES_PER_LIVENESS_TIMEOUT
+        self._keepalive_interval = self._default_keepalive_interval
+        self._last_message_at: float | None = None
+        self._keepalive_sent_at: float | None = None
+        self._liveness_expired = False
+        self._rtt_callback: Callable[[float], None] | None = None
+        self._liveness_callback: Callable[[], None] | None = None
+        # Optional traffic recorder for offline replay
+        self._recorder: WebSocketRecorder | None = None
 
     @property
     def connected(self) -> bool:
         """Return True if WebSocket is connected."""
         return self._ws is not None and not self._ws.closed
 
+    @property
+    def sessions_interval_ms(self) -> int | None:
+        """Return the active session subscription interval, if subscribed."""
+        return self._sessions_interval_ms
+
+    @property
+    def scheduled_tasks_interval_ms(self) -> int | None:
+        """Return the active scheduled task subscription interval, if subscribed."""
+        return self._scheduled_tasks_interval_ms
+
     @property
     def reconnecting(self) -> bool:
         """Return True if attempting to reconnect."""
         return self._reconnecting
 
+    @property
+    def liveness_expired(self) -> bool:
+        """Return True if the last connection was closed for missing the deadline."""
+        return self._liveness_expired
+
+    @property
+    def keepalive_interval(self) -> float:
+        """Return the interval between KeepAlive messages in seconds."""
+        return self._keepalive_interval
+
     def _build_connection_url(self) -> str:
         """Build the WebSocket connection URL.
 
@@ -113,6 +169,15 @@ class EmbyWebSocket:
                 url,
                 heartbeat=30,
             )
+            # A new connection starts without any subscriptions
+            self._sessions_interval_ms = None
+            self._scheduled_tasks_interval_ms = None
+            self._last_message_at = time.monotonic()
+            self._keepalive_sent_at = None
+            # The server sends its ForceKeepAlive timeout again on each connection
+            self._keepalive_interval = self._default_keepalive_interval
+            self._liveness_expired = False
+            self._connected_at = self._last_message_at
             _LOGGER.info("WebSocket connected to Emby server")
 
             if self._connection_callback:
@@ -130,6 +195,9 @@ class EmbyWebSocket:
             _LOGGER.info("WebSocket disconnected")
 
         self._ws = None
+        self._sessions_interval_ms = None
+        self._scheduled_tasks_interval_ms = None
+        self._mark_connection_lost()
 
         if self._connection_callback:
             self._connection_callback(False)
@@ -154,8 +222,29 @@ class EmbyWebSocket:
         )
 
         await self._ws.send_str(message)  # type: ignore[union-attr]
+        self._sessions_interval_ms = interval_ms
         _LOGGER.debug("Subscribed to session updates (interval: %dms)", interval_ms)
 
+    async def async_set_sessions_interval(self, interval_ms: int) -> None:
+        """Change the session subscription interval.
+
+        Emby starts an additional timer for every SessionsStart it receives,
+        so the existing subscription is stopped before subscribing again.
+
+        Args:
+            interval_ms: New update interval in milliseconds.
+
+        Raises:
+            RuntimeError: If not connected.
+        """
+        async with self._subscription_lock:
+            if interval_ms == self._sessions_interval_ms:
+                return
+
+            if self._sessions_interval_ms is not None:
+                await self.async_unsubscribe_sessions()
+            await self.async_subscribe_sessions(interval_ms=interval_ms)
+
     async def async_unsubscribe_sessions(self) -> None:
         """Unsubscribe from session updates.
 
@@ -173,8 +262,52 @@ class EmbyWebSocket:
         )
 
         await self._ws.send_str(message)  # type: ignore[union-attr]
+        self._sessions_interval_ms = None
         _LOGGER.debug("Unsubscribed from session updates")
 
+    async def async_subscribe_scheduled_tasks(self, interval_ms: int = 1500) -> None:
+        """Subscribe to scheduled task state updates (ScheduledTasksInfo).
+
+        Args:
+            interval_ms: Update interval in milliseconds.
+
+        Raises:
+            RuntimeError: If not connected.
+        """
+        if not self.connected:
+            raise RuntimeError("WebSocket is not connected")
+
+        message = json.dumps(
+            {
+                "MessageType": "ScheduledTasksInfoStart",
+                "Data": f"0,{interval_ms}",
+            }
+        )
+
+        await self._ws.send_str(message)  # type: ignore[union-attr]
+        self._scheduled_tasks_interval_ms = interval_ms
+        _LOGGER.debug("Subscribed to scheduled task updates (interval: %dms)", interval_ms)
+
+    async def async_unsubscribe_scheduled_tasks(self) -> None:
+        """Unsubscribe from scheduled task state updates.
+
+        Raises:
+            RuntimeError: If not connected.
+        """
+        if not self.connected:
+            raise RuntimeError("WebSocket is not connected")
+
+        message = json.dumps(
+            {
+                "MessageType": "ScheduledTasksInfoStop",
+                "Data": "",
+            }
+        )
+
+        await self._ws.send_str(message)  # type: ignore[union-attr]
+        self._scheduled_tasks_interval_ms = None
+        _LOGGER.debug("Unsubscribed from scheduled task updates")
+
     def set_message_callback(
         self,
         callback: Callable[[str, Any], None],
@@ -197,6 +330,130 @@ class EmbyWebSocket:
         """
         self._connection_callback = callback
 
+    def set_reconnect_callback(
+        self,
+        callback: Callable[[float, int], None],
+    ) -> None:
+        """Set callback for completed reconnections.
+
+        Args:
+            callback: Function to call with (seconds until reconnected, attempts).
+        """
+        self._reconnect_callback = callback
+
+    def set_rtt_callback(
+        self,
+        callback: Callable[[float], None],
+    ) -> None:
+        """Set callback for KeepAlive round-trip time samples.
+
+        Args:
+            callback: Function to call with the round-trip time in milliseconds.
+        """
+        self._rtt_callback = callback
+
+    def set_liveness_callback(
+        self,
+        callback: Callable[[], None],
+    ) -> None:
+        """Set callback for a missed liveness deadline.
+
+        Called before the dead connection is closed.
+
+        Args:
+            callback: Function to call when no message arrived in time.
+        """
+        self._liveness_callback = callback
+
+    def set_recorder(self, recorder: WebSocketRecorder | None) -> None:
+        """Set a recorder that captures every received text frame.
+
+        Args:
+            recorder: Traffic recorder, or None to stop recording.
+        """
+        self._recorder = recorder
+
+    async def _async_send_keepalive(self) -> None:
+        """Send an application-level KeepAlive message.
+
+        Emby answers each KeepAlive with one of its own, which gives an RTT
+        sample and proves the connection is still alive end to end.
+        """
+        if not self.connected:
+            return
+
+        await self._ws.send_str(json.dumps({"MessageType": "KeepAlive"}))  # type: ignore[union-attr]
+        # Time the latest KeepAlive; a reply to an earlier one that was lost
+        # would otherwise span whole keepalive intervals
+        self._keepalive_sent_at = time.monotonic()
+
+    def _handle_keepalive(self, now: float) -> None:
+        """Handle a KeepAlive message from the server.
+
+        Args:
+            now: Monotonic time the message was received.
+        """
+        if self._keepalive_sent_at is None:
+            return
+
+        rtt_ms = (now - self._keepalive_sent_at) * 1000
+        self._keepalive_sent_at = None
+        _LOGGER.debug("WebSocket KeepAlive round trip: %.1fms", rtt_ms)
+        if self._rtt_callback:
+            self._rtt_callback(rtt_ms)
+
+    def _handle_force_keepalive(self, data: Any) -> None:
+        """Handle a ForceKeepAlive message from the server.
+
+        Emby sends its own inactivity timeout on connect; keep sending
+        KeepAlive messages at least twice per server timeout.
+
+        Args:
+            data: Server inactivity timeout in seconds.
+        """
+        try:
+            server_timeout = float(data)
+        except (TypeError, ValueError):
+            return
+
+        if server_timeout > 0:
+            self._keepalive_interval = min(self._keepalive_interval, server_timeout / 2)
+
+    async def _async_keepalive_loop(self) -> None:
+        """Send KeepAlive messages and enforce the liveness deadline.
+
+        Runs alongside the receive loop. If no message at all arrives within
+        the liveness timeout, the connection is closed so the receive loop
+        ends and the coordinator falls back to polling immediately, instead
+        of waiting on a half-open TCP connection.
+        """
+        next_keepalive = time.monotonic() + self._keepalive_interval
+
+        while self.connected:
+            now = time.monotonic()
+            last_message_at = self._last_message_at or now
+            deadline = last_message_at + self._liveness_timeout
+
+            if now >= deadline:
+                _LOGGER.warning(
+                    "No WebSocket message received for %.0f seconds, closing connection",
+                    now - last_message_at,
+                )
+                self._liveness_expired = True
+                if self._liveness_callback:
+                    self._liveness_callback()
+                await self._ws.close()  # type: ignore[union-attr]
+                return
+
+            if now >= next_keepalive:
+                try:
+                    await self._async_send_keepalive()
+                except (aiohttp.ClientError, ConnectionError) as err:
+                    _LOGGER.debug("Failed to send WebSocket KeepAlive: %s", err)
+                next_keepalive = now + self._keepalive_interval
+
+            await asyncio.sleep(max(min(deadline, next_keepalive) - time.monotonic(), 0))
+
     def _process_message(self, msg: aiohttp.WSMessage) -> bool:
         """Process a received WebSocket message.
 
@@ -207,6 +464,8 @@ class EmbyWebSocket:
             True if processing should continue, False to disconnect.
         """
         if msg.type == aiohttp.WSMsgType.TEXT:
+            if self._recorder is not None:
+                self._recorder.record(msg.data, time.monotonic())
             try:
                 data = json.loads(msg.data)
                 message_type = data.get("MessageType", "Unknown")
@@ -215,6 +474,20 @@ class EmbyWebSocket:
                 _LOGGER.debug("Received WebSocket message: %s", message_type)
                 # Reset error counter on successful parse
                 self._json_decode_errors = 0
+                now = time.monotonic()
+                self._last_message_at = now
+
+                if message_type == "ServerRestarting":
+                    # The server will be back shortly; retry without backoff
+                    self._server_restarting = True
+
+                # Keepalive traffic is handled here and not dispatched
+                if message_type == "KeepAlive":
+                    self._handle_keepalive(now)
+                    return True
+                if message_type == "ForceKeepAlive":
+                    self._handle_force_keepalive(message_data)
+                    return True
 
                 if self._message_callback:
                     self._message_callback(message_type, message_data)
@@ -244,14 +517,25 @@ class EmbyWebSocket:
     async def _async_receive_loop(self) -> None:
         """Receive and process WebSocket messages.
 
-        Loops until the connection is closed or an error occurs.
+        Loops until the connection is closed or an error occurs. A keepalive
+        task runs for the lifetime of the loop.
         """
         if self._ws is None:
             return
 
-        async for msg in self._ws:
-            if not self._process_message(msg):
-                break
+        keepalive_task = asyncio.create_task(self._async_keepalive_loop())
+        try:
+            async for msg in self._ws:
+                if not self._process_message(msg):
+                    break
+        finally:
+            # Let a liveness close finish; cancelling it mid-close would leak
+            # the connection
+            if not self._liveness_expired:
+                keepalive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await keepalive_task
+            self._mark_connection_lost()
 
     async def async_run_receive_loop(self) -> None:
         """Public wrapper for the receive loop.
@@ -261,11 +545,57 @@ class EmbyWebSocket:
         """
         await self._async_receive_loop()
 
+    def _mark_connection_lost(self) -> None:
+        """Record how long the connection that just ended was up."""
+        if self._connected_at is not None:
+            self._last_connection_uptime = time.monotonic() - self._connected_at
+            self._connected_at = None
+
+    def _next_backoff(self) -> float:
+        """Return the next reconnect delay using decorrelated jitter.
+
+        Each delay is drawn between the base interval and three times the
+        previous delay, capped at the maximum. This spreads out clients that
+        lost their connection at the same moment instead of retrying in
+        lockstep.
+
+        Returns:
+            Delay in seconds before the next attempt.
+        """
+        self._backoff = min(
+            self._max_reconnect_interval,
+            random.uniform(self._reconnect_interval, self._backoff * 3),
+        )
+        return self._backoff
+
+    def _initial_reconnect_delay(self) -> float:
+        """Return the delay before the first reconnection attempt.
+
+        Retries immediately after an announced server restart or after a
+        connection that stayed healthy for a while, resetting the backoff.
+        A connection that dropped soon after connecting keeps backing off so
+        a flapping server is not hammered.
+
+        Returns:
+            Delay in seconds before the first attempt.
+        """
+        if not self.connected:
+            self._mark_connection_lost()
+        uptime = self._last_connection_uptime
+
+        if self._server_restarting or uptime is None or uptime >= HEALTHY_UPTIME_RESET:
+            self._server_restarting = False
+            self._backoff = self._reconnect_interval
+            return 0.0
+
+        return self._next_backoff()
+
     async def async_start_reconnect_loop(self) -> None:
         """Start the reconnection loop.
 
         Connects to the WebSocket and automatically reconnects on failure
-        with exponential backoff. Uses locking to prevent concurrent reconnection attempts.
+        with decorrelated jitter backoff. Uses locking to prevent concurrent
+        reconnection attempts.
         """
         # Use lock to prevent concurrent reconnection attempts
         if self._reconnect_lock.locked():
@@ -274,29 +604,33 @@ class EmbyWebSocket:
 
         async with self._reconnect_lock:
             self._stop_reconnect = False
-            interval = self._reconnect_interval
+            started = time.monotonic()
+            attempts = 0
+            delay = self._initial_reconnect_delay()
 
             while not self._stop_reconnect:
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    if self._stop_reconnect:
+                        break
+
                 try:
                     self._reconnecting = not self.connected
+                    attempts += 1
                     await self.async_connect()
                     self._reconnecting = False
-                    interval = self._reconnect_interval  # Reset on success
+                    if self._reconnect_callback:
+                        self._reconnect_callback(time.monotonic() - started, attempts)
                     break
 
                 except aiohttp.ClientError:
                     self._reconnecting = True
+                    delay = self._next_backoff()
                     _LOGGER.warning(
                         "WebSocket connection failed, retrying in %.1f seconds",
-                        interval,
+                        delay,
                     )
 
-                    if self._stop_reconnect:
-                        break
-
-                    await asyncio.sleep(interval)
-                    interval = min(interval * 2, self._max_reconnect_interval)
-
             self._reconnecting = False
 
     async def async_stop_reconnect_loop(self) -> None:
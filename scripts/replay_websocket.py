@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Replay a recorded WebSocket session into the session coordinator.
+
+Feeds a recording made with the ``websocket_record`` option into
+``EmbyDataUpdateCoordinator._handle_websocket_message`` and prints events per
+second, handler time and the number of coordinator listener updates (each
+one is a state write for every subscribed entity).
+
+Home Assistant and the Emby client are replaced by mocks, so only the
+in-process cost of handling messages is measured; refreshes the handlers
+request are counted but never hit a server. The refresh debouncers run on
+the real event loop, so their leading/trailing counts match what the
+integration would do at the given speed; a trailing refresh still waiting
+for its burst to settle when the recording ends is reported as pending.
+
+Usage:
+    python scripts/replay_websocket.py RECORDING [--speed N] [--json]
+
+``--speed 0`` (the default) replays as fast as possible, ``--speed 1`` in
+real time and ``--speed 10`` ten times faster than recorded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+from custom_components.embymedia.metrics import MetricsCollector
+from custom_components.embymedia.recorder import async_replay, load_recording
+
+if TYPE_CHECKING:
+    from custom_components.embymedia.debounce import RefreshDebouncer
+
+
+def _build_coordinator() -> tuple[EmbyDataUpdateCoordinator, list[int]]:
+    """Create a session coordinator backed by mocks.
+
+    Returns:
+        The coordinator and a single-element list counting scheduled tasks.
+    """
+    tasks = [0]
+
+    def _create_task(coro: Any, *args: Any, **kwargs: Any) -> MagicMock:
+        tasks[0] += 1
+        if hasattr(coro, "close"):
+            coro.close()
+        return MagicMock()
+
+    def _create_background_task(coro: Any, name: str, *args: Any, **kwargs: Any) -> Any:
+        # Debouncers keep this task to know a burst is in progress, so it has
+        # to be a real task that finishes
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
+    hass = MagicMock()
+    hass.async_create_task = MagicMock(side_effect=_create_task)
+    hass.async_create_background_task = MagicMock(side_effect=_create_background_task)
+    client = MagicMock()
+    client.metrics = MetricsCollector()
+    entry = MagicMock()
+    entry.options = {}
+    entry.runtime_data.discovery_coordinators = {}
+    coordinator = EmbyDataUpdateCoordinator(
+        hass=hass,
+        client=client,
+        server_id="replay",
+        server_name="Replay",
+        config_entry=entry,
+    )
+    return coordinator, tasks
+
+
+def _debouncers(coordinator: EmbyDataUpdateCoordinator) -> dict[str, RefreshDebouncer]:
+    """Return the coordinator's refresh debouncers by statistics name."""
+    return {
+        "sessions": coordinator._session_refresh,
+        "library": coordinator._library_refresh,
+        "user_data": coordinator._user_data_refresh,
+    }
+
+
+def _finish_refreshes(coordinator: EmbyDataUpdateCoordinator) -> dict[str, dict[str, object]]:
+    """Collect debounced refresh counts and cancel refreshes still pending.
+
+    Args:
+        coordinator: The replayed coordinator.
+
+    Returns:
+        Per debouncer: trigger, refresh and suppression counts, and whether
+        a trailing refresh was still pending when the replay ended.
+    """
+    refreshes: dict[str, dict[str, object]] = {}
+    for name, debouncer in _debouncers(coordinator).items():
+        refreshes[name] = {**debouncer.stats.to_dict(), "pending": debouncer.pending}
+        debouncer.async_cancel()
+    return refreshes
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    """Run the replay and print the report."""
+    frames = load_recording(args.recording)
+    coordinator, tasks = _build_coordinator()
+
+    listener_updates = [0]
+
+    def _count_update() -> None:
+        listener_updates[0] += 1
+
+    remove_listener = coordinator.async_add_listener(_count_update)
+    try:
+        stats = await async_replay(
+            frames,
+            coordinator._handle_websocket_message,
+            speed=args.speed,
+            state_writes=lambda: listener_updates[0],
+        )
+    finally:
+        remove_listener()
+        refreshes = _finish_refreshes(coordinator)
+
+    report = stats.to_dict()
+    report["scheduled_tasks"] = tasks[0]
+    report["refreshes"] = refreshes
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"Recording:        {args.recording}")
+    print(f"Frames:           {stats.frames} ({stats.skipped} skipped)")
+    print(f"Events:           {stats.events} in {stats.wall_seconds:.3f}s")
+    print(f"Events/sec:       {stats.events_per_second:.1f}")
+    print(
+        f"Handler time:     avg {stats.handler_time.avg_ms:.3f}ms, "
+        f"max {stats.handler_time.max_ms:.3f}ms"
+    )
+    print(f"State writes:     {stats.state_writes}")
+    print(f"Scheduled tasks:  {tasks[0]}")
+    for name, counts in refreshes.items():
+        print(
+            f"  {name + ' refreshes':<24}{counts['leading']} leading, "
+            f"{counts['trailing']} trailing, {counts['suppressed']} suppressed"
+            + (" (1 pending)" if counts["pending"] else "")
+        )
+    print("Messages:")
+    for message_type, count in sorted(stats.per_type.items()):
+        print(f"  {message_type:<24}{count}")
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", type=Path, help="Recording file (.jsonl.gz)")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="Replay speed relative to the recording (0 = as fast as possible)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL
+from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.embymedia.const import (
@@ -15,6 +16,8 @@ from custom_components.embymedia.const import (
     CONF_VERIFY_SSL,
     DOMAIN,
 )
+from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+from custom_components.embymedia.metrics import MetricsCollector
 
 # Auto-use fixture to enable custom component loading for all tests
 pytest_plugins = "pytest_homeassistant_custom_component"
@@ -240,6 +243,7 @@ def create_mock_session_coordinator(
     coordinator.async_config_entry_first_refresh = AsyncMock()
     coordinator.async_setup_websocket = AsyncMock()
     coordinator.async_shutdown_websocket = AsyncMock()
+    coordinator.watch_time.async_load = AsyncMock()
     coordinator.data = {}
     coordinator.last_update_success = True
     return coordinator
@@ -301,6 +305,86 @@ def create_mock_library_coordinator(
     return coordinator
 
 
+def _close_task_coroutine(coro: Any, *args: Any, **kwargs: Any) -> MagicMock:
+    """Close a coroutine passed to a mocked task factory instead of running it."""
+    if hasattr(coro, "close"):
+        coro.close()
+    return MagicMock()
+
+
+def create_mock_hass(*, task_done: bool = True) -> MagicMock:
+    """Create a mock HomeAssistant instance that discards created tasks.
+
+    Args:
+        task_done: What done() of the returned mock tasks reports; False
+            makes them look like they are still running.
+
+    Returns:
+        A MagicMock specced as HomeAssistant whose async_create_task closes
+        the coroutine and records the call.
+    """
+
+    def _create_task(coro: Any, *args: Any, **kwargs: Any) -> MagicMock:
+        task = _close_task_coroutine(coro)
+        task.done.return_value = task_done
+        return task
+
+    hass = MagicMock(spec=HomeAssistant)
+    hass.async_create_task = MagicMock(side_effect=_create_task)
+    return hass
+
+
+def create_session_coordinator(
+    hass: HomeAssistant | MagicMock,
+    options: dict[str, Any] | None = None,
+    *,
+    user_id: str | None = None,
+    websocket_connected: bool = False,
+) -> EmbyDataUpdateCoordinator:
+    """Create a real session coordinator over a mock client and config entry.
+
+    The client is a MagicMock with a real MetricsCollector and no sessions;
+    the config entry is a MagicMock. Both are reachable as
+    coordinator.client and coordinator.config_entry.
+
+    Args:
+        hass: Home Assistant instance (real or from create_mock_hass()).
+        options: Config entry options.
+        user_id: Optional user ID for user-specific context.
+        websocket_connected: Attach a connected mock WebSocket.
+
+    Returns:
+        The coordinator.
+    """
+    client = MagicMock()
+    client.metrics = MetricsCollector()
+    client.async_get_sessions = AsyncMock(return_value=[])
+    entry = MagicMock()
+    entry.options = options if options is not None else {}
+    coordinator = EmbyDataUpdateCoordinator(
+        hass=hass,
+        client=client,
+        server_id="server-123",
+        server_name="Test Server",
+        config_entry=entry,
+        user_id=user_id,
+    )
+    if websocket_connected:
+        websocket = MagicMock()
+        websocket.connected = True
+        websocket.async_set_sessions_interval = AsyncMock()
+        websocket.async_subscribe_sessions = AsyncMock()
+        coordinator._websocket = websocket
+        coordinator._websocket_enabled = True
+    return coordinator
+
+
+@pytest.fixture
+def mock_hass() -> MagicMock:
+    """Create a mock HomeAssistant fixture that discards created tasks."""
+    return create_mock_hass()
+
+
 @pytest.fixture
 def mock_session_coordinator() -> MagicMock:
     """Create a mock session coordinator fixture."""
@@ -0,0 +1,284 @@
+"""Tests for the adaptive SessionsStart subscription interval."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.embymedia.const import (
+    CONF_WEBSOCKET_INTERVAL,
+    DEFAULT_WEBSOCKET_INTERVAL,
+    WEBSOCKET_IDLE_HYSTERESIS,
+    WEBSOCKET_IDLE_INTERVAL,
+)
+from custom_components.embymedia.coordinator import (
+    SUBSCRIPTION_MODE_ACTIVE,
+    SUBSCRIPTION_MODE_IDLE,
+    EmbyDataUpdateCoordinator,
+)
+from custom_components.embymedia.metrics import MetricsCollector, SubscriptionModeStats
+from custom_components.embymedia.models import (
+    EmbyMediaItem,
+    EmbyPlaybackState,
+    EmbySession,
+    MediaType,
+)
+from custom_components.embymedia.websocket import EmbyWebSocket
+
+from .conftest import create_session_coordinator
+
+
+@pytest.fixture
+def coordinator(mock_hass: MagicMock) -> EmbyDataUpdateCoordinator:
+    """Create a coordinator with a connected mock WebSocket."""
+    return create_session_coordinator(mock_hass, websocket_connected=True)
+
+
+def _session(
+    *,
+    playing: bool = False,
+    paused: bool = False,
+    last_activity: datetime | None = None,
+) -> EmbySession:
+    """Build a session for activity checks."""
+    return EmbySession(
+        session_id="session-1",
+        device_id="device-1",
+        device_name="Living Room",
+        client_name="Emby Theater",
+        supports_remote_control=True,
+        now_playing=EmbyMediaItem(item_id="item-1", name="Movie", media_type=MediaType.MOVIE)
+        if playing
+        else None,
+        play_state=EmbyPlaybackState(is_paused=paused) if playing else None,
+        last_activity=last_activity,
+    )
+
+
+class TestWebSocketSessionsInterval:
+    """Tests for renegotiating the interval on the WebSocket client."""
+
+    def _websocket(self) -> tuple[EmbyWebSocket, AsyncMock]:
+        """Create a connected WebSocket client."""
+        ws = EmbyWebSocket(
+            host="emby.local",
+            port=8096,
+            api_key="test-key",
+            ssl=False,
+            device_id="test-device",
+            session=MagicMock(),
+        )
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        ws._ws = mock_ws
+        return ws, mock_ws.send_str
+
+    @pytest.mark.asyncio
+    async def test_subscribe_records_interval(self) -> None:
+        """Test subscribing stores the active interval."""
+        ws, _ = self._websocket()
+
+        await ws.async_subscribe_sessions(interval_ms=1500)
+
+        assert ws.sessions_interval_ms == 1500
+
+    @pytest.mark.asyncio
+    async def test_set_interval_stops_then_starts(self) -> None:
+        """Test changing the interval stops the old subscription first."""
+        ws, send_str = self._websocket()
+        await ws.async_subscribe_sessions(interval_ms=1500)
+        send_str.reset_mock()
+
+        await ws.async_set_sessions_interval(20000)
+
+        sent = [json.loads(call.args[0]) for call in send_str.call_args_list]
+        assert [msg["MessageType"] for msg in sent] == ["SessionsStop", "SessionsStart"]
+        assert sent[1]["Data"] == "0,20000"
+        assert ws.sessions_interval_ms == 20000
+
+    @pytest.mark.asyncio
+    async def test_set_same_interval_is_noop(self) -> None:
+        """Test setting the current interval sends nothing."""
+        ws, send_str = self._websocket()
+        await ws.async_subscribe_sessions(interval_ms=1500)
+        send_str.reset_mock()
+
+        await ws.async_set_sessions_interval(1500)
+
+        send_str.assert_not_called()
+
+
+class TestSubscriptionModeSelection:
+    """Tests for activity-driven mode selection with hysteresis."""
+
+    def test_starts_in_active_mode(self, coordinator: EmbyDataUpdateCoordinator) -> None:
+        """Test coordinator starts with the fast interval."""
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_ACTIVE
+
+    def test_idle_interval_not_faster_than_configured(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test idle interval is at least the configured interval."""
+        assert coordinator._interval_for_mode(SUBSCRIPTION_MODE_ACTIVE) == (
+            DEFAULT_WEBSOCKET_INTERVAL
+        )
+        assert coordinator._interval_for_mode(SUBSCRIPTION_MODE_IDLE) == (WEBSOCKET_IDLE_INTERVAL)
+
+        coordinator.config_entry.options = {CONF_WEBSOCKET_INTERVAL: WEBSOCKET_IDLE_INTERVAL + 5000}
+        assert coordinator._interval_for_mode(SUBSCRIPTION_MODE_IDLE) == (
+            WEBSOCKET_IDLE_INTERVAL + 5000
+        )
+
+    def test_stays_active_within_hysteresis(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test idle sessions do not switch mode before hysteresis elapses."""
+        coordinator._update_subscription_mode({"device-1": _session()})
+
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_ACTIVE
+
+    def test_switches_to_idle_after_hysteresis(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Test switching to idle after the hysteresis window."""
+        coordinator._last_session_activity -= WEBSOCKET_IDLE_HYSTERESIS + 1
+
+        coordinator._update_subscription_mode({"device-1": _session()})
+
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_IDLE
+        mock_hass.async_create_task.assert_called_once()
+
+    def test_playing_session_keeps_active(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test a playing session resets the idle timer."""
+        coordinator._last_session_activity -= WEBSOCKET_IDLE_HYSTERESIS + 1
+
+        coordinator._update_subscription_mode({"device-1": _session(playing=True)})
+
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_ACTIVE
+
+    def test_paused_session_counts_as_idle(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test a long-paused session does not keep the fast interval."""
+        coordinator._last_session_activity -= WEBSOCKET_IDLE_HYSTERESIS + 1
+
+        coordinator._update_subscription_mode({"device-1": _session(playing=True, paused=True)})
+
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_IDLE
+
+    def test_recent_interaction_counts_as_activity(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test recent LastActivityDate counts as user interaction."""
+        coordinator._last_session_activity -= WEBSOCKET_IDLE_HYSTERESIS + 1
+        recent = datetime.now(UTC) - timedelta(seconds=5)
+
+        coordinator._update_subscription_mode({"device-1": _session(last_activity=recent)})
+
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_ACTIVE
+
+    def test_playback_event_returns_to_active(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Test a playback WebSocket event immediately restores the fast interval."""
+        coordinator._set_subscription_mode(SUBSCRIPTION_MODE_IDLE)
+        mock_hass.async_create_task.reset_mock()
+
+        coordinator._handle_websocket_message("PlaybackStarted", {})
+
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_ACTIVE
+        # One task for the interval change and one for the debounced refresh
+        assert mock_hass.async_create_task.call_count == 2
+
+    def test_mode_change_without_websocket_not_applied(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Test nothing is sent when the WebSocket is not enabled."""
+        coordinator._websocket_enabled = False
+
+        coordinator._set_subscription_mode(SUBSCRIPTION_MODE_IDLE)
+
+        assert coordinator.subscription_mode == SUBSCRIPTION_MODE_IDLE
+        mock_hass.async_create_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_apply_sends_interval_for_mode(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test applying the mode renegotiates the WebSocket interval."""
+        coordinator._subscription_mode = SUBSCRIPTION_MODE_IDLE
+
+        await coordinator._async_apply_subscription_interval()
+
+        coordinator._websocket.async_set_sessions_interval.assert_awaited_once_with(  # type: ignore[union-attr]
+            WEBSOCKET_IDLE_INTERVAL
+        )
+
+    @pytest.mark.asyncio
+    async def test_apply_handles_disconnect(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test renegotiation failures are swallowed."""
+        coordinator._websocket.async_set_sessions_interval = AsyncMock(  # type: ignore[union-attr]
+            side_effect=RuntimeError("WebSocket is not connected")
+        )
+
+        await coordinator._async_apply_subscription_interval()
+
+
+class TestSubscriptionModeMetrics:
+    """Tests for time-in-mode metrics."""
+
+    def test_mode_changes_recorded(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test mode transitions are recorded in metrics."""
+        coordinator._set_subscription_mode(SUBSCRIPTION_MODE_IDLE)
+        coordinator._set_subscription_mode(SUBSCRIPTION_MODE_ACTIVE)
+
+        stats = coordinator.client.metrics.get_sessions_subscription_stats()
+        assert stats.mode == SUBSCRIPTION_MODE_ACTIVE
+        assert stats.interval_ms == DEFAULT_WEBSOCKET_INTERVAL
+        assert stats.mode_changes == 1
+        assert SUBSCRIPTION_MODE_IDLE in stats.time_in_mode
+
+    def test_time_in_mode_includes_current_period(self) -> None:
+        """Test time in the current mode is included in diagnostics."""
+        stats = SubscriptionModeStats()
+        stats.set_mode("active", 1500)
+        assert stats.mode_since is not None
+        stats.mode_since -= 10
+
+        result = stats.to_dict()
+
+        assert result["mode"] == "active"
+        assert result["time_in_mode_seconds"]["active"] >= 10  # type: ignore[index]
+
+    def test_diagnostics_includes_subscription(self) -> None:
+        """Test subscription stats are part of diagnostics output."""
+        collector = MetricsCollector()
+        collector.record_sessions_subscription_mode("idle", 20000)
+
+        result = collector.to_diagnostics()
+
+        assert result["sessions_subscription"]["mode"] == "idle"  # type: ignore[index]
+        assert result["sessions_subscription"]["interval_ms"] == 20000  # type: ignore[index]
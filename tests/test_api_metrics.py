@@ -476,3 +476,122 @@ class TestApiClientInstrumentsMetrics:
         assert metrics.error_count == 1
 
         await client.close()
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram bucketing."""
+
+    def test_histogram_empty(self) -> None:
+        """Test empty histogram reports zeros."""
+        from custom_components.embymedia.metrics import LatencyHistogram
+
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.avg_ms == 0.0
+        assert len(histogram.bucket_counts) == len(histogram.bucket_bounds) + 1
+
+    def test_histogram_observe_buckets(self) -> None:
+        """Test observations land in the correct bucket."""
+        from custom_components.embymedia.metrics import LatencyHistogram
+
+        histogram = LatencyHistogram(bucket_bounds=(1.0, 10.0))
+        histogram.observe(0.5)
+        histogram.observe(1.0)
+        histogram.observe(5.0)
+        histogram.observe(50.0)
+
+        assert histogram.bucket_counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.max_ms == 50.0
+        assert histogram.avg_ms == pytest.approx(56.5 / 4)
+
+    def test_histogram_to_dict(self) -> None:
+        """Test histogram diagnostics output."""
+        from custom_components.embymedia.metrics import LatencyHistogram
+
+        histogram = LatencyHistogram(bucket_bounds=(1.0, 10.0))
+        histogram.observe(20.0)
+
+        result = histogram.to_dict()
+
+        assert result["count"] == 1
+        assert result["buckets"] == {"le_1ms": 0, "le_10ms": 0, "gt_10ms": 1}
+
+
+class TestWebSocketMessageStats:
+    """Test per-message-type WebSocket statistics."""
+
+    def test_record_message_per_type(self) -> None:
+        """Test messages are counted per type."""
+        from custom_components.embymedia.metrics import MetricsCollector
+
+        collector = MetricsCollector()
+        collector.record_websocket_message("Sessions", 0.2)
+        collector.record_websocket_message("Sessions", 0.4)
+        collector.record_websocket_message("LibraryChanged")
+
+        sessions = collector.get_websocket_message_stats("Sessions")
+        library = collector.get_websocket_message_stats("LibraryChanged")
+        assert sessions is not None
+        assert sessions.count == 2
+        assert sessions.handler_time.count == 2
+        assert library is not None
+        assert library.count == 1
+        assert library.handler_time.count == 0
+        assert collector.get_websocket_message_stats("Unknown") is None
+        assert collector.get_websocket_stats().messages_received == 3
+
+    def test_message_stats_in_diagnostics(self) -> None:
+        """Test per-type stats appear in diagnostics."""
+        from custom_components.embymedia.metrics import MetricsCollector
+
+        collector = MetricsCollector()
+        collector.record_websocket_message("PlaybackProgress", 1.5)
+
+        result = collector.to_diagnostics()
+
+        progress = result["websocket_messages"]["PlaybackProgress"]
+        assert progress["count"] == 1
+        assert progress["last_seen"] is not None
+        assert progress["handler_time"]["max_ms"] == 1.5
+
+
+class TestStartupTimeline:
+    """Test StartupTimeline phase timing."""
+
+    @pytest.mark.asyncio
+    async def test_overlapping_phases(self) -> None:
+        """Test concurrent phases are timed from a common start."""
+        import asyncio
+
+        from custom_components.embymedia.metrics import StartupTimeline
+
+        timeline = StartupTimeline()
+        with timeline.measure("connect"):
+            await asyncio.sleep(0.01)
+        results = await asyncio.gather(
+            timeline.async_measure("fast", asyncio.sleep(0.01, result="fast")),
+            timeline.async_measure("slow", asyncio.sleep(0.03, result="slow")),
+        )
+        assert timeline.to_dict()["total_ms"] is None
+        timeline.finish()
+
+        result = timeline.to_dict()
+        assert results == ["fast", "slow"]
+        assert list(result["phases"]) == ["connect", "fast", "slow"]  # type: ignore[call-overload]
+        fast = result["phases"]["fast"]  # type: ignore[index]
+        slow = result["phases"]["slow"]  # type: ignore[index]
+        assert fast["start_ms"] == pytest.approx(slow["start_ms"], abs=5)
+        assert slow["duration_ms"] >= 30
+        assert result["total_ms"] >= slow["start_ms"] + slow["duration_ms"]  # type: ignore[operator]
+
+    def test_failed_phase_recorded(self) -> None:
+        """Test a phase that raises is still timed."""
+        from custom_components.embymedia.metrics import StartupTimeline
+
+        timeline = StartupTimeline()
+        with pytest.raises(RuntimeError), timeline.measure("connect"):
+            raise RuntimeError("failed")
+
+        assert "connect" in timeline.phases
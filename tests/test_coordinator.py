@@ -551,6 +551,7 @@ class TestCoordinatorWebSocket:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling Sessions message updates coordinator data."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -590,6 +591,7 @@ class TestCoordinatorWebSocket:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling PlaybackStarted triggers refresh."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -618,6 +620,7 @@ class TestCoordinatorWebSocket:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling PlaybackStopped triggers refresh."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -696,6 +699,7 @@ class TestCoordinatorWebSocket:
         mock_emby_client: MagicMock,
         mock_aiohttp_session: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test WebSocket setup handles connection failure."""
         import aiohttp
@@ -732,6 +736,7 @@ class TestCoordinatorWebSocket:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling unknown WebSocket message type logs debug."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -755,6 +760,7 @@ class TestCoordinatorWebSocket:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling Sessions message with invalid session data."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -794,6 +800,7 @@ class TestCoordinatorWebSocket:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling Sessions message logs removed sessions."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -835,6 +842,7 @@ class TestCoordinatorWebSocket:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test WebSocket disconnect callback logs warning."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -857,6 +865,7 @@ class TestCoordinatorWebSocket:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test receive loop returns early when websocket is None."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -881,6 +890,7 @@ class TestCoordinatorWebSocket:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test receive loop handles exceptions from websocket."""
         from unittest.mock import MagicMock as SyncMagicMock
@@ -973,6 +983,7 @@ class TestCoordinatorHybridPolling:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test normal polling interval without WebSocket."""
         from datetime import timedelta
@@ -1053,6 +1064,7 @@ class TestCoordinatorHybridPolling:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test polling interval reduces on WebSocket reconnect."""
         from datetime import timedelta
@@ -1118,6 +1130,7 @@ class TestCoordinatorHybridPolling:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test reduced polling is logged on connect."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1145,6 +1158,7 @@ class TestCoordinatorServerEvents:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling ServerRestarting event."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1168,6 +1182,7 @@ class TestCoordinatorServerEvents:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling ServerShuttingDown event."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1190,6 +1205,7 @@ class TestCoordinatorServerEvents:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test handling SessionEnded event triggers refresh."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1213,6 +1229,32 @@ class TestCoordinatorServerEvents:
         # Should trigger a refresh
         mock_emby_client.async_get_sessions.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_handle_scheduled_tasks_info(
+        self,
+        hass: HomeAssistant,
+        mock_emby_client: MagicMock,
+    ) -> None:
+        """Test pushed scheduled tasks are routed to the server coordinator."""
+        from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+
+        config_entry = MagicMock()
+        config_entry.options = {}
+        coordinator = EmbyDataUpdateCoordinator(
+            hass=hass,
+            client=mock_emby_client,
+            server_id="server-123",
+            server_name="Test Server",
+            config_entry=config_entry,
+        )
+        tasks = [{"Id": "task-1", "State": "Running", "CurrentProgressPercentage": 5.0}]
+
+        coordinator._handle_websocket_message("ScheduledTasksInfo", tasks)
+        coordinator._handle_websocket_message("ScheduledTasksInfo", {"Invalid": True})
+
+        server_coordinator = config_entry.runtime_data.server_coordinator
+        server_coordinator.async_set_scheduled_tasks.assert_called_once_with(tasks)
+
 
 class TestCoordinatorUserIdProperty:
     """Test user_id property."""
@@ -1221,6 +1263,7 @@ class TestCoordinatorUserIdProperty:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test user_id property returns configured user ID."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1240,6 +1283,7 @@ class TestCoordinatorUserIdProperty:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test user_id property returns None when not configured."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1263,6 +1307,7 @@ class TestCoordinatorRecovery:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test recovery is attempted after max consecutive failures."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1293,6 +1338,7 @@ class TestCoordinatorRecovery:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test cached data is returned on connection error."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1330,6 +1376,7 @@ class TestCoordinatorRecovery:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test recovery attempt succeeds."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1356,6 +1403,7 @@ class TestCoordinatorRecovery:
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         caplog: pytest.LogCaptureFixture,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test recovery attempt fails."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1383,6 +1431,7 @@ class TestCoordinatorRecovery:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test recovery attempt also reconnects WebSocket."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
@@ -1416,6 +1465,7 @@ class TestCoordinatorPlaybackEvents:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test playback_started event is fired when media starts."""
         from homeassistant.helpers import entity_registry as er
@@ -1488,6 +1538,7 @@ class TestCoordinatorPlaybackEvents:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test playback_stopped event is fired when media stops."""
         from homeassistant.helpers import entity_registry as er
@@ -1557,6 +1608,7 @@ class TestCoordinatorPlaybackEvents:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test media_changed event is fired when media changes."""
         from homeassistant.helpers import entity_registry as er
@@ -1631,6 +1683,7 @@ class TestCoordinatorPlaybackEvents:
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
     ) -> None:
         """Test playback_paused and playback_resumed events."""
         from homeassistant.helpers import entity_registry as er
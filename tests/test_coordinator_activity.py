@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_capture_events
 
 if TYPE_CHECKING:
     pass
@@ -344,3 +345,97 @@ class TestServerCoordinatorActivityData:
         assert first_device["Id"] == "5"
         assert first_device["Name"] == "Samsung Smart TV"
         assert first_device["AppName"] == "Emby for Samsung"
+
+
+def _entry(entry_id: int) -> dict[str, object]:
+    """Create an activity log entry."""
+    return {
+        "Id": entry_id,
+        "Name": f"Activity {entry_id}",
+        "Type": "AuthenticationFailed",
+        "Date": f"2025-11-28T10:{entry_id % 60:02d}:00.0000000Z",
+        "Severity": "Error",
+    }
+
+
+class TestIncrementalActivityLog:
+    """Tests for cursor-based activity log fetching."""
+
+    @pytest.mark.asyncio
+    async def test_only_new_entries_fetched_and_fired(
+        self,
+        hass: HomeAssistant,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test later fetches start at the cursor and fire events for new entries."""
+        from custom_components.embymedia.coordinator_sensors import EmbyServerCoordinator
+
+        coordinator = EmbyServerCoordinator(
+            hass=hass,
+            client=mock_client,
+            server_id="test-server-id",
+            server_name="Test Server",
+            config_entry=mock_config_entry,
+        )
+        events = async_capture_events(hass, "embymedia_activity")
+        await coordinator._fetch_activity_log()
+        await hass.async_block_till_done()
+        assert not events
+
+        mock_client.async_get_activity_log = AsyncMock(
+            return_value={"Items": [_entry(6614), _entry(6613), _entry(6612)]}
+        )
+        data = await coordinator._fetch_activity_log()
+        await hass.async_block_till_done()
+
+        kwargs = mock_client.async_get_activity_log.call_args.kwargs
+        assert kwargs["min_date"] == "2025-11-28T10:00:37.8370000Z"
+        assert [event.data["activity_id"] for event in events] == [6613, 6614]
+        assert events[0].data["severity"] == "Error"
+        items = data["Items"]
+        assert isinstance(items, list)
+        assert [entry["Id"] for entry in items] == [6614, 6613, 6612, 6611]
+        assert data["TotalRecordCount"] == 6614
+
+    @pytest.mark.asyncio
+    async def test_pages_until_cursor_and_caps_buffer(
+        self,
+        hass: HomeAssistant,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test a burst larger than a page is paged and the buffer stays capped."""
+        from custom_components.embymedia.coordinator_sensors import (
+            ACTIVITY_LOG_BUFFER_SIZE,
+            ACTIVITY_LOG_PAGE_SIZE,
+            EmbyServerCoordinator,
+        )
+
+        coordinator = EmbyServerCoordinator(
+            hass=hass,
+            client=mock_client,
+            server_id="test-server-id",
+            server_name="Test Server",
+            config_entry=mock_config_entry,
+        )
+        events = async_capture_events(hass, "embymedia_activity")
+        await coordinator._fetch_activity_log()
+
+        newest = 6612 + ACTIVITY_LOG_PAGE_SIZE + 10
+        entries = [_entry(entry_id) for entry_id in range(newest, 6611, -1)]
+        mock_client.async_get_activity_log = AsyncMock(
+            side_effect=[
+                {"Items": entries[:ACTIVITY_LOG_PAGE_SIZE]},
+                {"Items": entries[ACTIVITY_LOG_PAGE_SIZE:]},
+            ]
+        )
+        data = await coordinator._fetch_activity_log()
+        await hass.async_block_till_done()
+
+        assert mock_client.async_get_activity_log.await_count == 2
+        assert len(events) == ACTIVITY_LOG_PAGE_SIZE + 10
+        items = data["Items"]
+        assert isinstance(items, list)
+        assert len(items) == ACTIVITY_LOG_BUFFER_SIZE
+        assert items[0]["Id"] == newest
@@ -371,3 +371,56 @@ class TestEmbyDiscoveryCoordinatorParallelExecution:
         mock_client.async_get_suggestions.assert_called_once_with(user_id="user456")
         # Batch user counts replaces 4 individual calls (#291)
         mock_client.async_get_all_user_counts.assert_called_once_with(user_id="user456")
+
+
+class TestEmbyDiscoveryCoordinatorDemand:
+    """Test activity tracking for demand-driven refreshes."""
+
+    async def test_activity_transitions(
+        self,
+        hass: HomeAssistant,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test listeners hear only the first subscribe and last unsubscribe."""
+        coordinator = EmbyDiscoveryCoordinator(
+            hass=hass,
+            client=mock_client,
+            server_id="server123",
+            config_entry=mock_config_entry,
+            user_id="user456",
+        )
+        changes: list[bool] = []
+        coordinator.async_add_activity_listener(changes.append)
+        assert not coordinator.active
+
+        remove_first = coordinator.async_add_listener(lambda: None)
+        remove_second = coordinator.async_add_listener(lambda: None)
+        assert coordinator.active
+        remove_first()
+        remove_second()
+
+        assert changes == [True, False]
+        assert not coordinator.active
+
+    async def test_stale_until_fetched(
+        self,
+        hass: HomeAssistant,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test data is stale before the first fetch and after invalidation."""
+        coordinator = EmbyDiscoveryCoordinator(
+            hass=hass,
+            client=mock_client,
+            server_id="server123",
+            config_entry=mock_config_entry,
+            user_id="user456",
+        )
+        assert coordinator.stale
+
+        await coordinator._async_update_data()
+        assert not coordinator.stale
+
+        coordinator.on_library_changed()
+        assert coordinator.stale
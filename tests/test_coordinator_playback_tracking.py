@@ -5,12 +5,18 @@ Phase 18: User Activity & Statistics - Task 18.8
 
 from __future__ import annotations
 
-from datetime import date, timedelta
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.embymedia.models import PlaybackRecord
+from custom_components.embymedia.watch_time import WatchTimeStore
 
 if TYPE_CHECKING:
     pass
@@ -86,7 +92,7 @@ class TestPlaybackTrackingInitialization:
         mock_client: MagicMock,
         mock_config_entry: MagicMock,
     ) -> None:
-        """Test coordinator has _user_watch_times for per-user tracking."""
+        """Test coordinator has a watch-time store for per-user tracking."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
 
         coordinator = EmbyDataUpdateCoordinator(
@@ -97,19 +103,18 @@ class TestPlaybackTrackingInitialization:
             config_entry=mock_config_entry,
         )
 
-        assert hasattr(coordinator, "_user_watch_times")
-        assert isinstance(coordinator._user_watch_times, dict)
-        assert len(coordinator._user_watch_times) == 0
+        assert isinstance(coordinator.watch_time, WatchTimeStore)
+        assert coordinator.user_watch_times == {}
         # daily_watch_time property returns sum of user watch times
         assert coordinator.daily_watch_time == 0
 
-    def test_coordinator_has_last_reset_date_attribute(
+    def test_watch_time_bucketed_by_today(
         self,
         mock_hass: MagicMock,
         mock_client: MagicMock,
         mock_config_entry: MagicMock,
     ) -> None:
-        """Test coordinator has _last_reset_date for daily reset."""
+        """Test watch time is recorded in today's bucket."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
 
         coordinator = EmbyDataUpdateCoordinator(
@@ -120,9 +125,9 @@ class TestPlaybackTrackingInitialization:
             config_entry=mock_config_entry,
         )
 
-        assert hasattr(coordinator, "_last_reset_date")
-        # Should be today's date
-        assert coordinator._last_reset_date == date.today()
+        coordinator.watch_time.add("user-abc", 60)
+
+        assert coordinator.watch_time.days == {dt_util.now().date().isoformat(): {"user-abc": 60}}
 
 
 class TestPlaybackProgressTracking:
@@ -179,10 +184,10 @@ class TestPlaybackProgressTracking:
         # Key is now "user_id:session_id"
         assert "user-abc:session-123" in coordinator._playback_sessions
         session = coordinator._playback_sessions["user-abc:session-123"]
-        assert session["position_ticks"] == 300 * EMBY_TICKS_PER_SECOND
-        assert session["item_id"] == "item-456"
-        assert session["item_name"] == "Test Movie"
-        assert session["user_id"] == "user-abc"
+        assert session.position_ticks == 300 * EMBY_TICKS_PER_SECOND
+        assert session.item_id == "item-456"
+        assert session.item_name == "Test Movie"
+        assert session.user_id == "user-abc"
 
     def test_track_playback_progress_calculates_watch_time(
         self,
@@ -349,22 +354,20 @@ class TestDailyWatchTimeReset:
             config_entry=mock_config_entry,
         )
 
-        # Simulate some watch time for a user
-        coordinator._user_watch_times["user-abc"] = 3600  # 1 hour
-        coordinator._last_reset_date = date.today() - timedelta(days=1)  # Yesterday
+        # Simulate some watch time for a user today
+        coordinator.watch_time.add("user-abc", 3600)  # 1 hour
 
-        # Process a playback event (should trigger reset)
-        coordinator._track_playback_progress(
-            {
-                "PlaySessionId": "session-123",
-                "UserId": "user-abc",
-                "PositionTicks": 0,
-            }
-        )
+        # Move to tomorrow: the day boundary has passed
+        tomorrow = dt_util.now() + timedelta(days=1)
+        coordinator.watch_time._day_ends_at = 0.0
+        with patch("custom_components.embymedia.watch_time.dt_util.now", return_value=tomorrow):
+            # Watch time should be reset to 0
+            assert coordinator.daily_watch_time == 0
 
-        # Watch time should be reset to 0
-        assert coordinator.daily_watch_time == 0
-        assert coordinator._last_reset_date == date.today()
+        # Yesterday's total is kept in its own bucket
+        assert coordinator.watch_time.days[(tomorrow - timedelta(days=1)).date().isoformat()] == {
+            "user-abc": 3600
+        }
 
     def test_no_reset_on_same_day(
         self,
@@ -384,8 +387,7 @@ class TestDailyWatchTimeReset:
         )
 
         # Set some watch time for today
-        coordinator._user_watch_times["user-abc"] = 1800  # 30 minutes
-        coordinator._last_reset_date = date.today()
+        coordinator.watch_time.add("user-abc", 1800)  # 30 minutes
 
         # Process a playback event
         coordinator._track_playback_progress(
@@ -453,8 +455,8 @@ class TestPublicAccessors:
         )
 
         # Set per-user watch times
-        coordinator._user_watch_times["user-abc"] = 1800  # 30 min
-        coordinator._user_watch_times["user-xyz"] = 1800  # 30 min
+        coordinator.watch_time.add("user-abc", 1800)  # 30 min
+        coordinator.watch_time.add("user-xyz", 1800)  # 30 min
 
         assert hasattr(coordinator, "daily_watch_time")
         # Total should be sum of all users
@@ -478,10 +480,13 @@ class TestPublicAccessors:
         )
 
         # Key format is now "user_id:session_id"
-        coordinator._playback_sessions = {"user-abc:session-1": {"position_ticks": 100}}
+        record = PlaybackRecord(
+            user_id="user-abc", session_id="session-1", position_ticks=100, last_update=0.0
+        )
+        coordinator._playback_sessions = OrderedDict({"user-abc:session-1": record})
 
         assert hasattr(coordinator, "playback_sessions")
-        assert coordinator.playback_sessions == {"user-abc:session-1": {"position_ticks": 100}}
+        assert coordinator.playback_sessions == {"user-abc:session-1": record}
 
     def test_user_watch_times_property(
         self,
@@ -500,8 +505,8 @@ class TestPublicAccessors:
             config_entry=mock_config_entry,
         )
 
-        coordinator._user_watch_times["user-abc"] = 1800
-        coordinator._user_watch_times["user-xyz"] = 3600
+        coordinator.watch_time.add("user-abc", 1800)
+        coordinator.watch_time.add("user-xyz", 3600)
 
         assert hasattr(coordinator, "user_watch_times")
         assert coordinator.user_watch_times == {"user-abc": 1800, "user-xyz": 3600}
@@ -523,8 +528,8 @@ class TestPublicAccessors:
             config_entry=mock_config_entry,
         )
 
-        coordinator._user_watch_times["user-abc"] = 1800
-        coordinator._user_watch_times["user-xyz"] = 3600
+        coordinator.watch_time.add("user-abc", 1800)
+        coordinator.watch_time.add("user-xyz", 3600)
 
         assert coordinator.get_user_watch_time("user-abc") == 1800
         assert coordinator.get_user_watch_time("user-xyz") == 3600
@@ -594,7 +599,7 @@ class TestPlaybackTrackingEdgeCases:
         # Should track the session with position from PlayState
         assert "user-abc:session-123" in coordinator._playback_sessions
         assert (
-            coordinator._playback_sessions["user-abc:session-123"]["position_ticks"]
+            coordinator._playback_sessions["user-abc:session-123"].position_ticks
             == 30 * EMBY_TICKS_PER_SECOND
         )
 
@@ -626,7 +631,7 @@ class TestPlaybackTrackingEdgeCases:
 
         # Should default to 0
         assert "user-abc:session-123" in coordinator._playback_sessions
-        assert coordinator._playback_sessions["user-abc:session-123"]["position_ticks"] == 0
+        assert coordinator._playback_sessions["user-abc:session-123"].position_ticks == 0
 
     def test_track_playback_handles_invalid_now_playing(
         self,
@@ -701,7 +706,7 @@ class TestPlaybackTrackingEdgeCases:
 
         # Position should be updated
         assert (
-            coordinator._playback_sessions["user-abc:session-123"]["position_ticks"]
+            coordinator._playback_sessions["user-abc:session-123"].position_ticks
             == 30 * EMBY_TICKS_PER_SECOND
         )
         # But watch time should NOT be counted (paused)
@@ -729,16 +734,20 @@ class TestPlaybackSessionCleanup:
         )
 
         # Add some tracked sessions
-        coordinator._playback_sessions["user-abc:session-123"] = {
-            "position_ticks": 100 * EMBY_TICKS_PER_SECOND,
-            "item_id": "item-456",
-            "user_id": "user-abc",
-        }
-        coordinator._playback_sessions["user-xyz:session-456"] = {
-            "position_ticks": 200 * EMBY_TICKS_PER_SECOND,
-            "item_id": "item-789",
-            "user_id": "user-xyz",
-        }
+        coordinator._playback_sessions["user-abc:session-123"] = PlaybackRecord(
+            user_id="user-abc",
+            session_id="session-123",
+            position_ticks=100 * EMBY_TICKS_PER_SECOND,
+            last_update=time.monotonic(),
+            item_id="item-456",
+        )
+        coordinator._playback_sessions["user-xyz:session-456"] = PlaybackRecord(
+            user_id="user-xyz",
+            session_id="session-456",
+            position_ticks=200 * EMBY_TICKS_PER_SECOND,
+            last_update=time.monotonic(),
+            item_id="item-789",
+        )
 
         # Handle PlaybackStopped event
         data = {
@@ -769,17 +778,29 @@ class TestPlaybackSessionCleanup:
             config_entry=mock_config_entry,
         )
 
-        # Add tracked sessions - some with device IDs in the key
-        coordinator._playback_sessions["user-abc:device-123"] = {
-            "position_ticks": 100 * EMBY_TICKS_PER_SECOND,
-            "item_id": "item-456",
-            "user_id": "user-abc",
-        }
-        coordinator._playback_sessions["user-xyz:device-456"] = {
-            "position_ticks": 200 * EMBY_TICKS_PER_SECOND,
-            "item_id": "item-789",
-            "user_id": "user-xyz",
-        }
+        # Add tracked sessions for two devices
+        coordinator._add_playback_record(
+            "user-abc:device-123",
+            PlaybackRecord(
+                user_id="user-abc",
+                session_id="device-123",
+                position_ticks=100 * EMBY_TICKS_PER_SECOND,
+                last_update=time.monotonic(),
+                item_id="item-456",
+                device_id="device-123",
+            ),
+        )
+        coordinator._add_playback_record(
+            "user-xyz:device-456",
+            PlaybackRecord(
+                user_id="user-xyz",
+                session_id="device-456",
+                position_ticks=200 * EMBY_TICKS_PER_SECOND,
+                last_update=time.monotonic(),
+                item_id="item-789",
+                device_id="device-456",
+            ),
+        )
 
         # Handle SessionEnded event
         data = {
@@ -787,20 +808,44 @@ class TestPlaybackSessionCleanup:
         }
         coordinator._handle_websocket_message("SessionEnded", data)
 
-        # Sessions containing device-123 should be removed
+        # Sessions on device-123 should be removed
         assert "user-abc:device-123" not in coordinator._playback_sessions
+        assert "device-123" not in coordinator._playback_keys_by_device
         # Other session should remain
         assert "user-xyz:device-456" in coordinator._playback_sessions
 
-    def test_cleanup_stale_sessions(
+    def test_session_ended_ignores_devices_sharing_substring(
         self,
         mock_hass: MagicMock,
         mock_client: MagicMock,
         mock_config_entry: MagicMock,
     ) -> None:
-        """Test stale sessions are cleaned up after timeout."""
-        from datetime import datetime, timedelta
+        """Test SessionEnded only removes records for the exact device."""
+        from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
 
+        coordinator = EmbyDataUpdateCoordinator(
+            hass=mock_hass,
+            client=mock_client,
+            server_id="test-server-id",
+            server_name="Test Server",
+            config_entry=mock_config_entry,
+        )
+        for device_id in ("device-1", "device-12"):
+            coordinator._track_playback_progress(
+                {"UserId": "user-abc", "DeviceId": device_id, "PositionTicks": 0}
+            )
+
+        coordinator._handle_websocket_message("SessionEnded", {"DeviceId": "device-1"})
+
+        assert list(coordinator._playback_sessions) == ["user-abc:device-12"]
+
+    def test_session_ended_removes_play_session_records(
+        self,
+        mock_hass: MagicMock,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test SessionEnded removes records keyed by PlaySessionId on the device."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
 
         coordinator = EmbyDataUpdateCoordinator(
@@ -810,27 +855,88 @@ class TestPlaybackSessionCleanup:
             server_name="Test Server",
             config_entry=mock_config_entry,
         )
+        coordinator._track_playback_progress(
+            {
+                "UserId": "user-abc",
+                "PlaySessionId": "play-1",
+                "DeviceId": "device-123",
+                "PositionTicks": 0,
+            }
+        )
 
-        # Add a stale session (2 hours old)
-        stale_time = (datetime.now() - timedelta(hours=2)).isoformat()
-        coordinator._playback_sessions["user-abc:session-stale"] = {
-            "position_ticks": 100 * EMBY_TICKS_PER_SECOND,
-            "item_id": "item-456",
-            "user_id": "user-abc",
-            "last_update": stale_time,
-        }
+        coordinator._handle_websocket_message("SessionEnded", {"DeviceId": "device-123"})
 
-        # Add a recent session
-        recent_time = datetime.now().isoformat()
-        coordinator._playback_sessions["user-xyz:session-recent"] = {
-            "position_ticks": 200 * EMBY_TICKS_PER_SECOND,
-            "item_id": "item-789",
-            "user_id": "user-xyz",
-            "last_update": recent_time,
-        }
+        assert len(coordinator._playback_sessions) == 0
+        assert coordinator._playback_keys_by_device == {}
+        assert coordinator._playback_keys_by_user == {}
+
+    def test_playback_stopped_without_play_session_id(
+        self,
+        mock_hass: MagicMock,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test PlaybackStopped without PlaySessionId removes the user's device records."""
+        from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+
+        coordinator = EmbyDataUpdateCoordinator(
+            hass=mock_hass,
+            client=mock_client,
+            server_id="test-server-id",
+            server_name="Test Server",
+            config_entry=mock_config_entry,
+        )
+        for user_id in ("user-abc", "user-xyz"):
+            coordinator._track_playback_progress(
+                {
+                    "UserId": user_id,
+                    "PlaySessionId": f"play-{user_id}",
+                    "DeviceId": "device-123",
+                    "PositionTicks": 0,
+                }
+            )
+
+        coordinator._handle_websocket_message(
+            "PlaybackStopped", {"UserId": "user-abc", "DeviceId": "device-123"}
+        )
+
+        assert list(coordinator._playback_sessions) == ["user-xyz:play-user-xyz"]
+        assert coordinator._playback_keys_by_user == {"user-xyz": {"user-xyz:play-user-xyz"}}
+
+    def test_cleanup_stale_sessions(
+        self,
+        mock_hass: MagicMock,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test stale sessions are cleaned up after timeout."""
+        from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+
+        coordinator = EmbyDataUpdateCoordinator(
+            hass=mock_hass,
+            client=mock_client,
+            server_id="test-server-id",
+            server_name="Test Server",
+            config_entry=mock_config_entry,
+        )
+        now = time.monotonic()
+
+        # A stale session (2 hours old) followed by a recent one
+        coordinator._playback_sessions["user-abc:session-stale"] = PlaybackRecord(
+            user_id="user-abc",
+            session_id="session-stale",
+            position_ticks=100 * EMBY_TICKS_PER_SECOND,
+            last_update=now - 7200,
+        )
+        coordinator._playback_sessions["user-xyz:session-recent"] = PlaybackRecord(
+            user_id="user-xyz",
+            session_id="session-recent",
+            position_ticks=200 * EMBY_TICKS_PER_SECOND,
+            last_update=now,
+        )
 
         # Clean up stale sessions (default: 1 hour max age)
-        coordinator._cleanup_stale_sessions()
+        coordinator._cleanup_stale_sessions(now=now)
 
         # Stale session should be removed
         assert "user-abc:session-stale" not in coordinator._playback_sessions
@@ -844,8 +950,6 @@ class TestPlaybackSessionCleanup:
         mock_config_entry: MagicMock,
     ) -> None:
         """Test stale sessions cleanup with custom max age."""
-        from datetime import datetime, timedelta
-
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
 
         coordinator = EmbyDataUpdateCoordinator(
@@ -855,29 +959,31 @@ class TestPlaybackSessionCleanup:
             server_name="Test Server",
             config_entry=mock_config_entry,
         )
+        now = time.monotonic()
 
         # Add a session that's 10 minutes old
-        old_time = (datetime.now() - timedelta(minutes=10)).isoformat()
-        coordinator._playback_sessions["user-abc:session-123"] = {
-            "position_ticks": 100 * EMBY_TICKS_PER_SECOND,
-            "last_update": old_time,
-        }
+        coordinator._playback_sessions["user-abc:session-123"] = PlaybackRecord(
+            user_id="user-abc",
+            session_id="session-123",
+            position_ticks=100 * EMBY_TICKS_PER_SECOND,
+            last_update=now - 600,
+        )
 
         # With 15 minute max age, session should NOT be removed
-        coordinator._cleanup_stale_sessions(max_age_seconds=900)  # 15 min
+        coordinator._cleanup_stale_sessions(max_age_seconds=900, now=now)  # 15 min
         assert "user-abc:session-123" in coordinator._playback_sessions
 
         # With 5 minute max age, session SHOULD be removed
-        coordinator._cleanup_stale_sessions(max_age_seconds=300)  # 5 min
+        coordinator._cleanup_stale_sessions(max_age_seconds=300, now=now)  # 5 min
         assert "user-abc:session-123" not in coordinator._playback_sessions
 
-    def test_cleanup_stale_sessions_handles_missing_timestamp(
+    def test_progress_keeps_records_in_update_order(
         self,
         mock_hass: MagicMock,
         mock_client: MagicMock,
         mock_config_entry: MagicMock,
     ) -> None:
-        """Test cleanup handles sessions without last_update timestamp."""
+        """Test updated sessions move behind older ones for the ordered sweep."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
 
         coordinator = EmbyDataUpdateCoordinator(
@@ -888,24 +994,23 @@ class TestPlaybackSessionCleanup:
             config_entry=mock_config_entry,
         )
 
-        # Add session without last_update (legacy or malformed)
-        coordinator._playback_sessions["user-abc:session-no-timestamp"] = {
-            "position_ticks": 100 * EMBY_TICKS_PER_SECOND,
-            # No last_update field
-        }
-
-        # Cleanup should remove sessions without timestamps (treated as stale)
-        coordinator._cleanup_stale_sessions()
+        for session_id in ("session-1", "session-2", "session-1"):
+            coordinator._track_playback_progress(
+                {"PlaySessionId": session_id, "UserId": "user-abc", "PositionTicks": 0}
+            )
 
-        assert "user-abc:session-no-timestamp" not in coordinator._playback_sessions
+        assert list(coordinator._playback_sessions) == [
+            "user-abc:session-2",
+            "user-abc:session-1",
+        ]
 
-    def test_cleanup_stale_sessions_handles_invalid_timestamp(
+    def test_progress_updates_record_in_place(
         self,
         mock_hass: MagicMock,
         mock_client: MagicMock,
         mock_config_entry: MagicMock,
     ) -> None:
-        """Test cleanup handles sessions with invalid timestamp values."""
+        """Test progress events reuse the existing record."""
         from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
 
         coordinator = EmbyDataUpdateCoordinator(
@@ -915,21 +1020,47 @@ class TestPlaybackSessionCleanup:
             server_name="Test Server",
             config_entry=mock_config_entry,
         )
+        data = {"PlaySessionId": "session-1", "UserId": "user-abc", "PositionTicks": 0}
+        coordinator._track_playback_progress(data)
+        record = coordinator._playback_sessions["user-abc:session-1"]
 
-        # Add session with invalid timestamp string (not ISO format)
-        coordinator._playback_sessions["user-abc:session-invalid-str"] = {
-            "position_ticks": 100 * EMBY_TICKS_PER_SECOND,
-            "last_update": "not-a-valid-timestamp",
-        }
+        coordinator._track_playback_progress({**data, "PositionTicks": 10 * EMBY_TICKS_PER_SECOND})
 
-        # Add session with wrong type timestamp
-        coordinator._playback_sessions["user-abc:session-invalid-type"] = {
-            "position_ticks": 100 * EMBY_TICKS_PER_SECOND,
-            "last_update": 12345,  # Integer instead of string
-        }
+        assert coordinator._playback_sessions["user-abc:session-1"] is record
+        assert record.position_ticks == 10 * EMBY_TICKS_PER_SECOND
+        assert coordinator.daily_watch_time == 10
 
-        # Cleanup should remove sessions with invalid timestamps
-        coordinator._cleanup_stale_sessions()
+    def test_progress_sweeps_stale_sessions(
+        self,
+        mock_hass: MagicMock,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test progress events expire sessions that never reported a stop."""
+        from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+
+        coordinator = EmbyDataUpdateCoordinator(
+            hass=mock_hass,
+            client=mock_client,
+            server_id="test-server-id",
+            server_name="Test Server",
+            config_entry=mock_config_entry,
+        )
+        coordinator._add_playback_record(
+            "user-abc:abandoned",
+            PlaybackRecord(
+                user_id="user-abc",
+                session_id="abandoned",
+                position_ticks=0,
+                last_update=time.monotonic() - 7200,
+                device_id="device-old",
+            ),
+        )
+
+        coordinator._track_playback_progress(
+            {"PlaySessionId": "session-1", "UserId": "user-xyz", "PositionTicks": 0}
+        )
 
-        assert "user-abc:session-invalid-str" not in coordinator._playback_sessions
-        assert "user-abc:session-invalid-type" not in coordinator._playback_sessions
+        assert list(coordinator._playback_sessions) == ["user-xyz:session-1"]
+        assert "device-old" not in coordinator._playback_keys_by_device
+        assert "user-abc" not in coordinator._playback_keys_by_user
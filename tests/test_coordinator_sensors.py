@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL
@@ -22,7 +22,7 @@ from custom_components.embymedia.const import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from custom_components.embymedia.coordinator_sensors import EmbyServerCoordinator
 
 
 @pytest.fixture
@@ -921,3 +921,139 @@ class TestCoordinatorParallelExecution:
         assert data.get("live_tv_enabled") is True
         # Recording count should be 0 due to error
         assert data.get("recording_count") == 0
+
+
+class TestServerCoordinatorTiers:
+    """Tests for the server coordinator's per-part refresh intervals."""
+
+    @staticmethod
+    def _coordinator(
+        hass: HomeAssistant, mock_config_entry: MockConfigEntry, client: MagicMock
+    ) -> EmbyServerCoordinator:
+        """Create a server coordinator with all parts mocked."""
+        from custom_components.embymedia.coordinator_sensors import EmbyServerCoordinator
+
+        client.async_get_activity_log = AsyncMock(return_value={"Items": [], "TotalRecordCount": 0})
+        client.async_get_devices = AsyncMock(return_value={"Items": []})
+        client.async_get_plugins = AsyncMock(return_value=[{"Id": "plugin-1"}])
+        return EmbyServerCoordinator(
+            hass=hass,
+            client=client,
+            server_id="test-server-id",
+            server_name="Test Server",
+            config_entry=mock_config_entry,
+        )
+
+    async def test_parts_fetched_on_own_schedule(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_emby_client: MagicMock,
+    ) -> None:
+        """Test rarely changing parts are not refetched on every poll."""
+        coordinator = self._coordinator(hass, mock_config_entry, mock_emby_client)
+
+        with patch("custom_components.embymedia.coordinator_sensors.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            await coordinator._async_update_data()
+            mock_time.monotonic.return_value = 1010.0
+            await coordinator._async_update_data()
+            mock_time.monotonic.return_value = 1000.0 + DEFAULT_SERVER_SCAN_INTERVAL
+            data = await coordinator._async_update_data()
+
+        assert mock_emby_client.async_get_scheduled_tasks.await_count == 3
+        assert mock_emby_client.async_get_server_info.await_count == 2
+        assert mock_emby_client.async_get_activity_log.await_count == 2
+        assert mock_emby_client.async_get_devices.await_count == 1
+        assert mock_emby_client.async_get_plugins.await_count == 1
+        assert data["plugin_count"] == 1
+
+    async def test_failed_part_keeps_cached_value(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_emby_client: MagicMock,
+    ) -> None:
+        """Test a failed optional part keeps its last value and is retried."""
+        from custom_components.embymedia.exceptions import EmbyError
+
+        coordinator = self._coordinator(hass, mock_config_entry, mock_emby_client)
+
+        with patch("custom_components.embymedia.coordinator_sensors.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            await coordinator._async_update_data()
+            mock_emby_client.async_get_devices = AsyncMock(side_effect=EmbyError("failed"))
+            mock_time.monotonic.return_value = 5000.0
+            await coordinator._async_update_data()
+            mock_emby_client.async_get_devices = AsyncMock(return_value={"Items": [{"Id": "d1"}]})
+            mock_time.monotonic.return_value = 5300.0
+            data = await coordinator._async_update_data()
+
+        assert data["device_count"] == 1
+        mock_emby_client.async_get_devices.assert_awaited_once()
+
+    async def test_faster_polling_during_library_scan(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_emby_client: MagicMock,
+    ) -> None:
+        """Test the poll interval drops while a library scan runs."""
+        from custom_components.embymedia.coordinator_sensors import LIBRARY_SCAN_POLL_INTERVAL
+
+        coordinator = self._coordinator(hass, mock_config_entry, mock_emby_client)
+        scan_task: EmbyScheduledTask = {
+            "Id": "task-1",
+            "Key": "RefreshLibrary",
+            "Name": "Scan media library",
+            "State": "Running",
+            "CurrentProgressPercentage": 42.0,
+        }
+        mock_emby_client.async_get_scheduled_tasks = AsyncMock(return_value=[scan_task])
+
+        data = await coordinator._async_update_data()
+        assert data["library_scan_progress"] == 42.0
+        assert coordinator.update_interval == timedelta(seconds=LIBRARY_SCAN_POLL_INTERVAL)
+
+        mock_emby_client.async_get_scheduled_tasks = AsyncMock(return_value=[])
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=DEFAULT_SERVER_SCAN_INTERVAL)
+
+    async def test_pushed_tasks_replace_polling(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_emby_client: MagicMock,
+    ) -> None:
+        """Test pushed scheduled tasks update listeners and skip the task poll."""
+        from custom_components.embymedia.coordinator_sensors import SERVER_PUSH_TIMEOUT
+
+        coordinator = self._coordinator(hass, mock_config_entry, mock_emby_client)
+        scan_task: EmbyScheduledTask = {
+            "Id": "task-1",
+            "Key": "RefreshLibrary",
+            "Name": "Scan media library",
+            "State": "Running",
+            "CurrentProgressPercentage": 10.0,
+        }
+        updates: list[object] = []
+        remove_listener = coordinator.async_add_listener(lambda: updates.append(coordinator.data))
+
+        with patch("custom_components.embymedia.coordinator_sensors.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            coordinator.data = await coordinator._async_update_data()
+            coordinator.async_set_scheduled_tasks([scan_task])
+            coordinator.async_set_scheduled_tasks([scan_task])
+            assert len(updates) == 1
+            assert coordinator.data["library_scan_progress"] == 10.0
+
+            mock_time.monotonic.return_value = 1010.0
+            data = await coordinator._async_update_data()
+            assert mock_emby_client.async_get_scheduled_tasks.await_count == 1
+            assert data["library_scan_active"] is True
+            assert coordinator.update_interval == timedelta(seconds=DEFAULT_SERVER_SCAN_INTERVAL)
+
+            mock_time.monotonic.return_value = 1000.0 + SERVER_PUSH_TIMEOUT + 1
+            await coordinator._async_update_data()
+            assert mock_emby_client.async_get_scheduled_tasks.await_count == 2
+        remove_listener()
@@ -0,0 +1,141 @@
+"""Tests for debounced WebSocket-triggered refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.embymedia.coordinator import WEBSOCKET_STABLE_THRESHOLD
+from custom_components.embymedia.debounce import RefreshDebouncer
+
+from .conftest import create_session_coordinator
+
+COOLDOWN = 0.05
+
+
+def _debouncer(
+    hass: HomeAssistant, immediate: bool = True, max_wait: float = 1.0
+) -> tuple[RefreshDebouncer, AsyncMock]:
+    """Create a debouncer around a mocked refresh."""
+    refresh = AsyncMock()
+    debouncer = RefreshDebouncer(
+        hass, "test", refresh, cooldown=COOLDOWN, max_wait=max_wait, immediate=immediate
+    )
+    return debouncer, refresh
+
+
+class TestRefreshDebouncer:
+    """Tests for RefreshDebouncer."""
+
+    @pytest.mark.asyncio
+    async def test_leading_and_trailing(self, hass: HomeAssistant) -> None:
+        """Test a burst refreshes at once and once more after it settles."""
+        debouncer, refresh = _debouncer(hass)
+
+        for _ in range(5):
+            debouncer.async_trigger()
+        await hass.async_block_till_done()
+        assert refresh.await_count == 1
+        assert debouncer.pending
+
+        await asyncio.sleep(COOLDOWN * 3)
+        await hass.async_block_till_done()
+
+        assert refresh.await_count == 2
+        assert debouncer.stats.to_dict() == {
+            "triggers": 5,
+            "leading": 1,
+            "trailing": 1,
+            "suppressed": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_single_trigger_no_trailing(self, hass: HomeAssistant) -> None:
+        """Test a lone trigger refreshes exactly once."""
+        debouncer, refresh = _debouncer(hass)
+
+        debouncer.async_trigger()
+        await asyncio.sleep(COOLDOWN * 3)
+        await hass.async_block_till_done()
+
+        assert refresh.await_count == 1
+        assert debouncer._task is None
+
+    @pytest.mark.asyncio
+    async def test_trailing_only(self, hass: HomeAssistant) -> None:
+        """Test a non-immediate debouncer waits for the burst to settle."""
+        debouncer, refresh = _debouncer(hass, immediate=False)
+
+        for _ in range(3):
+            debouncer.async_trigger()
+        await hass.async_block_till_done()
+        assert refresh.await_count == 0
+
+        await asyncio.sleep(COOLDOWN * 3)
+        await hass.async_block_till_done()
+
+        assert refresh.await_count == 1
+        assert debouncer.stats.suppressed == 2
+
+    @pytest.mark.asyncio
+    async def test_max_wait_caps_delay(self, hass: HomeAssistant) -> None:
+        """Test a burst that never settles still refreshes periodically."""
+        debouncer, refresh = _debouncer(hass, immediate=False, max_wait=COOLDOWN * 2)
+
+        for _ in range(30):
+            debouncer.async_trigger()
+            await asyncio.sleep(COOLDOWN / 5)
+        await hass.async_block_till_done()
+
+        assert refresh.await_count >= 2
+        debouncer.async_cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_pending(self, hass: HomeAssistant) -> None:
+        """Test cancelling drops the trailing refresh."""
+        debouncer, refresh = _debouncer(hass, immediate=False)
+
+        debouncer.async_trigger()
+        debouncer.async_cancel()
+        await asyncio.sleep(COOLDOWN * 3)
+
+        assert refresh.await_count == 0
+        assert not debouncer.pending
+
+
+class TestCoordinatorDebouncing:
+    """Tests for the session coordinator's debouncers."""
+
+    @pytest.mark.asyncio
+    async def test_playback_burst_counted(self, hass: HomeAssistant) -> None:
+        """Test a burst of playback events refreshes up front and once after it."""
+        with patch("custom_components.embymedia.coordinator.WEBSOCKET_REFRESH_COOLDOWN", COOLDOWN):
+            coordinator = create_session_coordinator(hass)
+        client = coordinator.client
+        # Stay below the stability threshold so polling (and its health
+        # check loop) is left alone
+        burst = WEBSOCKET_STABLE_THRESHOLD - 1
+
+        for _ in range(burst):
+            coordinator._handle_websocket_message("PlaybackStarted", {})
+        await hass.async_block_till_done()
+
+        assert client.async_get_sessions.await_count == 1
+        assert coordinator._session_refresh.pending
+
+        await asyncio.sleep(COOLDOWN * 3)
+        await hass.async_block_till_done()
+
+        assert client.async_get_sessions.await_count == 2
+        stats = client.metrics.to_diagnostics()["refresh_debouncers"]["sessions"]
+        assert stats == {
+            "triggers": burst,
+            "leading": 1,
+            "trailing": 1,
+            "suppressed": burst - 2,
+        }
+        await coordinator.async_shutdown_websocket()
+        assert not coordinator._session_refresh.pending
@@ -533,6 +533,120 @@ class TestCacheBypassForForceRefresh:
         assert callable(coordinator.async_force_refresh)
 
 
+class TestSectionInvalidation:
+    """Tests for per-section discovery cache invalidation."""
+
+    @staticmethod
+    def _api_calls(client: MagicMock) -> int:
+        """Count the API calls made through the mocked client."""
+        return sum(
+            getattr(client, name).await_count
+            for name in (
+                "async_get_next_up",
+                "async_get_resumable_items",
+                "async_get_latest_media",
+                "async_get_suggestions",
+                "async_get_user_item_count",
+                "async_get_playlists",
+                "async_get_all_user_counts",
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_favorite_toggle_refetches_favorites_only(
+        self,
+        hass: HomeAssistant,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test a favorite toggle of a known item refetches one count."""
+        mock_client.async_get_resumable_items = AsyncMock(
+            return_value=[
+                {"Id": "movie1", "UserData": {"IsFavorite": False, "Played": False}},
+            ]
+        )
+        coordinator = EmbyDiscoveryCoordinator(
+            hass=hass,
+            client=mock_client,
+            server_id="test-server",
+            config_entry=mock_config_entry,
+            user_id="test-user",
+        )
+        await coordinator._async_update_data()
+        calls_before = self._api_calls(mock_client)
+        mock_client.async_get_user_item_count = AsyncMock(return_value=7)
+
+        coordinator.on_user_data_changed(
+            "test-user",
+            [{"ItemId": "movie1", "UserId": "test-user", "IsFavorite": True, "Played": False}],
+        )
+        data = await coordinator._async_update_data()
+
+        assert self._api_calls(mock_client) - calls_before == 1
+        mock_client.async_get_user_item_count.assert_awaited_once_with(
+            user_id="test-user", filters="IsFavorite"
+        )
+        assert data["user_counts"]["favorites_count"] == 7
+        assert coordinator.get_cache_stats()["sections_fetched"] == 9
+
+    @pytest.mark.asyncio
+    async def test_unknown_item_refetches_user_sections(
+        self,
+        hass: HomeAssistant,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test a change to an item with unknown user data is not narrowed."""
+        coordinator = EmbyDiscoveryCoordinator(
+            hass=hass,
+            client=mock_client,
+            server_id="test-server",
+            config_entry=mock_config_entry,
+            user_id="test-user",
+        )
+        await coordinator._async_update_data()
+        mock_client.reset_mock()
+
+        coordinator.on_user_data_changed(
+            "test-user", [{"ItemId": "item1", "UserId": "test-user", "IsFavorite": True}]
+        )
+        await coordinator._async_update_data()
+
+        mock_client.async_get_next_up.assert_awaited_once()
+        mock_client.async_get_latest_media.assert_not_awaited()
+        mock_client.async_get_playlists.assert_not_awaited()
+        assert mock_client.async_get_user_item_count.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_playback_stopped_keeps_unaffected_sections(
+        self,
+        hass: HomeAssistant,
+        mock_client: MagicMock,
+        mock_config_entry: MagicMock,
+    ) -> None:
+        """Test PlaybackStopped leaves recently added and favorites cached."""
+        coordinator = EmbyDiscoveryCoordinator(
+            hass=hass,
+            client=mock_client,
+            server_id="test-server",
+            config_entry=mock_config_entry,
+            user_id="test-user",
+        )
+        await coordinator._async_update_data()
+        mock_client.reset_mock()
+
+        coordinator.on_playback_stopped("test-user")
+        await coordinator._async_update_data()
+
+        mock_client.async_get_resumable_items.assert_awaited_once()
+        mock_client.async_get_latest_media.assert_not_awaited()
+        mock_client.async_get_all_user_counts.assert_not_awaited()
+        filters = {
+            call.kwargs["filters"] for call in mock_client.async_get_user_item_count.await_args_list
+        }
+        assert filters == {"IsPlayed", "IsResumable"}
+
+
 class TestCacheConstant:
     """Tests for cache-related constants."""
 
@@ -0,0 +1,154 @@
+"""Tests for staggered discovery refresh scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections.abc import Callable
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.embymedia.const import DOMAIN
+from custom_components.embymedia.discovery_scheduler import DiscoveryScheduler
+
+
+class _Coordinator:
+    """Discovery coordinator stand-in recording refresh timing."""
+
+    def __init__(self, tracker: dict[str, int], duration: float = 0.0) -> None:
+        self.update_interval: object = 900
+        self.last_update_success = True
+        self.refreshed_at: list[float] = []
+        self.active = True
+        self.stale = True
+        self.activity_listeners: list[Callable[[bool], None]] = []
+        self._tracker = tracker
+        self._duration = duration
+
+    def mark_stale(self) -> None:
+        self.stale = True
+
+    def async_add_activity_listener(self, listener: Callable[[bool], None]) -> Callable[[], None]:
+        self.activity_listeners.append(listener)
+        return lambda: self.activity_listeners.remove(listener)
+
+    def set_active(self, active: bool) -> None:
+        self.active = active
+        for listener in self.activity_listeners:
+            listener(active)
+
+    async def async_refresh(self) -> None:
+        self.refreshed_at.append(time.monotonic())
+        self._tracker["running"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["running"])
+        await asyncio.sleep(self._duration)
+        self._tracker["running"] -= 1
+        self.stale = False
+
+
+def _scheduler(
+    hass: HomeAssistant, users: int, interval: float, duration: float = 0.0
+) -> tuple[DiscoveryScheduler, dict[str, _Coordinator], dict[str, int]]:
+    """Create a scheduler over stand-in coordinators."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    tracker = {"running": 0, "peak": 0}
+    coordinators = {f"user-{index}": _Coordinator(tracker, duration) for index in range(users)}
+    scheduler = DiscoveryScheduler(
+        hass,
+        entry,  # type: ignore[arg-type]
+        coordinators,  # type: ignore[arg-type]
+        interval,
+        max_concurrent=2,
+        jitter=0.0,
+    )
+    return scheduler, coordinators, tracker
+
+
+class TestDiscoveryScheduler:
+    """Tests for DiscoveryScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_capped(self, hass: HomeAssistant) -> None:
+        """Test refreshes run with bounded concurrency."""
+        scheduler, coordinators, tracker = _scheduler(hass, 6, 60.0, duration=0.01)
+
+        await asyncio.gather(*(scheduler._async_refresh(user_id) for user_id in coordinators))
+
+        assert all(len(c.refreshed_at) == 1 for c in coordinators.values())
+        assert tracker["peak"] == 2
+        stats = scheduler.get_stats("user-0")
+        assert stats is not None
+        assert stats.refresh_count == 1
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_skipped(self, hass: HomeAssistant) -> None:
+        """Test a user with no entities in use is marked stale, not refreshed."""
+        scheduler, coordinators, _ = _scheduler(hass, 1, 60.0)
+        coordinator = coordinators["user-0"]
+        coordinator.active = False
+        coordinator.stale = False
+
+        await scheduler._async_refresh("user-0")
+
+        assert not coordinator.refreshed_at
+        assert coordinator.stale
+        stats = scheduler.get_stats("user-0")
+        assert stats is not None
+        assert stats.idle_skips == 1
+        assert stats.refresh_count == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_on_demand(self, hass: HomeAssistant) -> None:
+        """Test a stale user is refreshed as soon as it becomes active."""
+        scheduler, coordinators, _ = _scheduler(hass, 2, 60.0)
+        coordinators["user-0"].active = False
+        coordinators["user-1"].active = False
+
+        scheduler.async_start()
+        await asyncio.sleep(0.01)
+        assert not coordinators["user-0"].refreshed_at
+
+        coordinators["user-0"].set_active(True)
+        await asyncio.sleep(0.01)
+        coordinators["user-0"].set_active(False)
+        coordinators["user-0"].set_active(True)
+        await asyncio.sleep(0.01)
+
+        assert len(coordinators["user-0"].refreshed_at) == 1
+        assert not coordinators["user-1"].refreshed_at
+        assert scheduler.to_diagnostics()["users"]["user-0"]["active"]  # type: ignore[index]
+
+    @pytest.mark.asyncio
+    async def test_refreshes_spread_across_interval(self, hass: HomeAssistant) -> None:
+        """Test users refresh in evenly spaced slots, not all at once."""
+        scheduler, coordinators, _ = _scheduler(hass, 4, 0.4)
+        for coordinator in coordinators.values():
+            coordinator.stale = False
+        start = time.monotonic()
+
+        scheduler.async_start()
+        await asyncio.sleep(0.45)
+
+        times = sorted(c.refreshed_at[0] - start for c in coordinators.values())
+        assert all(c.update_interval is None for c in coordinators.values())
+        assert all(later - earlier > 0.05 for earlier, later in itertools.pairwise(times))
+        assert times[0] > 0.05
+        diagnostics = scheduler.to_diagnostics()
+        assert diagnostics["slot_seconds"] == 0.1
+        assert set(diagnostics["users"]) == set(coordinators)  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_slow_refresh_skipped(self, hass: HomeAssistant) -> None:
+        """Test a user still refreshing is not refreshed again."""
+        scheduler, _, _ = _scheduler(hass, 1, 60.0, duration=0.1)
+
+        await asyncio.gather(scheduler._async_refresh("user-0"), scheduler._async_refresh("user-0"))
+
+        stats = scheduler.get_stats("user-0")
+        assert stats is not None
+        assert stats.refresh_count == 1
+        assert stats.skipped_count == 1
@@ -0,0 +1,127 @@
+"""Tests for cached entity ID resolution when firing Emby events."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.embymedia.const import DOMAIN
+from custom_components.embymedia.models import EmbySession
+
+from .conftest import create_session_coordinator
+
+
+def _register(hass: HomeAssistant, device_id: str) -> str:
+    """Create a media player registry entry and return its entity ID."""
+    entry = er.async_get(hass).async_get_or_create(
+        "media_player", DOMAIN, f"server-123_{device_id}"
+    )
+    return entry.entity_id
+
+
+def _session(device_id: str) -> EmbySession:
+    """Build a minimal session."""
+    return EmbySession(
+        session_id=f"session-{device_id}",
+        device_id=device_id,
+        device_name="TV",
+        client_name="Emby Theater",
+    )
+
+
+class TestEntityIdCache:
+    """Tests for the device to entity ID cache."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_cached(self, hass: HomeAssistant) -> None:
+        """Test the registry is consulted only on the first lookup."""
+        coordinator = create_session_coordinator(hass)
+        entity_id = _register(hass, "device-1")
+
+        assert coordinator._get_entity_id_for_device("device-1") == entity_id
+        with patch(
+            "custom_components.embymedia.coordinator.er.async_get",
+            side_effect=AssertionError("registry lookup"),
+        ):
+            assert coordinator._get_entity_id_for_device("device-1") == entity_id
+
+    @pytest.mark.asyncio
+    async def test_registered_entity_skips_registry(self, hass: HomeAssistant) -> None:
+        """Test entities registered by the media player need no lookup."""
+        coordinator = create_session_coordinator(hass)
+        coordinator.async_register_media_player("device-1", "media_player.tv")
+
+        with patch(
+            "custom_components.embymedia.coordinator.er.async_get",
+            side_effect=AssertionError("registry lookup"),
+        ):
+            assert coordinator._get_entity_id_for_device("device-1") == "media_player.tv"
+
+        coordinator.async_unregister_media_player("device-1")
+        assert "device-1" not in coordinator._entity_ids
+
+    @pytest.mark.asyncio
+    async def test_rename_updates_cache(self, hass: HomeAssistant) -> None:
+        """Test renaming the entity updates the cached entity ID."""
+        coordinator = create_session_coordinator(hass)
+        entity_id = _register(hass, "device-1")
+        coordinator._get_entity_id_for_device("device-1")
+
+        er.async_get(hass).async_update_entity(entity_id, new_entity_id="media_player.lounge")
+        await hass.async_block_till_done()
+
+        assert coordinator._entity_ids["device-1"] == "media_player.lounge"
+
+    @pytest.mark.asyncio
+    async def test_remove_drops_cache(self, hass: HomeAssistant) -> None:
+        """Test removing the entity drops the cached entity ID."""
+        coordinator = create_session_coordinator(hass)
+        entity_id = _register(hass, "device-1")
+        coordinator._get_entity_id_for_device("device-1")
+
+        er.async_get(hass).async_remove(entity_id)
+        await hass.async_block_till_done()
+
+        assert coordinator._get_entity_id_for_device("device-1") is None
+
+    @pytest.mark.asyncio
+    async def test_create_resolves_missing_entity(self, hass: HomeAssistant) -> None:
+        """Test a device looked up before its entity existed resolves later."""
+        coordinator = create_session_coordinator(hass)
+        assert coordinator._get_entity_id_for_device("device-1") is None
+
+        entity_id = _register(hass, "device-1")
+        await hass.async_block_till_done()
+
+        assert coordinator._get_entity_id_for_device("device-1") == entity_id
+
+
+class TestBatchedEvents:
+    """Tests for event firing per update cycle."""
+
+    @pytest.mark.asyncio
+    async def test_connect_storm_resolves_each_device_once(self, hass: HomeAssistant) -> None:
+        """Test many sessions connecting resolve each entity ID once."""
+        coordinator = create_session_coordinator(hass)
+        device_ids = [f"device-{index}" for index in range(20)]
+        for device_id in device_ids:
+            _register(hass, device_id)
+        fired: list[Event] = []
+        hass.bus.async_listen(f"{DOMAIN}_event", fired.append)
+        sessions = {device_id: _session(device_id) for device_id in device_ids}
+
+        with patch(
+            "custom_components.embymedia.coordinator.er.async_get",
+            wraps=er.async_get,
+        ) as registry_get:
+            coordinator._fire_session_change_events(sessions)
+            coordinator.async_set_updated_data(sessions)
+            coordinator._fire_session_change_events({})
+            await hass.async_block_till_done()
+
+        assert registry_get.call_count == 20
+        assert [event.data["type"] for event in fired].count("session_connected") == 20
+        assert [event.data["type"] for event in fired].count("session_disconnected") == 20
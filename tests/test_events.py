@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
@@ -21,6 +22,10 @@ from custom_components.embymedia.const import (
     EmbyUserDataChangedData,
     EmbyUserDataChangedItemData,
 )
+from custom_components.embymedia.coordinator_sensors import (
+    EmbyLibraryCoordinator,
+    EmbyLibraryData,
+)
 
 if TYPE_CHECKING:
     from custom_components.embymedia.const import EmbyConfigEntry
@@ -806,46 +811,109 @@ class TestUserChangedEvent:
         assert len(events) == 0
 
 
+def _library_coordinator(
+    hass: HomeAssistant,
+    client: MagicMock,
+    entry: EmbyConfigEntry,
+    movie_count: int = 10,
+) -> EmbyLibraryCoordinator:
+    """Create a library coordinator with counts loaded and attach it to the entry."""
+    library_coordinator = EmbyLibraryCoordinator(
+        hass=hass, client=client, server_id="server-123", config_entry=entry
+    )
+    library_coordinator.data = EmbyLibraryData(
+        movie_count=movie_count,
+        series_count=2,
+        episode_count=20,
+        artist_count=0,
+        album_count=0,
+        song_count=0,
+        virtual_folders=[],
+        collection_count=0,
+    )
+    library_coordinator.async_request_refresh = AsyncMock()  # type: ignore[method-assign]
+    runtime_data = MagicMock()
+    runtime_data.library_coordinator = library_coordinator
+    entry.runtime_data = runtime_data
+    return library_coordinator
+
+
+async def _send_library_changed(
+    hass: HomeAssistant,
+    client: MagicMock,
+    entry: EmbyConfigEntry,
+    data: dict[str, list[str]],
+) -> None:
+    """Send a LibraryChanged message and wait for the debounced update."""
+    from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+
+    with patch("custom_components.embymedia.coordinator.LIBRARY_REFRESH_COOLDOWN", 0.05):
+        coordinator = EmbyDataUpdateCoordinator(
+            hass=hass,
+            client=client,
+            server_id="server-123",
+            server_name="Test Server",
+            config_entry=entry,
+        )
+
+    coordinator._handle_websocket_message("LibraryChanged", data)
+
+    await asyncio.sleep(0.2)
+    await hass.async_block_till_done()
+
+
 class TestLibraryCoordinatorRefresh:
     """Test library coordinator refresh triggering."""
 
     @pytest.mark.asyncio
-    async def test_library_changed_schedules_refresh(
+    async def test_library_changed_adjusts_counts(
         self,
         hass: HomeAssistant,
         mock_emby_client: MagicMock,
         mock_config_entry: EmbyConfigEntry,
     ) -> None:
-        """Test LibraryChanged schedules library coordinator refresh."""
-        from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
-
-        mock_library_coordinator = MagicMock()
-        mock_library_coordinator.async_request_refresh = AsyncMock()
-        mock_runtime_data = MagicMock()
-        mock_runtime_data.library_coordinator = mock_library_coordinator
-        mock_config_entry.runtime_data = mock_runtime_data
+        """Test LibraryChanged adjusts library counts without a recount."""
+        mock_emby_client.async_get_item_types = AsyncMock(return_value={"item1": "Movie"})
+        library_coordinator = _library_coordinator(hass, mock_emby_client, mock_config_entry)
 
-        coordinator = EmbyDataUpdateCoordinator(
-            hass=hass,
-            client=mock_emby_client,
-            server_id="server-123",
-            server_name="Test Server",
-            config_entry=mock_config_entry,
+        await _send_library_changed(
+            hass, mock_emby_client, mock_config_entry, {"ItemsAdded": ["item1"]}
         )
 
-        coordinator._handle_websocket_message(
-            "LibraryChanged",
-            {"ItemsAdded": ["item1"]},
-        )
+        mock_emby_client.async_get_item_types.assert_awaited_once_with(["item1"])
+        assert library_coordinator.data["movie_count"] == 11
+        library_coordinator.async_request_refresh.assert_not_called()
 
-        # Wait for debounce (5 seconds) + buffer
-        import asyncio
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("known_types", "movie_count"),
+        [
+            pytest.param({}, 10, id="unknown_item"),
+            pytest.param({"item1": "Movie"}, 0, id="negative_count"),
+        ],
+    )
+    async def test_library_changed_recounts(
+        self,
+        hass: HomeAssistant,
+        mock_emby_client: MagicMock,
+        mock_config_entry: EmbyConfigEntry,
+        known_types: dict[str, str],
+        movie_count: int,
+    ) -> None:
+        """Test removals that cannot be applied incrementally trigger a recount."""
+        mock_emby_client.async_get_item_types = AsyncMock(return_value={})
+        library_coordinator = _library_coordinator(
+            hass, mock_emby_client, mock_config_entry, movie_count=movie_count
+        )
+        library_coordinator._item_types.update(known_types)
 
-        await asyncio.sleep(6)
-        await hass.async_block_till_done()
+        await _send_library_changed(
+            hass, mock_emby_client, mock_config_entry, {"ItemsRemoved": ["item1"]}
+        )
 
-        # Library coordinator should be refreshed
-        mock_library_coordinator.async_request_refresh.assert_called_once()
+        mock_emby_client.async_get_item_types.assert_not_awaited()
+        library_coordinator.async_request_refresh.assert_awaited_once()
+        assert library_coordinator.data["movie_count"] == movie_count
 
     @pytest.mark.asyncio
     async def test_library_changed_no_library_coordinator(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,6 +11,7 @@ import pytest
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.embymedia.const import (
@@ -126,6 +129,170 @@ class TestSetupEntry:
             server_coordinator.async_config_entry_first_refresh.assert_called_once()
             library_coordinator.async_config_entry_first_refresh.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_setup_entry_first_refreshes_concurrent(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_server_info: dict[str, Any],
+    ) -> None:
+        """Test first refreshes run concurrently and the phases are timed."""
+        mock_config_entry.add_to_hass(hass)
+
+        session_coordinator = create_mock_session_coordinator()
+        server_coordinator = create_mock_server_coordinator()
+        library_coordinator = create_mock_library_coordinator()
+        running = {"now": 0, "peak": 0}
+
+        async def slow_refresh() -> None:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.05)
+            running["now"] -= 1
+
+        for coordinator in (session_coordinator, server_coordinator, library_coordinator):
+            coordinator.async_config_entry_first_refresh = AsyncMock(side_effect=slow_refresh)
+
+        with (
+            patch("custom_components.embymedia.EmbyClient", autospec=True) as mock_client_class,
+            patch(
+                "custom_components.embymedia.EmbyDataUpdateCoordinator",
+                return_value=session_coordinator,
+            ),
+            patch(
+                "custom_components.embymedia.EmbyServerCoordinator",
+                return_value=server_coordinator,
+            ),
+            patch(
+                "custom_components.embymedia.EmbyLibraryCoordinator",
+                return_value=library_coordinator,
+            ),
+        ):
+            client = mock_client_class.return_value
+            client.async_validate_connection = AsyncMock(return_value=True)
+            client.async_get_server_info = AsyncMock(return_value=mock_server_info)
+            client.async_get_users = AsyncMock(return_value=[])
+
+            assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+        assert running["peak"] == 3
+        timeline = mock_config_entry.runtime_data.startup_timeline
+        assert timeline is not None
+        result = timeline.to_dict()
+        assert result["total_ms"] is not None
+        phases = result["phases"]
+        assert next(iter(phases)) == "connect"
+        assert {"session_refresh", "server_refresh", "library_refresh", "platforms"} <= set(phases)
+
+    @pytest.mark.asyncio
+    async def test_setup_entry_first_refresh_failure_cancels_others(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_server_info: dict[str, Any],
+    ) -> None:
+        """Test a failing first refresh cancels the others and retries setup."""
+        mock_config_entry.add_to_hass(hass)
+
+        session_coordinator = create_mock_session_coordinator()
+        server_coordinator = create_mock_server_coordinator()
+        library_coordinator = create_mock_library_coordinator()
+        cancelled: list[str] = []
+
+        async def slow_refresh() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("library")
+                raise
+
+        server_coordinator.async_config_entry_first_refresh = AsyncMock(
+            side_effect=ConfigEntryNotReady("server unavailable")
+        )
+        library_coordinator.async_config_entry_first_refresh = AsyncMock(side_effect=slow_refresh)
+
+        with (
+            patch("custom_components.embymedia.EmbyClient", autospec=True) as mock_client_class,
+            patch(
+                "custom_components.embymedia.EmbyDataUpdateCoordinator",
+                return_value=session_coordinator,
+            ),
+            patch(
+                "custom_components.embymedia.EmbyServerCoordinator",
+                return_value=server_coordinator,
+            ),
+            patch(
+                "custom_components.embymedia.EmbyLibraryCoordinator",
+                return_value=library_coordinator,
+            ),
+        ):
+            client = mock_client_class.return_value
+            client.async_validate_connection = AsyncMock(return_value=True)
+            client.async_get_server_info = AsyncMock(return_value=mock_server_info)
+            client.async_get_users = AsyncMock(return_value=[])
+
+            assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+        assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+        assert cancelled == ["library"]
+
+    @pytest.mark.asyncio
+    async def test_setup_entry_restores_snapshot(
+        self,
+        hass: HomeAssistant,
+        hass_storage: dict[str, Any],
+        mock_config_entry: MockConfigEntry,
+        mock_server_info: dict[str, Any],
+    ) -> None:
+        """Test a restored coordinator skips the first refresh and refreshes later."""
+        from custom_components.embymedia.snapshot import SNAPSHOT_VERSION, STORAGE_VERSION
+
+        hass_storage["embymedia.snapshot_test-server-id-12345"] = {
+            "version": STORAGE_VERSION,
+            "minor_version": 1,
+            "key": "embymedia.snapshot_test-server-id-12345",
+            "data": {
+                "version": SNAPSHOT_VERSION,
+                "snapshots": {
+                    "library": {"saved_at": time.time(), "data": {"movie_count": 42}},
+                },
+            },
+        }
+        mock_config_entry.add_to_hass(hass)
+
+        session_coordinator = create_mock_session_coordinator()
+        server_coordinator = create_mock_server_coordinator()
+        library_coordinator = create_mock_library_coordinator()
+        library_coordinator.async_refresh = AsyncMock()
+
+        with (
+            patch("custom_components.embymedia.EmbyClient", autospec=True) as mock_client_class,
+            patch(
+                "custom_components.embymedia.EmbyDataUpdateCoordinator",
+                return_value=session_coordinator,
+            ),
+            patch(
+                "custom_components.embymedia.EmbyServerCoordinator",
+                return_value=server_coordinator,
+            ),
+            patch(
+                "custom_components.embymedia.EmbyLibraryCoordinator",
+                return_value=library_coordinator,
+            ),
+        ):
+            client = mock_client_class.return_value
+            client.async_validate_connection = AsyncMock(return_value=True)
+            client.async_get_server_info = AsyncMock(return_value=mock_server_info)
+            client.async_get_users = AsyncMock(return_value=[])
+
+            assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+            await asyncio.sleep(0.01)
+
+        assert library_coordinator.data == {"movie_count": 42}
+        library_coordinator.async_config_entry_first_refresh.assert_not_called()
+        library_coordinator.async_refresh.assert_awaited_once()
+        server_coordinator.async_config_entry_first_refresh.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_setup_entry_scan_interval_from_options(
         self,
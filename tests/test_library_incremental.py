@@ -0,0 +1,157 @@
+"""Tests for incremental library counts from LibraryChanged deltas."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.embymedia.api import EmbyClient
+from custom_components.embymedia.coordinator_sensors import (
+    EmbyLibraryCoordinator,
+    EmbyLibraryData,
+)
+from custom_components.embymedia.exceptions import EmbyConnectionError
+
+COUNTS = EmbyLibraryData(
+    movie_count=100,
+    series_count=20,
+    episode_count=500,
+    artist_count=30,
+    album_count=50,
+    song_count=1000,
+    virtual_folders=[],
+    collection_count=10,
+)
+
+
+def _coordinator(hass: HomeAssistant, item_types: dict[str, str]) -> EmbyLibraryCoordinator:
+    """Create a library coordinator with counts already loaded."""
+    client = MagicMock()
+    client.async_get_item_types = AsyncMock(return_value=item_types)
+    entry = MagicMock()
+    entry.options = {}
+    coordinator = EmbyLibraryCoordinator(
+        hass=hass, client=client, server_id="server-123", config_entry=entry
+    )
+    coordinator.data = EmbyLibraryData(**COUNTS)
+    coordinator.async_request_refresh = AsyncMock()  # type: ignore[method-assign]
+    return coordinator
+
+
+class TestItemTypeLookup:
+    """Tests for EmbyClient.async_get_item_types."""
+
+    @pytest.mark.asyncio
+    async def test_batched_lookup(self) -> None:
+        """Test IDs are resolved in batches of ITEM_IDS_BATCH_SIZE."""
+        client = EmbyClient(host="emby.local", port=8096, api_key="test-key")
+        responses: list[dict[str, Any]] = [
+            {"Items": [{"Id": f"item-{index}", "Type": "Episode"} for index in range(100)]},
+            {"Items": [{"Id": "item-100", "Type": "Movie"}]},
+        ]
+        client._request = AsyncMock(side_effect=responses)  # type: ignore[method-assign]
+
+        result = await client.async_get_item_types([f"item-{index}" for index in range(101)])
+
+        assert len(result) == 101
+        assert result["item-100"] == "Movie"
+        endpoints = [call.args[1] for call in client._request.await_args_list]
+        assert len(endpoints) == 2
+        assert endpoints[1].startswith("/Items?Ids=item-100&")
+
+
+class TestIncrementalCounts:
+    """Tests for EmbyLibraryCoordinator.async_apply_library_changes."""
+
+    @pytest.mark.asyncio
+    async def test_added_items_counted(self, hass: HomeAssistant) -> None:
+        """Test added items adjust counts without a recount."""
+        coordinator = _coordinator(
+            hass, {"e1": "Episode", "e2": "Episode", "m1": "Movie", "s1": "Season"}
+        )
+
+        coordinator.queue_library_changes(["e1", "e2"], [])
+        coordinator.queue_library_changes(["m1", "s1"], [])
+        await coordinator.async_apply_library_changes()
+
+        assert coordinator.data["episode_count"] == 502
+        assert coordinator.data["movie_count"] == 101
+        assert coordinator.data["series_count"] == 20
+        coordinator.async_request_refresh.assert_not_awaited()  # type: ignore[attr-defined]
+        coordinator.client.async_get_item_types.assert_awaited_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_removed_known_item(self, hass: HomeAssistant) -> None:
+        """Test removing an item seen being added decrements its count."""
+        coordinator = _coordinator(hass, {"m1": "Movie"})
+        coordinator.queue_library_changes(["m1"], [])
+        await coordinator.async_apply_library_changes()
+
+        coordinator.queue_library_changes([], ["m1"])
+        await coordinator.async_apply_library_changes()
+
+        assert coordinator.data["movie_count"] == 100
+        coordinator.async_request_refresh.assert_not_awaited()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_added_and_removed_cancel(self, hass: HomeAssistant) -> None:
+        """Test an item added and removed in one burst needs no requests."""
+        coordinator = _coordinator(hass, {})
+
+        coordinator.queue_library_changes(["m1"], ["m1"])
+        await coordinator.async_apply_library_changes()
+
+        coordinator.client.async_get_item_types.assert_not_awaited()  # type: ignore[attr-defined]
+        coordinator.async_request_refresh.assert_not_awaited()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("added", "removed", "item_types"),
+        [
+            ([], ["unknown"], {}),
+            (["b1"], [], {"b1": "BoxSet"}),
+        ],
+        ids=["unknown-removal", "boxset"],
+    )
+    async def test_recount_when_not_incremental(
+        self,
+        hass: HomeAssistant,
+        added: list[str],
+        removed: list[str],
+        item_types: dict[str, str],
+    ) -> None:
+        """Test changes that cannot be applied incrementally trigger a recount."""
+        coordinator = _coordinator(hass, item_types)
+
+        coordinator.queue_library_changes(added, removed)
+        await coordinator.async_apply_library_changes()
+
+        coordinator.async_request_refresh.assert_awaited_once()  # type: ignore[attr-defined]
+        assert coordinator.data == COUNTS
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_recounts(self, hass: HomeAssistant) -> None:
+        """Test a failed type lookup falls back to a recount."""
+        coordinator = _coordinator(hass, {})
+        coordinator.client.async_get_item_types = AsyncMock(  # type: ignore[method-assign]
+            side_effect=EmbyConnectionError("failed")
+        )
+
+        coordinator.queue_library_changes(["m1"], [])
+        await coordinator.async_apply_library_changes()
+
+        coordinator.async_request_refresh.assert_awaited_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_no_data_recounts(self, hass: HomeAssistant) -> None:
+        """Test changes before the first refresh trigger a recount."""
+        coordinator = _coordinator(hass, {"m1": "Movie"})
+        coordinator.data = None  # type: ignore[assignment]
+
+        coordinator.queue_library_changes(["m1"], [])
+        await coordinator.async_apply_library_changes()
+
+        coordinator.async_request_refresh.assert_awaited_once()  # type: ignore[attr-defined]
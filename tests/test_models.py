@@ -696,3 +696,74 @@ class TestQueueDataInSession:
         session = parse_session(data)
         assert session.queue_item_ids == ("item1", "item2")
         assert session.queue_position == 0  # Default to 0 when not found
+
+
+class TestParseSessionMemo:
+    """Tests for structural sharing between parsed sessions."""
+
+    @staticmethod
+    def _data(name: str = "Test Movie", item_id: str = "movie-123") -> dict[str, object]:
+        """Build a playing session payload."""
+        return {
+            "Id": "session-123",
+            "Client": "Emby Theater",
+            "DeviceId": "device-abc",
+            "DeviceName": "Living Room TV",
+            "UserName": "TestUser",
+            "SupportsRemoteControl": True,
+            "SupportedCommands": ["PlayPause", "Stop", "Seek"],
+            "NowPlayingItem": {
+                "Id": item_id,
+                "Name": name,
+                "Type": "Movie",
+                "ImageTags": {"Primary": "tag-1"},
+            },
+        }
+
+    def test_unchanged_item_reused(self) -> None:
+        """Test an unchanged NowPlayingItem yields the same instance."""
+        from custom_components.embymedia.models import parse_session
+
+        first = parse_session(self._data())  # type: ignore[arg-type]
+        second = parse_session(self._data())  # type: ignore[arg-type]
+
+        assert second.now_playing is first.now_playing
+        assert second.supported_commands is first.supported_commands
+
+    def test_changed_item_reparsed(self) -> None:
+        """Test any change to a parsed field produces a new item."""
+        from custom_components.embymedia.models import parse_session
+
+        first = parse_session(self._data())  # type: ignore[arg-type]
+        data = self._data()
+        data["NowPlayingItem"]["ImageTags"] = {"Primary": "tag-2"}  # type: ignore[index]
+        second = parse_session(data)  # type: ignore[arg-type]
+        renamed = parse_session(self._data(name="Renamed"))  # type: ignore[arg-type]
+
+        assert second.now_playing is not first.now_playing
+        assert second.now_playing is not None
+        assert second.now_playing.image_tags == (("Primary", "tag-2"),)
+        assert renamed.now_playing is not None
+        assert renamed.now_playing.name == "Renamed"
+
+    def test_names_interned(self) -> None:
+        """Test repeated names share one string object."""
+        from custom_components.embymedia.models import parse_session
+
+        first = parse_session(self._data())  # type: ignore[arg-type]
+        data = self._data()
+        data["DeviceName"] = "".join(["Living Room ", "TV"])
+        second = parse_session(data)  # type: ignore[arg-type]
+
+        assert second.device_name is first.device_name
+        assert second.user_name is first.user_name
+
+    def test_cache_bounded(self) -> None:
+        """Test the item memo evicts the least recently used items."""
+        from custom_components.embymedia import models
+
+        for index in range(models.MEDIA_ITEM_CACHE_SIZE + 10):
+            models.parse_session(self._data(item_id=f"item-{index}"))  # type: ignore[arg-type]
+
+        assert len(models._media_item_cache) == models.MEDIA_ITEM_CACHE_SIZE
+        assert "item-0" not in models._media_item_cache
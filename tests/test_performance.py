@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import sys
+import time
+from typing import Any
+
+from .conftest import create_mock_hass, create_session_coordinator
 
 
 class TestDataclassSlots:
@@ -162,3 +166,123 @@ class TestCoordinatorEfficiency:
         # (This is a rough check - slots typically save 30-40% memory)
         size = sys.getsizeof(session)
         assert size < 500  # Reasonable size for a dataclass with slots
+
+
+class TestPlaybackTrackingScaling:
+    """Benchmark session cleanup against large numbers of tracked sessions."""
+
+    @staticmethod
+    def _coordinator(tracked_sessions: int) -> Any:
+        """Create a coordinator tracking the given number of sessions."""
+        coordinator = create_session_coordinator(create_mock_hass())
+        for index in range(tracked_sessions):
+            coordinator._track_playback_progress(
+                {
+                    "UserId": f"user-{index % 50}",
+                    "PlaySessionId": f"play-{index}",
+                    "DeviceId": f"device-{index}",
+                    "PositionTicks": 0,
+                }
+            )
+        return coordinator
+
+    @classmethod
+    def _time_session_ended(cls, tracked_sessions: int, events: int = 500) -> float:
+        """Time SessionEnded handling for devices that are not tracked."""
+        coordinator = cls._coordinator(tracked_sessions)
+        start = time.perf_counter()
+        for index in range(events):
+            coordinator._cleanup_session_tracking({"DeviceId": f"other-{index}"})
+        return time.perf_counter() - start
+
+    def test_session_ended_cost_independent_of_tracked_sessions(self) -> None:
+        """Test SessionEnded cleanup does not scan every tracked session."""
+        small = min(self._time_session_ended(100) for _ in range(3))
+        large = min(self._time_session_ended(5000) for _ in range(3))
+
+        # A linear scan would be ~50x slower; allow generous noise
+        assert large < small * 10
+
+    def test_cleanup_removes_only_matching_device(self) -> None:
+        """Test cleanup with thousands of tracked sessions is exact."""
+        coordinator = self._coordinator(5000)
+
+        coordinator._cleanup_session_tracking({"DeviceId": "device-1"})
+
+        assert len(coordinator._playback_sessions) == 4999
+        assert "user-1:play-1" not in coordinator._playback_sessions
+        assert "user-10:play-10" in coordinator._playback_sessions
+
+
+class TestSessionParseThroughput:
+    """Benchmark parsing a full /Sessions payload."""
+
+    @staticmethod
+    def _payload(sessions: int = 50) -> list[dict[str, Any]]:
+        """Build a /Sessions payload with every session playing."""
+        return [
+            {
+                "Id": f"session-{index}",
+                "Client": "Emby Theater",
+                "DeviceId": f"device-{index}",
+                "DeviceName": f"TV {index}",
+                "UserId": f"user-{index % 5}",
+                "UserName": f"User {index % 5}",
+                "ApplicationVersion": "4.9.2.0",
+                "SupportsRemoteControl": True,
+                "LastActivityDate": "2024-01-15T10:30:00.000Z",
+                "PlayableMediaTypes": ["Audio", "Video"],
+                "SupportedCommands": [f"Command{command}" for command in range(40)],
+                "NowPlayingItem": {
+                    "Id": f"episode-{index}",
+                    "Name": f"Episode {index}",
+                    "Type": "Episode",
+                    "RunTimeTicks": 26_000_000_000,
+                    "SeriesName": "Series",
+                    "SeasonName": "Season 1",
+                    "IndexNumber": index,
+                    "ParentIndexNumber": 1,
+                    "Overview": "An episode." * 20,
+                    "ImageTags": {"Primary": f"tag-{index}", "Thumb": f"thumb-{index}"},
+                    "SeriesId": "series-1",
+                    "SeasonId": "season-1",
+                    "ParentBackdropImageTags": ["backdrop-1"],
+                },
+                "PlayState": {"PositionTicks": index * 10_000_000, "CanSeek": True},
+            }
+            for index in range(sessions)
+        ]
+
+    @staticmethod
+    def _time_parse(payload: list[dict[str, Any]], warm: bool, rounds: int = 200) -> float:
+        """Time parsing the payload repeatedly, optionally clearing the memo."""
+        from custom_components.embymedia import models
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if not warm:
+                models._media_item_cache.clear()
+            for data in payload:
+                models.parse_session(data)  # type: ignore[arg-type]
+        return time.perf_counter() - start
+
+    def test_memoized_parse_faster(self) -> None:
+        """Test steady-state parsing beats parsing every item from scratch."""
+        payload = self._payload()
+
+        cold = min(self._time_parse(payload, warm=False) for _ in range(5))
+        warm = min(self._time_parse(payload, warm=True) for _ in range(5))
+
+        assert warm < cold
+
+    def test_items_shared_across_polls(self) -> None:
+        """Test consecutive polls share every NowPlayingItem."""
+        from custom_components.embymedia.models import parse_session
+
+        first = [parse_session(data) for data in self._payload()]  # type: ignore[arg-type]
+        second = [parse_session(data) for data in self._payload()]  # type: ignore[arg-type]
+
+        assert all(
+            new.now_playing is old.now_playing for old, new in zip(first, second, strict=True)
+        )
+        assert first == second
@@ -0,0 +1,307 @@
+"""Tests for client-side playback position extrapolation."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.embymedia.models import (
+    EmbyMediaItem,
+    EmbyPlaybackState,
+    EmbySession,
+    MediaType,
+    parse_play_state,
+    parse_session,
+)
+from custom_components.embymedia.position import (
+    POSITION_LAG_TOLERANCE,
+    PlaybackPositionModel,
+    PositionAnchor,
+)
+
+T0 = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def _session(
+    position: float,
+    *,
+    item_id: str = "item-1",
+    paused: bool = False,
+    rate: float = 1.0,
+    duration: float | None = 3600.0,
+    check_in: datetime | None = None,
+) -> EmbySession:
+    """Build a playing session at the given position."""
+    return EmbySession(
+        session_id="session-1",
+        device_id="device-1",
+        device_name="Living Room",
+        client_name="Emby Theater",
+        supports_remote_control=True,
+        now_playing=EmbyMediaItem(
+            item_id=item_id,
+            name="Movie",
+            media_type=MediaType.MOVIE,
+            duration_seconds=duration,
+        ),
+        play_state=EmbyPlaybackState(
+            position_seconds=position,
+            is_paused=paused,
+            playback_rate=rate,
+        ),
+        last_playback_check_in=check_in,
+    )
+
+
+def _at(seconds: float) -> datetime:
+    """Return T0 offset by the given number of seconds."""
+    return T0 + timedelta(seconds=seconds)
+
+
+class TestPositionAnchor:
+    """Tests for anchor extrapolation."""
+
+    def test_extrapolates_while_playing(self) -> None:
+        """Test position advances with wall-clock time."""
+        anchor = PositionAnchor(item_id="i", position_seconds=100.0, updated_at=T0)
+
+        assert anchor.position_at(_at(30)) == pytest.approx(130.0)
+
+    def test_paused_position_is_fixed(self) -> None:
+        """Test paused anchors do not advance."""
+        anchor = PositionAnchor(item_id="i", position_seconds=100.0, updated_at=T0, is_paused=True)
+
+        assert anchor.position_at(_at(30)) == 100.0
+
+    def test_rate_scales_progress(self) -> None:
+        """Test playback rate scales extrapolated progress."""
+        anchor = PositionAnchor(
+            item_id="i", position_seconds=100.0, updated_at=T0, playback_rate=1.5
+        )
+
+        assert anchor.position_at(_at(10)) == pytest.approx(115.0)
+
+    def test_clamped_to_duration(self) -> None:
+        """Test extrapolation never runs past the end of the item."""
+        anchor = PositionAnchor(
+            item_id="i", position_seconds=3590.0, updated_at=T0, duration_seconds=3600.0
+        )
+
+        assert anchor.position_at(_at(60)) == 3600.0
+
+    def test_time_before_anchor_not_negative(self) -> None:
+        """Test times before the anchor return the anchor position."""
+        anchor = PositionAnchor(item_id="i", position_seconds=100.0, updated_at=T0)
+
+        assert anchor.position_at(_at(-10)) == 100.0
+
+
+class TestPlaybackPositionModel:
+    """Tests for anchor maintenance across session updates."""
+
+    def test_first_update_anchors(self) -> None:
+        """Test the first playing snapshot creates an anchor."""
+        model = PlaybackPositionModel()
+
+        assert model.update(_session(100.0), T0) is True
+        assert model.position_at(_at(5)) == pytest.approx(105.0)
+
+    def test_consistent_update_keeps_anchor(self) -> None:
+        """Test an update matching the prediction keeps the anchor."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0), T0)
+
+        assert model.update(_session(110.5), _at(10)) is False
+        assert model.anchor is not None
+        assert model.anchor.updated_at == T0
+
+    def test_lagging_report_keeps_anchor(self) -> None:
+        """Test reports lagging by one client interval do not re-anchor."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0), T0)
+
+        assert model.update(_session(100.0), _at(POSITION_LAG_TOLERANCE - 1)) is False
+
+    def test_pause_reanchors(self) -> None:
+        """Test pausing freezes the position at the reported value."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0), T0)
+
+        assert model.update(_session(120.0, paused=True), _at(20)) is True
+        assert model.position_at(_at(300)) == 120.0
+
+    def test_resume_reanchors(self) -> None:
+        """Test resuming starts extrapolating from the resume time."""
+        model = PlaybackPositionModel()
+        model.update(_session(120.0, paused=True), T0)
+        assert model.update(_session(120.0, paused=True), _at(60)) is False
+
+        assert model.update(_session(120.0), _at(90)) is True
+        assert model.position_at(_at(100)) == pytest.approx(130.0)
+
+    def test_seek_forward_reanchors(self) -> None:
+        """Test seeking forward moves the anchor."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0), T0)
+
+        assert model.update(_session(900.0), _at(10)) is True
+        assert model.position_at(_at(10)) == pytest.approx(900.0)
+
+    def test_seek_backward_reanchors(self) -> None:
+        """Test seeking backward moves the anchor."""
+        model = PlaybackPositionModel()
+        model.update(_session(600.0), T0)
+
+        assert model.update(_session(60.0), _at(10)) is True
+        assert model.position_at(_at(20)) == pytest.approx(70.0)
+
+    def test_short_seek_backward_with_check_in(self) -> None:
+        """Test check-in timestamps allow detecting short backward seeks."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0, check_in=T0), T0)
+
+        assert model.update(_session(105.0, check_in=_at(10)), _at(10)) is True
+
+    def test_rate_change_reanchors(self) -> None:
+        """Test changing playback rate moves the anchor."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0), T0)
+
+        assert model.update(_session(110.0, rate=2.0), _at(10)) is True
+        assert model.position_at(_at(20)) == pytest.approx(130.0)
+
+    def test_non_normal_rate_always_reanchors(self) -> None:
+        """Test non-1x rates re-anchor since frontends assume normal speed."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0, rate=2.0), T0)
+
+        assert model.update(_session(120.0, rate=2.0), _at(10)) is True
+
+    def test_item_change_reanchors(self) -> None:
+        """Test a new item always re-anchors."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0), T0)
+
+        assert model.update(_session(110.0, item_id="item-2"), _at(10)) is True
+        assert model.anchor is not None
+        assert model.anchor.item_id == "item-2"
+
+    def test_stop_clears_anchor(self) -> None:
+        """Test the anchor is cleared when nothing is playing."""
+        model = PlaybackPositionModel()
+        model.update(_session(100.0), T0)
+
+        assert model.update(None, _at(10)) is True
+        assert model.anchor is None
+        assert model.position_at(_at(10)) is None
+        assert model.update(None, _at(20)) is False
+
+    def test_check_in_time_used_as_sample_time(self) -> None:
+        """Test the client check-in time anchors the reported position."""
+        model = PlaybackPositionModel()
+
+        model.update(_session(100.0, check_in=_at(-4)), T0)
+
+        assert model.position_at(T0) == pytest.approx(104.0)
+
+    def test_future_check_in_clamped(self) -> None:
+        """Test check-in times ahead of the local clock are clamped."""
+        model = PlaybackPositionModel()
+
+        model.update(_session(100.0, check_in=_at(30)), T0)
+
+        assert model.anchor is not None
+        assert model.anchor.updated_at == T0
+
+    def test_naive_check_in_treated_as_utc(self) -> None:
+        """Test a check-in time without an offset is read as UTC."""
+        model = PlaybackPositionModel()
+
+        model.update(_session(100.0, check_in=_at(-4).replace(tzinfo=None)), T0)
+
+        assert model.anchor is not None
+        assert model.anchor.updated_at == _at(-4)
+        assert model.position_at(T0) == pytest.approx(104.0)
+
+
+class TestPlaybackRateParsing:
+    """Tests for parsing playback rate and check-in time."""
+
+    def test_playback_rate_defaults_to_normal(self) -> None:
+        """Test missing PlaybackRate defaults to 1.0."""
+        assert parse_play_state({"PositionTicks": 0}).playback_rate == 1.0
+
+    def test_playback_rate_parsed(self) -> None:
+        """Test PlaybackRate is parsed."""
+        assert parse_play_state({"PlaybackRate": 1.25}).playback_rate == 1.25
+
+    def test_null_playback_rate_defaults_to_normal(self) -> None:
+        """Test a null PlaybackRate defaults to 1.0."""
+        assert parse_play_state({"PlaybackRate": None}).playback_rate == 1.0
+
+    def test_last_playback_check_in_parsed(self) -> None:
+        """Test LastPlaybackCheckIn is parsed as an aware datetime."""
+        session = parse_session(
+            {
+                "Id": "session-1",
+                "DeviceId": "device-1",
+                "DeviceName": "TV",
+                "Client": "Emby Theater",
+                "SupportsRemoteControl": True,
+                "LastPlaybackCheckIn": "2025-01-01T12:00:00.0000000Z",
+            }
+        )
+
+        assert session.last_playback_check_in == T0
+
+
+class TestMediaPlayerPosition:
+    """Tests for media player position attributes backed by the model."""
+
+    def _player(self, session: EmbySession) -> tuple[MagicMock, object]:
+        """Create a media player bound to a mock coordinator."""
+        from custom_components.embymedia.media_player import EmbyMediaPlayer
+
+        coordinator = MagicMock()
+        coordinator.server_id = "server-123"
+        coordinator.get_session = MagicMock(return_value=session)
+        return coordinator, EmbyMediaPlayer(coordinator, "device-1")
+
+    def test_position_attributes_stable_between_updates(self, hass: HomeAssistant) -> None:
+        """Test attributes do not change while the prediction holds."""
+        coordinator, player = self._player(_session(100.4))
+
+        with (
+            patch("custom_components.embymedia.media_player.dt_util.utcnow", return_value=T0),
+            patch("custom_components.embymedia.entity.EmbyEntity._handle_coordinator_update"),
+        ):
+            player._handle_coordinator_update()  # type: ignore[attr-defined]
+        first = (player.media_position, player.media_position_updated_at)  # type: ignore[attr-defined]
+
+        coordinator.get_session.return_value = _session(110.4)
+        with (
+            patch(
+                "custom_components.embymedia.media_player.dt_util.utcnow",
+                return_value=_at(10),
+            ),
+            patch("custom_components.embymedia.entity.EmbyEntity._handle_coordinator_update"),
+        ):
+            player._handle_coordinator_update()  # type: ignore[attr-defined]
+
+        assert (player.media_position, player.media_position_updated_at) == first  # type: ignore[attr-defined]
+
+    def test_updated_at_accounts_for_truncation(self, hass: HomeAssistant) -> None:
+        """Test the timestamp offsets the truncated fractional second."""
+        _, player = self._player(_session(100.5))
+
+        with (
+            patch("custom_components.embymedia.media_player.dt_util.utcnow", return_value=T0),
+            patch("custom_components.embymedia.entity.EmbyEntity._handle_coordinator_update"),
+        ):
+            player._handle_coordinator_update()  # type: ignore[attr-defined]
+
+        assert player.media_position == 100  # type: ignore[attr-defined]
+        assert player.media_position_updated_at == T0 - timedelta(seconds=0.5)  # type: ignore[attr-defined]
@@ -0,0 +1,194 @@
+"""Tests for the budgeted refresh planner."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import nullcontext
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.embymedia.const import DOMAIN, REFRESH_PLANNER_MAX_CONCURRENT
+from custom_components.embymedia.metrics import MetricsCollector
+from custom_components.embymedia.refresh_planner import RefreshPlanner, planned_refresh
+
+
+def _planner(
+    hass: HomeAssistant, budget: int = 0, max_concurrent: int = REFRESH_PLANNER_MAX_CONCURRENT
+) -> tuple[RefreshPlanner, MetricsCollector, MockConfigEntry]:
+    """Create a planner over a fresh metrics collector."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    metrics = MetricsCollector()
+    planner = RefreshPlanner(
+        hass,
+        entry,  # type: ignore[arg-type]
+        metrics,
+        budget=budget,
+        max_concurrent=max_concurrent,
+    )
+    return planner, metrics, entry
+
+
+async def _refresh(
+    planner: RefreshPlanner,
+    metrics: MetricsCollector,
+    name: str,
+    log: list[str],
+    *,
+    requests: int = 1,
+    demand: bool = True,
+    hold: asyncio.Event | None = None,
+) -> None:
+    """Run a planned refresh making a number of requests."""
+    async with planner.async_slot(name, interval=60, demand=demand):
+        log.append(f"start {name}")
+        for _ in range(requests):
+            metrics.record_api_call(f"/{name}", 1.0)
+        if hold is not None:
+            await hold.wait()
+        else:
+            await asyncio.sleep(0.01)
+        log.append(f"end {name}")
+
+
+class TestRefreshPlanner:
+    """Tests for RefreshPlanner."""
+
+    @pytest.mark.asyncio
+    async def test_not_started_passes_through(self, hass: HomeAssistant) -> None:
+        """Test refreshes during setup run concurrently and are not planned."""
+        planner, metrics, _ = _planner(hass, budget=1)
+        log: list[str] = []
+
+        await asyncio.gather(
+            _refresh(planner, metrics, "server", log, requests=5),
+            _refresh(planner, metrics, "library", log, requests=5),
+        )
+
+        assert log[:2] == ["start server", "start library"]
+        assert planner.get_stats("server") is None
+
+    @pytest.mark.asyncio
+    async def test_unlimited_budget_only_counts(self, hass: HomeAssistant) -> None:
+        """Test refreshes without a budget run at once and are only counted."""
+        planner, metrics, _ = _planner(hass, max_concurrent=1)
+        planner.async_start()
+        log: list[str] = []
+
+        await asyncio.gather(
+            _refresh(planner, metrics, "server", log),
+            _refresh(planner, metrics, "discovery_idle", log, demand=False),
+            _refresh(planner, metrics, "library", log),
+        )
+
+        assert log[:3] == ["start server", "start discovery_idle", "start library"]
+        stats = planner.get_stats("library")
+        assert stats is not None
+        assert stats.refresh_count == 1
+        assert stats.budget_waits == 0
+        assert stats.total_wait_ms == 0.0
+        diagnostics = planner.to_diagnostics()
+        assert diagnostics["running"] == []
+        assert diagnostics["waiting"] == []
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited_by_demand(self, hass: HomeAssistant) -> None:
+        """Test refreshes within the budget run up to the limit, in demand first."""
+        planner, metrics, _ = _planner(hass, budget=6000, max_concurrent=2)
+        planner.async_start()
+        log: list[str] = []
+
+        await asyncio.gather(
+            _refresh(planner, metrics, "server", log),
+            _refresh(planner, metrics, "discovery_idle", log, demand=False),
+            _refresh(planner, metrics, "library", log),
+        )
+
+        assert log[:2] == ["start server", "start library"]
+        assert log.index("start discovery_idle") > log.index("end server")
+        stats = planner.get_stats("discovery_idle")
+        assert stats is not None
+        assert stats.budget_waits == 0
+
+    @pytest.mark.asyncio
+    async def test_running_refreshes_reserve_budget(self, hass: HomeAssistant) -> None:
+        """Test a refresh waits while running refreshes hold the rest of the budget."""
+        planner, metrics, _ = _planner(hass, budget=2)
+        planner.async_start()
+        log: list[str] = []
+        hold = asyncio.Event()
+        tasks = [
+            hass.async_create_task(_refresh(planner, metrics, name, log, requests=0, hold=hold))
+            for name in ("server", "library", "discovery")
+        ]
+        await asyncio.sleep(0.01)
+
+        diagnostics = planner.to_diagnostics()
+        assert diagnostics["running"] == ["server", "library"]
+        assert diagnostics["waiting"] == ["discovery"]
+
+        planner._async_stop()
+        hold.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_budget(self, hass: HomeAssistant) -> None:
+        """Test a refresh waits until the budget covers its expected requests."""
+        planner, metrics, _ = _planner(hass, budget=600)
+        planner.async_start()
+        log: list[str] = []
+        await _refresh(planner, metrics, "library", log, requests=10)
+
+        # Drain the budget, e.g. by session polling
+        for _ in range(595):
+            metrics.record_api_call("/Sessions", 1.0)
+        await _refresh(planner, metrics, "library", log, requests=10)
+
+        stats = planner.get_stats("library")
+        assert stats is not None
+        assert stats.refresh_count == 2
+        assert stats.budget_waits == 1
+        assert stats.total_wait_ms >= 400
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_waiting_refreshes(self, hass: HomeAssistant) -> None:
+        """Test stopping the planner lets refreshes waiting for budget run."""
+        planner, metrics, _ = _planner(hass, budget=1)
+        planner.async_start()
+        metrics.record_api_call("/Sessions", 1.0)
+        metrics.record_api_call("/Sessions", 1.0)
+        log: list[str] = []
+        task = hass.async_create_task(_refresh(planner, metrics, "server", log))
+        await asyncio.sleep(0.01)
+        assert planner.to_diagnostics()["waiting"] == ["server"]
+
+        planner._async_stop()
+        await task
+
+        assert log == ["start server", "end server"]
+
+    @pytest.mark.asyncio
+    async def test_diagnostics(self, hass: HomeAssistant) -> None:
+        """Test diagnostics report the budget, rates and per-refresh statistics."""
+        planner, metrics, _ = _planner(hass, budget=120)
+        planner.async_start()
+        await _refresh(planner, metrics, "server", [], requests=3)
+
+        diagnostics = planner.to_diagnostics()
+
+        assert diagnostics["budget_per_minute"] == 120
+        assert diagnostics["planned_per_minute"] == 3.0
+        assert diagnostics["max_concurrent"] == REFRESH_PLANNER_MAX_CONCURRENT
+        assert diagnostics["running"] == []
+        assert diagnostics["waiting"] == []
+        assert diagnostics["refreshes"]["server"]["requests_per_refresh"] == 3.0  # type: ignore[index]
+
+
+def test_planned_refresh_without_planner() -> None:
+    """Test refreshes of an entry without a planner are not planned."""
+    entry = MockConfigEntry(domain=DOMAIN)
+
+    assert isinstance(planned_refresh(entry, "server"), nullcontext)  # type: ignore[arg-type]
+    assert isinstance(planned_refresh(None, "server"), nullcontext)
@@ -11,6 +11,8 @@ from unittest.mock import MagicMock
 import pytest
 from homeassistant.components.sensor import SensorStateClass
 
+from custom_components.embymedia.models import PlaybackRecord
+
 if TYPE_CHECKING:
     pass
 
@@ -28,16 +30,22 @@ def mock_session_coordinator() -> MagicMock:
     coordinator.last_update_success = True
     coordinator.daily_watch_time = 3600  # 60 minutes in seconds
     coordinator.playback_sessions = {
-        "session-1": {
-            "item_id": "item-123",
-            "item_name": "Test Movie",
-            "position_ticks": 300 * 10_000_000,  # 5 minutes
-        },
-        "session-2": {
-            "item_id": "item-456",
-            "item_name": "Test Episode",
-            "position_ticks": 600 * 10_000_000,  # 10 minutes
-        },
+        "session-1": PlaybackRecord(
+            user_id="user-abc",
+            session_id="session-1",
+            item_id="item-123",
+            item_name="Test Movie",
+            position_ticks=300 * 10_000_000,  # 5 minutes
+            last_update=0.0,
+        ),
+        "session-2": PlaybackRecord(
+            user_id="user-abc",
+            session_id="session-2",
+            item_id="item-456",
+            item_name="Test Episode",
+            position_ticks=600 * 10_000_000,  # 10 minutes
+            last_update=0.0,
+        ),
     }
     # Session coordinator returns list of sessions, not server data dict
     coordinator.data = []
@@ -272,12 +280,15 @@ def mock_session_coordinator_with_users() -> MagicMock:
         side_effect=lambda user_id: coordinator.user_watch_times.get(user_id, 0)
     )
     coordinator.playback_sessions = {
-        "user-abc:session-1": {
-            "item_id": "item-123",
-            "item_name": "Test Movie",
-            "user_id": "user-abc",
-            "user_name": "Alice",
-        },
+        "user-abc:session-1": PlaybackRecord(
+            user_id="user-abc",
+            session_id="session-1",
+            position_ticks=0,
+            last_update=0.0,
+            item_id="item-123",
+            item_name="Test Movie",
+            user_name="Alice",
+        ),
     }
     coordinator.data = []
     return coordinator
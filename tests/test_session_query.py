@@ -0,0 +1,216 @@
+"""Tests for server-side filtered session polling."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.embymedia.api import EmbyClient, SessionQuery
+from custom_components.embymedia.const import CONF_SESSION_ACTIVITY_WINDOW
+from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+from custom_components.embymedia.exceptions import (
+    EmbyConnectionError,
+    EmbyError,
+    EmbyNotFoundError,
+    EmbyServerError,
+    EmbyTimeoutError,
+)
+
+from .conftest import create_session_coordinator
+
+
+def _client() -> EmbyClient:
+    """Create a client whose GET requests are mocked."""
+    client = EmbyClient(host="emby.local", port=8096, api_key="test-key")
+    client._coalesced_request = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    return client
+
+
+def _rejected(status: int) -> EmbyConnectionError:
+    """Build the error _request raises for an HTTP error response."""
+    err = EmbyConnectionError(f"HTTP error: {status}")
+    err.__cause__ = aiohttp.ClientResponseError(MagicMock(), (), status=status)
+    return err
+
+
+def _session(device_id: str, last_activity: datetime | None, playing: bool = False) -> Any:
+    """Build a session payload."""
+    data: dict[str, Any] = {
+        "Id": f"session-{device_id}",
+        "DeviceId": device_id,
+        "DeviceName": "TV",
+        "Client": "Emby Theater",
+        "SupportsRemoteControl": True,
+    }
+    if last_activity is not None:
+        data["LastActivityDate"] = last_activity.isoformat()
+    if playing:
+        data["NowPlayingItem"] = {"Id": "item-1", "Name": "Movie", "Type": "Movie"}
+    return data
+
+
+class TestSessionQuery:
+    """Tests for building the /Sessions query string."""
+
+    def test_empty(self) -> None:
+        """Test no filters produce no query string."""
+        assert SessionQuery().to_query_string() == ""
+
+    def test_all_filters(self) -> None:
+        """Test every filter maps to its Emby parameter."""
+        query = SessionQuery(
+            controllable_by_user_id="user-1",
+            active_within_seconds=960,
+        )
+
+        assert query.to_query_string() == "ControllableByUserId=user-1&ActiveWithinSeconds=960"
+
+
+class TestFilteredSessions:
+    """Tests for EmbyClient.async_get_sessions with filters."""
+
+    @pytest.mark.asyncio
+    async def test_filters_sent(self) -> None:
+        """Test the filtered endpoint is requested."""
+        client = _client()
+
+        await client.async_get_sessions(SessionQuery(active_within_seconds=960))
+
+        client._coalesced_request.assert_awaited_once_with(  # type: ignore[attr-defined]
+            "GET", "/Sessions?ActiveWithinSeconds=960"
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_query_unfiltered(self) -> None:
+        """Test no query requests plain /Sessions."""
+        client = _client()
+
+        await client.async_get_sessions()
+
+        client._coalesced_request.assert_awaited_once_with("GET", "/Sessions")  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error", [EmbyNotFoundError("not found"), _rejected(400)], ids=["404", "400"]
+    )
+    async def test_rejected_query_falls_back(self, error: Exception) -> None:
+        """Test a rejected filtered query falls back and is not retried."""
+        client = _client()
+        client._coalesced_request = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[error, [{"Id": "s1"}], []]
+        )
+        query = SessionQuery(active_within_seconds=960)
+
+        assert await client.async_get_sessions(query) == [{"Id": "s1"}]
+        await client.async_get_sessions(query)
+
+        endpoints = [call.args[1] for call in client._coalesced_request.await_args_list]
+        assert endpoints == ["/Sessions?ActiveWithinSeconds=960", "/Sessions", "/Sessions"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [EmbyTimeoutError("timed out"), EmbyServerError("Server error: 503"), _rejected(429)],
+        ids=["timeout", "5xx", "429"],
+    )
+    async def test_transient_error_not_fallback(self, error: EmbyError) -> None:
+        """Test transient failures are raised and the filters retried next poll."""
+        client = _client()
+        client._coalesced_request = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[error, []]
+        )
+        query = SessionQuery(active_within_seconds=960)
+
+        with pytest.raises(type(error)):
+            await client.async_get_sessions(query)
+        await client.async_get_sessions(query)
+
+        assert client._session_filters_supported is True
+        endpoints = [call.args[1] for call in client._coalesced_request.await_args_list]
+        assert endpoints == ["/Sessions?ActiveWithinSeconds=960"] * 2
+
+    @pytest.mark.asyncio
+    async def test_filters_kept_when_fallback_fails(self) -> None:
+        """Test filters stay enabled if the unfiltered request also fails."""
+        client = _client()
+        client._coalesced_request = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[EmbyNotFoundError("not found"), EmbyTimeoutError("timed out")]
+        )
+
+        with pytest.raises(EmbyTimeoutError):
+            await client.async_get_sessions(SessionQuery(active_within_seconds=960))
+
+        assert client._session_filters_supported is True
+
+
+class TestCoordinatorSessionQuery:
+    """Tests for the coordinator's session filters."""
+
+    def _coordinator(
+        self, options: dict[str, object], user_id: str | None = None
+    ) -> EmbyDataUpdateCoordinator:
+        """Create a coordinator with the given options."""
+        coordinator = create_session_coordinator(
+            MagicMock(spec=HomeAssistant), options, user_id=user_id
+        )
+        coordinator._fire_session_change_events = MagicMock()  # type: ignore[method-assign]
+        coordinator._update_subscription_mode = MagicMock()  # type: ignore[method-assign]
+        return coordinator
+
+    def test_default_query(self) -> None:
+        """Test the activity window is off by default."""
+        coordinator = self._coordinator({})
+
+        assert coordinator.session_query == SessionQuery()
+
+    def test_query_scoped_to_user(self) -> None:
+        """Test a user-scoped coordinator asks for sessions it can control."""
+        coordinator = self._coordinator({CONF_SESSION_ACTIVITY_WINDOW: 0}, user_id="user-1")
+
+        assert coordinator.session_query == SessionQuery(controllable_by_user_id="user-1")
+
+    @pytest.mark.asyncio
+    async def test_poll_sends_query(self) -> None:
+        """Test polling passes the query to the client."""
+        coordinator = self._coordinator({CONF_SESSION_ACTIVITY_WINDOW: 300})
+
+        await coordinator._async_update_data()
+
+        coordinator.client.async_get_sessions.assert_awaited_once_with(  # type: ignore[attr-defined]
+            SessionQuery(active_within_seconds=300)
+        )
+
+    def test_websocket_sessions_use_activity_window(self) -> None:
+        """Test WebSocket session lists drop dormant sessions like polling."""
+        coordinator = self._coordinator({CONF_SESSION_ACTIVITY_WINDOW: 960})
+        coordinator.async_set_updated_data = MagicMock()  # type: ignore[method-assign]
+        now = datetime.now(UTC)
+
+        coordinator._process_sessions_data(
+            [
+                _session("recent", now - timedelta(seconds=30)),
+                _session("dormant", now - timedelta(hours=2)),
+                _session("dormant-playing", now - timedelta(hours=2), playing=True),
+                _session("unknown", None),
+            ]
+        )
+
+        sessions = coordinator.async_set_updated_data.call_args[0][0]
+        assert set(sessions) == {"recent", "dormant-playing", "unknown"}
+
+    def test_websocket_sessions_kept_without_window(self) -> None:
+        """Test idle but connected sessions are kept by default."""
+        coordinator = self._coordinator({})
+        coordinator.async_set_updated_data = MagicMock()  # type: ignore[method-assign]
+
+        coordinator._process_sessions_data(
+            [_session("dormant", datetime.now(UTC) - timedelta(hours=2))]
+        )
+
+        sessions = coordinator.async_set_updated_data.call_args[0][0]
+        assert set(sessions) == {"dormant"}
@@ -60,7 +60,7 @@ class TestSetupCancellationHandling:
         )
         entry.add_to_hass(hass)
 
-        async def slow_sessions() -> list[dict[str, Any]]:
+        async def slow_sessions(*args: Any) -> list[dict[str, Any]]:
             """Simulate a slow API call that allows cancellation."""
             await asyncio.sleep(10)  # Long enough to cancel
             return []
@@ -119,7 +119,7 @@ class TestSetupCancellationHandling:
         )
         entry.add_to_hass(hass)
 
-        async def slow_sessions() -> list[dict[str, Any]]:
+        async def slow_sessions(*args: Any) -> list[dict[str, Any]]:
             await asyncio.sleep(10)
             return []
 
@@ -0,0 +1,110 @@
+"""Tests for persisted coordinator data snapshots."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.embymedia.const import SNAPSHOT_MAX_AGE
+from custom_components.embymedia.snapshot import (
+    SNAPSHOT_VERSION,
+    STORAGE_VERSION,
+    CoordinatorSnapshotStore,
+)
+
+STORAGE_KEY = "embymedia.snapshot_server-123"
+
+
+def _stored(snapshots: dict[str, Any], version: int = SNAPSHOT_VERSION) -> dict[str, Any]:
+    """Build a storage file payload."""
+    return {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {"version": version, "snapshots": snapshots},
+    }
+
+
+def _coordinator(data: dict[str, Any] | None, success: bool = True) -> MagicMock:
+    """Create a coordinator stand-in holding data."""
+    coordinator = MagicMock()
+    coordinator.data = data
+    coordinator.last_update_success = success
+    return coordinator
+
+
+class TestCoordinatorSnapshotStore:
+    """Tests for CoordinatorSnapshotStore."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_restore(self, hass: HomeAssistant) -> None:
+        """Test saved data is restored as initial data and marked stale."""
+        store = CoordinatorSnapshotStore(hass, "server-123")
+        await store.async_load()
+        assert not store.restore("library", _coordinator({"movie_count": 100}))
+        store._schedule_save()
+        await store.async_flush()
+
+        restored_store = CoordinatorSnapshotStore(hass, "server-123")
+        await restored_store.async_load()
+        coordinator = _coordinator(None)
+
+        assert restored_store.restore("library", coordinator)
+        assert coordinator.data == {"movie_count": 100}
+        assert restored_store.is_restored("library")
+        assert restored_store.to_diagnostics()["library"]["restored"]  # type: ignore[index]
+
+        coordinator.data = {"movie_count": 101}
+        assert not restored_store.is_restored("library")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("version", "age"),
+        [(SNAPSHOT_VERSION + 1, 0), (SNAPSHOT_VERSION, SNAPSHOT_MAX_AGE + 60)],
+        ids=["other-version", "too-old"],
+    )
+    async def test_outdated_snapshot_discarded(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any], version: int, age: float
+    ) -> None:
+        """Test snapshots of another version or past the maximum age are not restored."""
+        hass_storage[STORAGE_KEY] = _stored(
+            {"server": {"saved_at": time.time() - age, "data": {"server_version": "4.8"}}},
+            version=version,
+        )
+        store = CoordinatorSnapshotStore(hass, "server-123")
+        await store.async_load()
+        coordinator = _coordinator(None)
+
+        assert not store.restore("server", coordinator)
+        assert coordinator.data is None
+
+    @pytest.mark.asyncio
+    async def test_failed_or_stale_coordinator_keeps_snapshot(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any]
+    ) -> None:
+        """Test only freshly fetched data replaces a snapshot."""
+        saved_at = time.time() - 3600
+        hass_storage[STORAGE_KEY] = _stored(
+            {
+                "server": {"saved_at": saved_at, "data": {"server_version": "4.8"}},
+                "library": {"saved_at": saved_at, "data": {"movie_count": 100}},
+            }
+        )
+        store = CoordinatorSnapshotStore(hass, "server-123")
+        await store.async_load()
+        server = _coordinator(None)
+        store.restore("server", server)
+        server.data = {"server_version": "4.9"}
+        server.last_update_success = False
+        store.restore("library", _coordinator(None))
+
+        data = store._data_to_save()
+
+        assert data["snapshots"]["server"]["saved_at"] == saved_at
+        assert data["snapshots"]["library"]["saved_at"] == saved_at
+        server.last_update_success = True
+        assert store._data_to_save()["snapshots"]["server"]["data"] == {"server_version": "4.9"}
@@ -0,0 +1,138 @@
+"""Tests for persisted watch-time statistics."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.embymedia.watch_time import STORAGE_VERSION, WatchTimeStore
+
+STORAGE_KEY = "embymedia.watch_time_server-123"
+
+
+def _day(offset: int = 0) -> str:
+    """Return the ISO date offset days from today."""
+    return (dt_util.now().date() + timedelta(days=offset)).isoformat()
+
+
+def _stored(days: dict[str, dict[str, int]]) -> dict[str, Any]:
+    """Build a storage file payload."""
+    return {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {"days": days},
+    }
+
+
+class TestWatchTimeStore:
+    """Tests for in-memory accumulation."""
+
+    def test_add_accumulates_per_user(self, hass: HomeAssistant) -> None:
+        """Test seconds are accumulated per user for today."""
+        store = WatchTimeStore(hass, "server-123")
+
+        store.add("user-abc", 30)
+        assert store.add("user-abc", 15) == 45
+        store.add("user-xyz", 10)
+
+        assert store.today == {"user-abc": 45, "user-xyz": 10}
+        assert store.daily_total == 55
+        assert store.get_user_time("user-abc") == 45
+        assert store.get_user_time("unknown") == 0
+
+    def test_new_day_starts_new_bucket(self, hass: HomeAssistant) -> None:
+        """Test a new local day starts from zero and keeps the old bucket."""
+        store = WatchTimeStore(hass, "server-123")
+        store.add("user-abc", 30)
+
+        store._day_ends_at = 0.0
+        with patch(
+            "custom_components.embymedia.watch_time.dt_util.now",
+            return_value=dt_util.now() + timedelta(days=1),
+        ):
+            store.add("user-abc", 5)
+            assert store.today == {"user-abc": 5}
+
+        assert store.days[_day()] == {"user-abc": 30}
+
+
+class TestWatchTimePersistence:
+    """Tests for loading and saving through HA storage."""
+
+    @pytest.mark.asyncio
+    async def test_load_restores_today(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any]
+    ) -> None:
+        """Test today's totals survive a restart."""
+        hass_storage[STORAGE_KEY] = _stored({_day(): {"user-abc": 600}})
+        store = WatchTimeStore(hass, "server-123")
+
+        await store.async_load()
+        store.add("user-abc", 60)
+
+        assert store.get_user_time("user-abc") == 660
+
+    @pytest.mark.asyncio
+    async def test_load_merges_unsaved_time(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any]
+    ) -> None:
+        """Test time tracked before loading is kept."""
+        hass_storage[STORAGE_KEY] = _stored({_day(): {"user-abc": 600}})
+        store = WatchTimeStore(hass, "server-123")
+        store.add("user-abc", 60)
+
+        await store.async_load()
+
+        assert store.get_user_time("user-abc") == 660
+
+    @pytest.mark.asyncio
+    async def test_load_drops_days_past_retention(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any]
+    ) -> None:
+        """Test buckets older than the retention period are discarded."""
+        hass_storage[STORAGE_KEY] = _stored(
+            {
+                _day(-10): {"user-abc": 100},
+                _day(-2): {"user-abc": 200},
+                _day(): {"user-abc": 300},
+            }
+        )
+        store = WatchTimeStore(hass, "server-123")
+
+        await store.async_load(retention_days=3)
+
+        assert set(store.days) == {_day(-2), _day()}
+
+    @pytest.mark.asyncio
+    async def test_updates_batched_into_one_save(self, hass: HomeAssistant) -> None:
+        """Test many updates schedule a single delayed write."""
+        store = WatchTimeStore(hass, "server-123")
+        await store.async_load()
+
+        with patch.object(store._store, "async_delay_save") as delay_save:
+            for _ in range(100):
+                store.add("user-abc", 1)
+
+        delay_save.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any]
+    ) -> None:
+        """Test flushing writes pending updates that a new store can load."""
+        store = WatchTimeStore(hass, "server-123")
+        await store.async_load()
+        store.add("user-abc", 90)
+
+        await store.async_flush()
+
+        assert hass_storage[STORAGE_KEY]["data"] == {"days": {_day(): {"user-abc": 90}}}
+        restored = WatchTimeStore(hass, "server-123")
+        await restored.async_load()
+        assert restored.get_user_time("user-abc") == 90
@@ -387,6 +387,37 @@ class TestEmbyWebSocketSubscription:
         with pytest.raises(RuntimeError, match="not connected"):
             await ws.async_unsubscribe_sessions()
 
+    @pytest.mark.asyncio
+    async def test_subscribe_scheduled_tasks(self) -> None:
+        """Test scheduled task subscription start and stop messages."""
+        mock_session = MagicMock()
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        mock_ws.send_str = AsyncMock()
+        mock_session.ws_connect = AsyncMock(return_value=mock_ws)
+
+        ws = EmbyWebSocket(
+            host="emby.local",
+            port=8096,
+            api_key="test-key",
+            ssl=False,
+            device_id="test-device",
+            session=mock_session,
+        )
+
+        await ws.async_connect()
+        await ws.async_subscribe_scheduled_tasks(interval_ms=2000)
+
+        message = json.loads(mock_ws.send_str.call_args[0][0])
+        assert message == {"MessageType": "ScheduledTasksInfoStart", "Data": "0,2000"}
+        assert ws.scheduled_tasks_interval_ms == 2000
+
+        await ws.async_unsubscribe_scheduled_tasks()
+
+        message = json.loads(mock_ws.send_str.call_args[0][0])
+        assert message == {"MessageType": "ScheduledTasksInfoStop", "Data": ""}
+        assert ws.scheduled_tasks_interval_ms is None
+
 
 class TestEmbyWebSocketMessageCallback:
     """Tests for message callback handling."""
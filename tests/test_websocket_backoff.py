@@ -0,0 +1,205 @@
+"""Tests for decorrelated-jitter WebSocket reconnect backoff."""
+
+from __future__ import annotations
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+from custom_components.embymedia.metrics import MetricsCollector
+from custom_components.embymedia.websocket import HEALTHY_UPTIME_RESET, EmbyWebSocket
+
+from .conftest import create_mock_hass, create_session_coordinator
+
+
+def _websocket(
+    reconnect_interval: float = 5.0,
+    max_reconnect_interval: float = 300.0,
+) -> EmbyWebSocket:
+    """Create a WebSocket client whose connections succeed."""
+    session = MagicMock()
+    mock_ws = AsyncMock()
+    mock_ws.closed = False
+    session.ws_connect = AsyncMock(return_value=mock_ws)
+    return EmbyWebSocket(
+        host="emby.local",
+        port=8096,
+        api_key="test-key",
+        ssl=False,
+        device_id="test-device",
+        session=session,
+        reconnect_interval=reconnect_interval,
+        max_reconnect_interval=max_reconnect_interval,
+    )
+
+
+class TestDecorrelatedJitter:
+    """Tests for the backoff delay sequence."""
+
+    def test_delays_within_bounds(self) -> None:
+        """Test every delay lies between the base and three times the previous."""
+        ws = _websocket(reconnect_interval=5.0, max_reconnect_interval=300.0)
+        previous = 5.0
+
+        for _ in range(50):
+            delay = ws._next_backoff()
+            assert 5.0 <= delay <= min(300.0, previous * 3)
+            previous = delay
+
+    def test_delays_capped(self) -> None:
+        """Test delays never exceed the maximum interval."""
+        ws = _websocket(reconnect_interval=5.0, max_reconnect_interval=20.0)
+
+        delays = [ws._next_backoff() for _ in range(50)]
+
+        assert max(delays) <= 20.0
+
+    def test_delays_are_jittered(self) -> None:
+        """Test two clients do not follow the same schedule."""
+        first = _websocket()
+        second = _websocket()
+
+        assert [first._next_backoff() for _ in range(5)] != [
+            second._next_backoff() for _ in range(5)
+        ]
+
+
+class TestInitialReconnectDelay:
+    """Tests for the first attempt after a disconnect."""
+
+    def test_first_connection_immediate(self) -> None:
+        """Test a client that never connected tries immediately."""
+        ws = _websocket()
+
+        assert ws._initial_reconnect_delay() == 0.0
+
+    def test_healthy_connection_resets_backoff(self) -> None:
+        """Test a long-lived connection resets the backoff and retries at once."""
+        ws = _websocket()
+        ws._backoff = 200.0
+        ws._connected_at = time.monotonic() - HEALTHY_UPTIME_RESET - 1
+
+        assert ws._initial_reconnect_delay() == 0.0
+        assert ws._backoff == 5.0
+
+    def test_flapping_connection_keeps_backing_off(self) -> None:
+        """Test a connection that dropped quickly waits before reconnecting."""
+        ws = _websocket()
+        ws._backoff = 40.0
+        ws._connected_at = time.monotonic() - 1
+
+        delay = ws._initial_reconnect_delay()
+
+        assert 5.0 <= delay <= 120.0
+
+    def test_server_restarting_retries_immediately(self) -> None:
+        """Test an announced restart retries at once even after flapping."""
+        ws = _websocket()
+        ws._backoff = 40.0
+        ws._connected_at = time.monotonic() - 1
+        ws._process_message(
+            MagicMock(
+                type=aiohttp.WSMsgType.TEXT,
+                data=json.dumps({"MessageType": "ServerRestarting", "Data": None}),
+            )
+        )
+
+        assert ws._initial_reconnect_delay() == 0.0
+        assert ws._backoff == 5.0
+        assert ws._server_restarting is False
+
+
+class TestReconnectLoop:
+    """Tests for the reconnect loop and latency reporting."""
+
+    @pytest.mark.asyncio
+    async def test_reports_latency_and_attempts(self) -> None:
+        """Test the reconnect callback receives latency and attempt count."""
+        ws = _websocket(reconnect_interval=0.01, max_reconnect_interval=0.02)
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        ws._session.ws_connect = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[aiohttp.ClientError("refused"), aiohttp.ClientError("refused"), mock_ws]
+        )
+        callback = MagicMock()
+        ws.set_reconnect_callback(callback)
+
+        await ws.async_start_reconnect_loop()
+
+        latency, attempts = callback.call_args[0]
+        assert attempts == 3
+        assert latency > 0
+
+    @pytest.mark.asyncio
+    async def test_flapping_sleeps_before_first_attempt(self) -> None:
+        """Test the loop waits before reconnecting a flapping connection."""
+        ws = _websocket()
+        ws._connected_at = time.monotonic() - 1
+
+        with patch(
+            "custom_components.embymedia.websocket.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            await ws.async_start_reconnect_loop()
+
+        mock_sleep.assert_awaited_once()
+        assert ws.connected is True
+
+
+class TestReconnectMetrics:
+    """Tests for reconnect latency metrics."""
+
+    def test_latency_recorded(self) -> None:
+        """Test reconnect latency statistics in diagnostics."""
+        collector = MetricsCollector()
+        collector.record_websocket_reconnect_latency(2.0, 1)
+        collector.record_websocket_reconnect_latency(8.0, 3)
+
+        result = collector.get_websocket_stats().to_dict()
+
+        assert result["reconnection_count"] == 4
+        assert result["reconnect_latency"] == {
+            "count": 2,
+            "avg_seconds": 5.0,
+            "last_seconds": 8.0,
+            "max_seconds": 8.0,
+        }
+
+
+class TestCoordinatorReconnect:
+    """Tests for the coordinator starting reconnects."""
+
+    def _coordinator(self) -> tuple[EmbyDataUpdateCoordinator, MagicMock]:
+        """Create a coordinator whose scheduled reconnect keeps running."""
+        hass = create_mock_hass(task_done=False)
+        return create_session_coordinator(hass), hass
+
+    @pytest.mark.asyncio
+    async def test_lost_connection_schedules_reconnect(self) -> None:
+        """Test the receive loop ending starts a single reconnect."""
+        coordinator, hass = self._coordinator()
+        websocket = MagicMock()
+        websocket.async_run_receive_loop = AsyncMock()
+        coordinator._websocket = websocket
+        coordinator._websocket_enabled = True
+
+        await coordinator._async_websocket_receive_loop()
+        await coordinator._async_websocket_receive_loop()
+
+        hass.async_create_task.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_websocket_not_reconnected(self) -> None:
+        """Test no reconnect is scheduled once the WebSocket is disabled."""
+        coordinator, hass = self._coordinator()
+        websocket = MagicMock()
+        websocket.async_run_receive_loop = AsyncMock()
+        coordinator._websocket = websocket
+        coordinator._websocket_enabled = False
+
+        await coordinator._async_websocket_receive_loop()
+
+        hass.async_create_task.assert_not_called()
@@ -0,0 +1,142 @@
+"""Tests for WebSocket message dispatch table and per-type metrics."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+
+from .conftest import create_session_coordinator
+
+if TYPE_CHECKING:
+    pass
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> EmbyDataUpdateCoordinator:
+    """Create a session coordinator."""
+    return create_session_coordinator(hass)
+
+
+class TestWebSocketDispatchTable:
+    """Tests for the registered handler table."""
+
+    def test_all_known_message_types_registered(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test every supported message type has a handler."""
+        for message_type in (
+            "Sessions",
+            "PlaybackProgress",
+            "PlaybackStarted",
+            "PlaybackStopped",
+            "SessionEnded",
+            "ServerRestarting",
+            "ServerShuttingDown",
+            "LibraryChanged",
+            "UserDataChanged",
+            "NotificationAdded",
+            "UserUpdated",
+            "UserDeleted",
+        ):
+            assert message_type in coordinator._websocket_handlers
+
+    def test_sessions_message_dispatched(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test Sessions message is routed to session processing."""
+        with patch.object(coordinator, "_process_sessions_data") as mock_process:
+            coordinator._handle_websocket_message("Sessions", [])
+
+        mock_process.assert_called_once_with([])
+
+    def test_user_deleted_passes_message_type(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test UserDeleted handler receives its message type."""
+        with patch.object(coordinator, "_handle_user_changed") as mock_handler:
+            coordinator._handle_websocket_message("UserDeleted", {"UserId": "u1"})
+
+        mock_handler.assert_called_once_with("UserDeleted", {"UserId": "u1"})
+
+    def test_register_custom_handler(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test registering a handler for a new message type."""
+        received: list[Any] = []
+        coordinator.register_websocket_handler("CustomMessage", received.append)
+
+        coordinator._handle_websocket_message("CustomMessage", {"value": 1})
+
+        assert received == [{"value": 1}]
+
+
+class TestWebSocketMessageMetrics:
+    """Tests for per-message-type metrics recorded by the coordinator."""
+
+    def test_handled_message_records_count_and_timing(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test handled messages record count, last seen and handler time."""
+        coordinator._handle_websocket_message("ServerRestarting", None)
+        coordinator._handle_websocket_message("ServerRestarting", None)
+
+        stats = coordinator.client.metrics.get_websocket_message_stats("ServerRestarting")
+        assert stats is not None
+        assert stats.count == 2
+        assert stats.last_seen is not None
+        assert stats.handler_time.count == 2
+
+    def test_unhandled_message_records_count_without_timing(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test unhandled messages are counted but not timed."""
+        coordinator._handle_websocket_message("UnknownType", {})
+
+        stats = coordinator.client.metrics.get_websocket_message_stats("UnknownType")
+        assert stats is not None
+        assert stats.count == 1
+        assert stats.handler_time.count == 0
+
+    def test_handler_exception_still_recorded(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test handler time is recorded even if the handler raises."""
+
+        def _failing_handler(data: Any) -> None:
+            raise ValueError("boom")
+
+        coordinator.register_websocket_handler("Broken", _failing_handler)
+
+        with pytest.raises(ValueError):
+            coordinator._handle_websocket_message("Broken", None)
+
+        stats = coordinator.client.metrics.get_websocket_message_stats("Broken")
+        assert stats is not None
+        assert stats.handler_time.count == 1
+
+    def test_message_stats_in_diagnostics(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test per-type stats are exposed in diagnostics output."""
+        coordinator._handle_websocket_message("ServerShuttingDown", None)
+
+        result = coordinator.client.metrics.to_diagnostics()
+
+        assert "ServerShuttingDown" in result["websocket_messages"]
+        entry = result["websocket_messages"]["ServerShuttingDown"]
+        assert entry["count"] == 1
+        assert entry["last_seen"] is not None
+        assert entry["handler_time"]["count"] == 1
@@ -0,0 +1,263 @@
+"""Tests for WebSocket keepalive, RTT measurement and liveness deadline."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from custom_components.embymedia.metrics import MetricsCollector, WebSocketStats
+from custom_components.embymedia.websocket import (
+    KEEPALIVES_PER_LIVENESS_TIMEOUT,
+    EmbyWebSocket,
+)
+
+from .conftest import create_mock_hass, create_session_coordinator
+
+
+def _text_message(message_type: str, data: Any = None) -> MagicMock:
+    """Build a TEXT WebSocket message."""
+    return MagicMock(
+        type=aiohttp.WSMsgType.TEXT,
+        data=json.dumps({"MessageType": message_type, "Data": data}),
+    )
+
+
+def _websocket(liveness_timeout: float = 60.0) -> tuple[EmbyWebSocket, AsyncMock]:
+    """Create a WebSocket client with a connected mock connection."""
+    ws = EmbyWebSocket(
+        host="emby.local",
+        port=8096,
+        api_key="test-key",
+        ssl=False,
+        device_id="test-device",
+        session=MagicMock(),
+        liveness_timeout=liveness_timeout,
+    )
+    mock_ws = AsyncMock()
+    mock_ws.closed = False
+    ws._ws = mock_ws
+    ws._last_message_at = time.monotonic()
+    return ws, mock_ws
+
+
+class TestKeepAliveMessages:
+    """Tests for KeepAlive and ForceKeepAlive handling."""
+
+    def test_keepalive_interval_derived_from_timeout(self) -> None:
+        """Test several KeepAlives are sent per liveness timeout."""
+        ws, _ = _websocket(liveness_timeout=90.0)
+
+        assert ws.keepalive_interval == 90.0 / KEEPALIVES_PER_LIVENESS_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_keepalive_reply_records_rtt(self) -> None:
+        """Test a KeepAlive reply produces an RTT sample."""
+        ws, mock_ws = _websocket()
+        rtt_callback = MagicMock()
+        ws.set_rtt_callback(rtt_callback)
+
+        await ws._async_send_keepalive()
+        sent = json.loads(mock_ws.send_str.call_args[0][0])
+        assert sent == {"MessageType": "KeepAlive"}
+
+        ws._process_message(_text_message("KeepAlive"))
+
+        rtt_callback.assert_called_once()
+        assert rtt_callback.call_args[0][0] >= 0
+
+    @pytest.mark.asyncio
+    async def test_lost_keepalive_reply_not_counted(self) -> None:
+        """Test the RTT is timed from the latest KeepAlive, not one left unanswered."""
+        ws, _ = _websocket()
+        rtt_callback = MagicMock()
+        ws.set_rtt_callback(rtt_callback)
+
+        await ws._async_send_keepalive()
+        assert ws._keepalive_sent_at is not None
+        ws._keepalive_sent_at -= ws.keepalive_interval
+        await ws._async_send_keepalive()
+        ws._process_message(_text_message("KeepAlive"))
+
+        rtt_callback.assert_called_once()
+        assert rtt_callback.call_args[0][0] < ws.keepalive_interval * 1000
+
+    def test_unsolicited_keepalive_ignored(self) -> None:
+        """Test server KeepAlives without an outstanding request are ignored."""
+        ws, _ = _websocket()
+        rtt_callback = MagicMock()
+        ws.set_rtt_callback(rtt_callback)
+
+        ws._process_message(_text_message("KeepAlive"))
+
+        rtt_callback.assert_not_called()
+
+    def test_keepalive_not_dispatched(self) -> None:
+        """Test keepalive traffic is not passed to the message callback."""
+        ws, _ = _websocket()
+        message_callback = MagicMock()
+        ws.set_message_callback(message_callback)
+
+        ws._process_message(_text_message("KeepAlive"))
+        ws._process_message(_text_message("ForceKeepAlive", 60))
+
+        message_callback.assert_not_called()
+
+    def test_force_keepalive_shortens_interval(self) -> None:
+        """Test the server timeout caps the KeepAlive interval."""
+        ws, _ = _websocket(liveness_timeout=120.0)
+
+        ws._process_message(_text_message("ForceKeepAlive", 30))
+
+        assert ws.keepalive_interval == 15.0
+
+    @pytest.mark.asyncio
+    async def test_force_keepalive_reset_on_connect(self) -> None:
+        """Test a server timeout from a previous connection does not carry over."""
+        ws, mock_ws = _websocket(liveness_timeout=120.0)
+        ws._process_message(_text_message("ForceKeepAlive", 30))
+        ws._session.ws_connect = AsyncMock(return_value=mock_ws)
+
+        await ws.async_connect()
+
+        assert ws.keepalive_interval == 120.0 / KEEPALIVES_PER_LIVENESS_TIMEOUT
+
+    def test_force_keepalive_invalid_data(self) -> None:
+        """Test malformed ForceKeepAlive data is ignored."""
+        ws, _ = _websocket(liveness_timeout=60.0)
+
+        ws._process_message(_text_message("ForceKeepAlive", "soon"))
+
+        assert ws.keepalive_interval == 60.0 / KEEPALIVES_PER_LIVENESS_TIMEOUT
+
+    def test_any_message_refreshes_liveness(self) -> None:
+        """Test every received message counts as a sign of life."""
+        ws, _ = _websocket()
+        ws._last_message_at = 0.0
+
+        ws._process_message(_text_message("Sessions", []))
+
+        assert ws._last_message_at is not None
+        assert ws._last_message_at > 0.0
+
+
+class TestLivenessDeadline:
+    """Tests for the keepalive loop and liveness deadline."""
+
+    @pytest.mark.asyncio
+    async def test_sends_keepalive_periodically(self) -> None:
+        """Test KeepAlive messages are sent while the connection is alive."""
+        ws, mock_ws = _websocket(liveness_timeout=0.3)
+
+        task = asyncio.create_task(ws._async_keepalive_loop())
+        await asyncio.sleep(0.15)
+        # Keep the connection alive
+        ws._process_message(_text_message("KeepAlive"))
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert mock_ws.send_str.await_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_missed_deadline_closes_connection(self) -> None:
+        """Test a silent connection is closed once the deadline passes."""
+        ws, mock_ws = _websocket(liveness_timeout=0.1)
+        liveness_callback = MagicMock()
+        ws.set_liveness_callback(liveness_callback)
+
+        await asyncio.wait_for(ws._async_keepalive_loop(), timeout=1.0)
+
+        assert ws.liveness_expired is True
+        liveness_callback.assert_called_once()
+        mock_ws.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_receive_loop_stops_keepalive_task(self) -> None:
+        """Test the keepalive task ends with the receive loop."""
+        ws, mock_ws = _websocket()
+        messages = iter([_text_message("Sessions", []), MagicMock(type=aiohttp.WSMsgType.CLOSED)])
+
+        async def _next(self: Any) -> MagicMock:
+            try:
+                return next(messages)
+            except StopIteration:
+                raise StopAsyncIteration from None
+
+        mock_ws.__aiter__ = lambda self: self
+        mock_ws.__anext__ = _next
+        tasks_before = asyncio.all_tasks()
+
+        await ws._async_receive_loop()
+
+        assert asyncio.all_tasks() - tasks_before == set()
+        assert ws.liveness_expired is False
+
+    @pytest.mark.asyncio
+    async def test_connect_resets_liveness(self) -> None:
+        """Test a new connection clears the expired flag."""
+        session = MagicMock()
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        session.ws_connect = AsyncMock(return_value=mock_ws)
+        ws = EmbyWebSocket(
+            host="emby.local",
+            port=8096,
+            api_key="test-key",
+            ssl=False,
+            device_id="test-device",
+            session=session,
+        )
+        ws._liveness_expired = True
+
+        await ws.async_connect()
+
+        assert ws.liveness_expired is False
+
+
+class TestLivenessMetrics:
+    """Tests for RTT and liveness metrics."""
+
+    def test_rtt_histogram_in_stats(self) -> None:
+        """Test RTT samples appear in WebSocketStats.to_dict()."""
+        collector = MetricsCollector()
+        collector.record_websocket_rtt(12.0)
+        collector.record_websocket_rtt(80.0)
+
+        result = collector.get_websocket_stats().to_dict()
+
+        assert result["rtt"]["count"] == 2  # type: ignore[index]
+        assert result["rtt"]["max_ms"] == 80.0  # type: ignore[index]
+
+    def test_liveness_timeouts_counted(self) -> None:
+        """Test liveness timeouts are counted."""
+        collector = MetricsCollector()
+        collector.record_websocket_liveness_timeout()
+
+        assert collector.get_websocket_stats().to_dict()["liveness_timeouts"] == 1
+
+    def test_defaults(self) -> None:
+        """Test a fresh WebSocketStats has an empty RTT histogram."""
+        stats = WebSocketStats()
+
+        assert stats.liveness_timeouts == 0
+        assert stats.rtt.count == 0
+
+
+class TestCoordinatorLiveness:
+    """Tests for the coordinator's reaction to a dead connection."""
+
+    def test_liveness_lost_refreshes_immediately(self) -> None:
+        """Test a missed deadline records metrics and refreshes right away."""
+        hass = create_mock_hass()
+        coordinator = create_session_coordinator(hass)
+
+        coordinator._handle_websocket_liveness_lost()
+
+        assert coordinator.client.metrics.get_websocket_stats().liveness_timeouts == 1
+        hass.async_create_task.assert_called_once()
@@ -0,0 +1,275 @@
+"""Tests for WebSocket traffic recording and replay."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.embymedia.const import CONF_WEBSOCKET_RECORD
+from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+from custom_components.embymedia.recorder import (
+    RecordedFrame,
+    WebSocketRecorder,
+    async_replay,
+    load_recording,
+)
+from custom_components.embymedia.websocket import EmbyWebSocket
+
+from .conftest import create_mock_hass, create_session_coordinator
+
+REPLAY_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "replay_websocket.py"
+
+
+def _load_replay_script() -> ModuleType:
+    """Import scripts/replay_websocket.py as a module."""
+    spec = importlib.util.spec_from_file_location("replay_websocket", REPLAY_SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _frame(message_type: str, data: Any = None) -> str:
+    """Build a raw text frame."""
+    return json.dumps({"MessageType": message_type, "Data": data})
+
+
+def _session(session_id: str, position_ticks: int) -> dict[str, Any]:
+    """Build a minimal session payload."""
+    return {
+        "Id": session_id,
+        "DeviceId": f"device-{session_id}",
+        "DeviceName": "TV",
+        "Client": "Emby Theater",
+        "SupportsRemoteControl": True,
+        "PlayState": {"PositionTicks": position_ticks},
+    }
+
+
+class TestWebSocketRecorder:
+    """Tests for buffering and writing frames."""
+
+    def test_offsets_relative_to_first_frame(self, tmp_path: Path) -> None:
+        """Test frame offsets start at zero."""
+        recorder = WebSocketRecorder(tmp_path / "rec.jsonl.gz")
+
+        recorder.record(_frame("Sessions", []), 100.0)
+        recorder.record(_frame("Sessions", []), 101.5)
+
+        assert [frame.offset for frame in recorder.take_pending()] == [0.0, 1.5]
+        assert recorder.pending == 0
+
+    def test_flush_callback_when_buffer_full(self, tmp_path: Path) -> None:
+        """Test the flush callback fires once enough frames are pending."""
+        recorder = WebSocketRecorder(tmp_path / "rec.jsonl.gz", flush_frames=2)
+        callback = MagicMock()
+        recorder.set_flush_callback(callback)
+
+        recorder.record(_frame("Sessions"), 1.0)
+        callback.assert_not_called()
+        recorder.record(_frame("Sessions"), 2.0)
+        callback.assert_called_once()
+
+    def test_stops_at_max_frames(self, tmp_path: Path) -> None:
+        """Test recording stops once the frame limit is reached."""
+        recorder = WebSocketRecorder(tmp_path / "rec.jsonl.gz", max_frames=2)
+
+        for second in range(5):
+            recorder.record(_frame("Sessions"), float(second))
+
+        assert recorder.frames_recorded == 2
+        assert recorder.pending == 2
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test frames written in several batches load back in order."""
+        path = tmp_path / "rec.jsonl.gz"
+        recorder = WebSocketRecorder(path)
+        recorder.record(_frame("Sessions", []), 10.0)
+        recorder.write(recorder.take_pending())
+        recorder.record("{not json", 10.25)
+        recorder.record(_frame("LibraryChanged", {}), 10.5)
+        recorder.write(recorder.take_pending())
+
+        assert load_recording(path) == [
+            RecordedFrame(0.0, _frame("Sessions", [])),
+            RecordedFrame(0.25, "{not json"),
+            RecordedFrame(0.5, _frame("LibraryChanged", {})),
+        ]
+
+    def test_load_rejects_unknown_format(self, tmp_path: Path) -> None:
+        """Test files without a supported header are rejected."""
+        import gzip
+
+        path = tmp_path / "rec.jsonl.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write('{"version": 99}\n')
+
+        with pytest.raises(ValueError):
+            load_recording(path)
+
+
+class TestWebSocketRecording:
+    """Tests for EmbyWebSocket feeding the recorder."""
+
+    def test_text_frames_recorded(self, tmp_path: Path) -> None:
+        """Test every text frame is recorded, including keepalives."""
+        ws = EmbyWebSocket(
+            host="emby.local",
+            port=8096,
+            api_key="test-key",
+            ssl=False,
+            device_id="test-device",
+            session=MagicMock(),
+        )
+        recorder = WebSocketRecorder(tmp_path / "rec.jsonl.gz")
+        ws.set_recorder(recorder)
+
+        for raw in (_frame("Sessions", []), _frame("KeepAlive"), "{bad"):
+            ws._process_message(MagicMock(type=aiohttp.WSMsgType.TEXT, data=raw))
+
+        assert [frame.raw for frame in recorder.take_pending()] == [
+            _frame("Sessions", []),
+            _frame("KeepAlive"),
+            "{bad",
+        ]
+
+
+class TestReplay:
+    """Tests for the replay driver."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_and_stats(self) -> None:
+        """Test frames are dispatched like the live receive path."""
+        frames = [
+            RecordedFrame(0.0, _frame("Sessions", [])),
+            RecordedFrame(0.1, _frame("KeepAlive")),
+            RecordedFrame(0.2, "{bad"),
+            RecordedFrame(0.3, _frame("LibraryChanged", {"ItemsAdded": ["1"]})),
+        ]
+        handler = MagicMock()
+
+        stats = await async_replay(frames, handler)
+
+        assert [call.args[0] for call in handler.call_args_list] == [
+            "Sessions",
+            "LibraryChanged",
+        ]
+        assert stats.frames == 4
+        assert stats.events == 2
+        assert stats.skipped == 2
+        assert stats.handler_time.count == 2
+        assert stats.to_dict()["per_type"] == {"LibraryChanged": 1, "Sessions": 1}
+
+    @pytest.mark.asyncio
+    async def test_speed_scales_duration(self) -> None:
+        """Test accelerated replay honours the recorded timing."""
+        frames = [
+            RecordedFrame(0.0, _frame("Sessions", [])),
+            RecordedFrame(1.0, _frame("Sessions", [])),
+        ]
+
+        stats = await async_replay(frames, MagicMock(), speed=20.0)
+
+        assert stats.wall_seconds >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_replay_into_coordinator_counts_state_writes(self, hass: HomeAssistant) -> None:
+        """Test replaying into the coordinator reports listener updates."""
+        coordinator = create_session_coordinator(hass)
+        updates: list[None] = []
+        remove = coordinator.async_add_listener(lambda: updates.append(None))
+        frames = [
+            RecordedFrame(0.0, _frame("Sessions", [_session("s1", 0)])),
+            RecordedFrame(1.5, _frame("Sessions", [_session("s1", 0)])),
+            RecordedFrame(3.0, _frame("Sessions", [_session("s1", 30_000_000)])),
+        ]
+
+        stats = await async_replay(
+            frames,
+            coordinator._handle_websocket_message,
+            state_writes=lambda: len(updates),
+        )
+        remove()
+
+        assert stats.events == 3
+        assert stats.state_writes == len(updates)
+        assert stats.state_writes >= 1
+
+    @pytest.mark.asyncio
+    async def test_replay_script_counts_debounced_refreshes(self) -> None:
+        """Test the replay script debounces refreshes like the integration does."""
+        script = _load_replay_script()
+        coordinator, tasks = script._build_coordinator()
+
+        for _ in range(3):
+            coordinator._trigger_debounced_refresh()
+            await asyncio.sleep(0)
+        refreshes = script._finish_refreshes(coordinator)
+        await asyncio.sleep(0)
+
+        assert tasks[0] == 1
+        assert refreshes["sessions"] == {
+            "triggers": 3,
+            "leading": 1,
+            "trailing": 0,
+            "suppressed": 2,
+            "pending": True,
+        }
+        assert refreshes["library"]["triggers"] == 0
+        assert not coordinator._session_refresh.pending
+
+
+class TestCoordinatorRecording:
+    """Tests for the websocket_record option."""
+
+    def _coordinator(self, options: dict[str, object]) -> EmbyDataUpdateCoordinator:
+        """Create a coordinator with the given options."""
+        hass = create_mock_hass()
+        hass.config.path = MagicMock(side_effect=lambda name: f"/config/{name}")
+        hass.async_add_executor_job = AsyncMock()
+        coordinator = create_session_coordinator(hass, options)
+        coordinator.client.host = "emby.local"
+        coordinator.client.port = 8096
+        coordinator.client.api_key = "test-key"
+        coordinator.client.ssl = False
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_recorder_attached_when_enabled(self) -> None:
+        """Test the option attaches a recorder and shutdown writes the rest."""
+        coordinator = self._coordinator({CONF_WEBSOCKET_RECORD: True})
+        session = MagicMock()
+        session.ws_connect = AsyncMock(side_effect=aiohttp.ClientError("refused"))
+
+        await coordinator.async_setup_websocket(session)
+
+        recorder = coordinator._websocket_recorder
+        assert recorder is not None
+        assert str(recorder.path).startswith("/config/embymedia_websocket_server-123_")
+        assert coordinator.websocket is not None
+        assert coordinator.websocket._recorder is recorder
+
+        await coordinator.async_shutdown_websocket()
+
+        coordinator.hass.async_add_executor_job.assert_awaited_once()  # type: ignore[attr-defined]
+        assert coordinator._websocket_recorder is None
+
+    @pytest.mark.asyncio
+    async def test_no_recorder_by_default(self) -> None:
+        """Test nothing is recorded unless the option is enabled."""
+        coordinator = self._coordinator({})
+        session = MagicMock()
+        session.ws_connect = AsyncMock(side_effect=aiohttp.ClientError("refused"))
+
+        await coordinator.async_setup_websocket(session)
+
+        assert coordinator._websocket_recorder is None
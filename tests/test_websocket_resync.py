@@ -0,0 +1,183 @@
+"""Tests for state resynchronization after a WebSocket reconnect."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.embymedia.const import (
+    DEFAULT_WEBSOCKET_INTERVAL,
+    WEBSOCKET_RESYNC_GAP_THRESHOLD,
+)
+from custom_components.embymedia.coordinator import EmbyDataUpdateCoordinator
+
+from .conftest import create_session_coordinator
+
+
+@pytest.fixture
+def coordinator(mock_hass: MagicMock) -> EmbyDataUpdateCoordinator:
+    """Create a coordinator with a connected mock WebSocket and cached coordinators."""
+    coordinator = create_session_coordinator(mock_hass, websocket_connected=True)
+    coordinator.config_entry.runtime_data.discovery_coordinators = {"user-1": MagicMock()}
+    coordinator.config_entry.runtime_data.library_coordinator = MagicMock()
+    return coordinator
+
+
+class TestReconnectDetection:
+    """Tests for detecting a reconnect and measuring the gap."""
+
+    def test_initial_connect_does_not_resync(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Test the first connection does not schedule a resync."""
+        coordinator._handle_websocket_connection(True)
+
+        mock_hass.async_create_task.assert_not_called()
+
+    def test_reconnect_schedules_resync_with_gap(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test reconnecting after a disconnect resyncs with the gap duration."""
+        coordinator._handle_websocket_connection(False)
+        assert coordinator._websocket_disconnected_at is not None
+        coordinator._websocket_disconnected_at -= 5
+
+        with patch.object(
+            coordinator, "_async_resync_after_reconnect", new=MagicMock()
+        ) as mock_resync:
+            coordinator._handle_websocket_connection(True)
+
+        gap_seconds = mock_resync.call_args[0][0]
+        assert gap_seconds >= 5
+        assert coordinator._websocket_disconnected_at is None
+
+    def test_repeated_disconnect_keeps_first_timestamp(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test the gap is measured from the first disconnect."""
+        coordinator._handle_websocket_connection(False)
+        first = coordinator._websocket_disconnected_at
+
+        coordinator._handle_websocket_connection(False)
+
+        assert coordinator._websocket_disconnected_at == first
+
+
+class TestResyncAfterReconnect:
+    """Tests for the resync stage."""
+
+    @pytest.mark.asyncio
+    async def test_resubscribes_and_refreshes(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Test resync resubscribes, restarts receiving and refreshes once."""
+        with patch.object(coordinator, "async_request_refresh", new=AsyncMock()) as refresh:
+            await coordinator._async_resync_after_reconnect(1.0)
+
+        coordinator._websocket.async_subscribe_sessions.assert_awaited_once_with(  # type: ignore[union-attr]
+            interval_ms=DEFAULT_WEBSOCKET_INTERVAL
+        )
+        refresh.assert_awaited_once()
+        # Receive loop restarted
+        mock_hass.async_create_task.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_short_gap_keeps_caches(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test caches survive a short gap."""
+        with patch.object(coordinator, "async_request_refresh", new=AsyncMock()):
+            await coordinator._async_resync_after_reconnect(WEBSOCKET_RESYNC_GAP_THRESHOLD - 1)
+
+        coordinator.client.clear_browse_cache.assert_not_called()
+        discovery = coordinator.config_entry.runtime_data.discovery_coordinators["user-1"]
+        discovery.on_library_changed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_long_gap_invalidates_caches(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Test caches are invalidated after a long gap."""
+        with patch.object(coordinator, "async_request_refresh", new=AsyncMock()):
+            await coordinator._async_resync_after_reconnect(WEBSOCKET_RESYNC_GAP_THRESHOLD + 1)
+
+        coordinator.client.clear_browse_cache.assert_called_once()
+        discovery = coordinator.config_entry.runtime_data.discovery_coordinators["user-1"]
+        discovery.on_library_changed.assert_called_once()
+        # Receive loop plus library coordinator refresh
+        assert mock_hass.async_create_task.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_running_receive_loop_not_restarted(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Test a live receive task is reused."""
+        receive_task = MagicMock()
+        receive_task.done.return_value = False
+        coordinator._websocket_receive_task = receive_task
+
+        with patch.object(coordinator, "async_request_refresh", new=AsyncMock()):
+            await coordinator._async_resync_after_reconnect(1.0)
+
+        mock_hass.async_create_task.assert_not_called()
+        assert coordinator._websocket_receive_task is receive_task
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_failure_aborts(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test resync stops if resubscribing fails."""
+        coordinator._websocket.async_subscribe_sessions = AsyncMock(  # type: ignore[union-attr]
+            side_effect=RuntimeError("WebSocket is not connected")
+        )
+
+        with patch.object(coordinator, "async_request_refresh", new=AsyncMock()) as refresh:
+            await coordinator._async_resync_after_reconnect(1.0)
+
+        refresh.assert_not_awaited()
+        assert coordinator.client.metrics.get_websocket_stats().resync_count == 0
+
+    @pytest.mark.asyncio
+    async def test_disconnected_websocket_skipped(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test nothing happens if the WebSocket dropped again."""
+        coordinator._websocket.connected = False  # type: ignore[union-attr]
+
+        await coordinator._async_resync_after_reconnect(1.0)
+
+        coordinator._websocket.async_subscribe_sessions.assert_not_awaited()  # type: ignore[union-attr]
+
+
+class TestResyncMetrics:
+    """Tests for gap metrics."""
+
+    @pytest.mark.asyncio
+    async def test_gap_recorded(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+    ) -> None:
+        """Test resync records gap duration and invalidations."""
+        with patch.object(coordinator, "async_request_refresh", new=AsyncMock()):
+            await coordinator._async_resync_after_reconnect(10.0)
+            await coordinator._async_resync_after_reconnect(WEBSOCKET_RESYNC_GAP_THRESHOLD + 30)
+
+        result = coordinator.client.metrics.get_websocket_stats().to_dict()
+        assert result["resync_count"] == 2
+        assert result["gap_invalidations"] == 1
+        assert result["last_gap_seconds"] == WEBSOCKET_RESYNC_GAP_THRESHOLD + 30
+        assert result["max_gap_seconds"] == WEBSOCKET_RESYNC_GAP_THRESHOLD + 30